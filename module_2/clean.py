@@ -7,37 +7,49 @@ def load_data(filename: str = "applicant_data.json") -> list:
     with open(filename, "r", encoding="utf-8") as f:
         return json.load(f)
 
-# standardize formatting
-def clean_data(data: list) -> list:
-    cleaned = []
-    
+# Patterns compiled once instead of on every field
+TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
+PLACEHOLDERS = {"n/a", "na", "none", "-", "—"}
+
+# standardize one string field
+def clean_string(value: str) -> str:
+    # Only run the regexes when there is markup or whitespace to collapse
+    if "<" in value or "  " in value or not value.isprintable():
+        # Remove HTML tags
+        value = TAG_RE.sub("", value)
+
+        # Replace multiple spaces, tabs, or line breaks with a single space
+        value = WHITESPACE_RE.sub(" ", value)
+    value = value.strip()
+
+    # Replace placeholder junk values with empty string
+    if len(value) <= 4 and value.lower() in PLACEHOLDERS:
+        return ""
+    return value
+
+# standardize formatting one row at a time
+def iter_clean(rows):
     # Go through each dictionary
-    for row in data:
+    for row in rows:
         clean_row = {}
         # Go through each key value pair
         for key, value in row.items():
             if value is None:
                 clean_value = ""
             elif isinstance(value, str):
-                # Remove HTML tags
-                clean_value = re.sub(r"<[^>]+>", "", value)
-
-                 # Replace multiple spaces, tabs, or line breaks with a single space
-                clean_value = re.sub(r"\s+", " ", clean_value).strip()
-
-                # Replace placeholder junk values with empty string
-                if clean_value.lower() in {"n/a", "na", "none", "-", "—"}:
-                    clean_value = ""
+                clean_value = clean_string(value)
             else:
                 clean_value = value
 
             # Save cleaned value back under the same key
             clean_row[key] = clean_value
 
-        # Add the cleaned record to output list
-        cleaned.append(clean_row)
+        yield clean_row
 
-    return cleaned
+# standardize formatting
+def clean_data(data: list) -> list:
+    return list(iter_clean(data))
 
 # Save cleaned applicant data back to a JSON file.
 def save_data(data: list, filename: str = "cleaned_applicant_data.json") -> None:
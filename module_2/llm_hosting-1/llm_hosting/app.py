@@ -3,16 +3,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import multiprocessing
 import os
 import re
+import sqlite3
 import sys
-import difflib
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
 
 from flask import Flask, jsonify, request
 from huggingface_hub import hf_hub_download
-from llama_cpp import Llama  # CPU-only by default if N_GPU_LAYERS=0
+from llama_cpp import Llama, llama_token_get_text  # CPU-only by default if N_GPU_LAYERS=0
+from llama_cpp.llama_chat_format import Jinja2ChatFormatter
+
+from canon_index import CanonIndex
 
 app = Flask(__name__)
 
@@ -31,12 +39,21 @@ MODEL_FILE = os.getenv(
 N_THREADS = int(os.getenv("N_THREADS", str(os.cpu_count() or 2)))
 N_CTX = int(os.getenv("N_CTX", "2048"))
 N_GPU_LAYERS = int(os.getenv("N_GPU_LAYERS", "0"))  # 0 → CPU-only
+# Evaluate the system + few-shot prefix once and restore it for each row.
+PREFIX_CACHE = os.getenv("LLM_PREFIX_CACHE", "1") != "0"
 
 CANON_UNIS_PATH = os.getenv("CANON_UNIS_PATH", "canon_universities.txt")
 CANON_PROGS_PATH = os.getenv("CANON_PROGS_PATH", "canon_programs.txt")
 
+# Persistent result cache shared by /standardize and the CLI
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite3")
+LLM_CACHE_MAX_ROWS = int(os.getenv("LLM_CACHE_MAX_ROWS", "200000"))
+# Cache hits whose last-used time is held in memory before one batched write.
+LLM_CACHE_TOUCH_BATCH = 256
+
 # Precompiled, non-greedy JSON object matcher to tolerate chatter around JSON
 JSON_OBJ_RE = re.compile(r"\{.*?\}", re.DOTALL)
+WHITESPACE_RE = re.compile(r"\s+")
 
 # ---------------- Canonical lists + abbrev maps ----------------
 def _read_lines(path: str) -> List[str]:
@@ -50,6 +67,9 @@ def _read_lines(path: str) -> List[str]:
 
 CANON_UNIS = _read_lines(CANON_UNIS_PATH)
 CANON_PROGS = _read_lines(CANON_PROGS_PATH)
+# Built once: exact lookups hit a hash set, fuzzy ones a prefiltered index.
+CANON_UNI_INDEX = CanonIndex(CANON_UNIS)
+CANON_PROG_INDEX = CanonIndex(CANON_PROGS)
 
 ABBREV_UNI: Dict[str, str] = {
     r"(?i)^mcg(\.|ill)?$": "McGill University",
@@ -112,16 +132,132 @@ FEW_SHOTS: List[Tuple[Dict[str, str], Dict[str, str]]] = [
     ),
 ]
 
-_LLM: Llama | None = None
+# Cached answers are only valid for the model and prompt that produced them.
+PROMPT_VERSION = hashlib.sha256(
+    json.dumps([MODEL_REPO, MODEL_FILE, SYSTEM_PROMPT, FEW_SHOTS]).encode("utf-8")
+).hexdigest()[:16]
+
+
+def _cache_key(program_text: str) -> str:
+    """Collapse whitespace and case so trivially different inputs share a key."""
+    return WHITESPACE_RE.sub(" ", program_text or "").strip().casefold()
+
+
+class LLMCache:
+    """SQLite cache of standardized results keyed by program text and prompt version.
+
+    Entries carry a last-used timestamp; once the table exceeds ``max_rows``
+    the least recently used tenth is evicted. Hits only note the time in
+    memory; the timestamps are written with the next ``put``, every
+    ``LLM_CACHE_TOUCH_BATCH`` hits, or by ``stats``. The entry count is kept
+    as a running total and only recounted when eviction is due.
+    """
+
+    def __init__(self, path: str, max_rows: int = LLM_CACHE_MAX_ROWS) -> None:
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Flask may serve requests on several threads; the lock serializes access.
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " program_key TEXT NOT NULL,"
+            " prompt_version TEXT NOT NULL,"
+            " result TEXT NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " PRIMARY KEY (program_key, prompt_version))"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS llm_cache_last_used ON llm_cache (last_used)"
+        )
+        self._db.commit()
+        (self.size,) = self._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        self._touched: Dict[Tuple[str, str], float] = {}
+
+    def _write_touched(self) -> None:
+        """Write pending hit timestamps; the caller holds the lock and commits."""
+        self._db.executemany(
+            "UPDATE llm_cache SET last_used = ? WHERE program_key = ? AND prompt_version = ?",
+            [(used, key, version) for (key, version), used in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def get(self, program_text: str) -> Dict[str, str] | None:
+        """Return the cached result for ``program_text``, or None on a miss."""
+        key = _cache_key(program_text)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT result FROM llm_cache WHERE program_key = ? AND prompt_version = ?",
+                (key, PROMPT_VERSION),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[(key, PROMPT_VERSION)] = time.time()
+            if len(self._touched) >= LLM_CACHE_TOUCH_BATCH:
+                self._write_touched()
+                self._db.commit()
+        return json.loads(row[0])
+
+    def put(self, program_text: str, result: Dict[str, str]) -> None:
+        """Store ``result`` and evict the oldest entries when over ``max_rows``."""
+        key = _cache_key(program_text)
+        value = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            # Pending hits ride along in this commit and count for eviction.
+            self._write_touched()
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO llm_cache VALUES (?, ?, ?, ?)",
+                (key, PROMPT_VERSION, value, time.time()),
+            )
+            if cursor.rowcount:
+                self.size += 1
+            else:
+                self._db.execute(
+                    "UPDATE llm_cache SET result = ?, last_used = ?"
+                    " WHERE program_key = ? AND prompt_version = ?",
+                    (value, time.time(), key, PROMPT_VERSION),
+                )
+            if self.size > self.max_rows:
+                # Other processes may share the file, so evict from the true count.
+                (self.size,) = self._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+                if self.size > self.max_rows:
+                    cursor = self._db.execute(
+                        "DELETE FROM llm_cache WHERE rowid IN ("
+                        " SELECT rowid FROM llm_cache ORDER BY last_used LIMIT ?)",
+                        (self.size - self.max_rows + self.max_rows // 10,),
+                    )
+                    self.size -= cursor.rowcount
+            self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counts for this process and the current entry count."""
+        with self._lock:
+            if self._touched:
+                self._write_touched()
+                self._db.commit()
+            return {"hits": self.hits, "misses": self.misses, "size": self.size}
+
+
+_CACHE: LLMCache | None = None
+
+
+def _get_cache() -> LLMCache:
+    """Open the shared result cache on first use."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = LLMCache(LLM_CACHE_PATH)
+    return _CACHE
 
 
-def _load_llm() -> Llama:
-    """Download (or reuse) the GGUF file and initialize llama.cpp."""
-    global _LLM
-    if _LLM is not None:
-        return _LLM
+_LLM: Llama | None = None
 
-    model_path = hf_hub_download(
+
+def _model_path() -> str:
+    """Download the GGUF file once, or return the already downloaded copy."""
+    return hf_hub_download(
         repo_id=MODEL_REPO,
         filename=MODEL_FILE,
         local_dir="models",
@@ -129,8 +265,15 @@ def _load_llm() -> Llama:
         force_filename=MODEL_FILE,
     )
 
+
+def _load_llm() -> Llama:
+    """Download (or reuse) the GGUF file and initialize llama.cpp."""
+    global _LLM
+    if _LLM is not None:
+        return _LLM
+
     _LLM = Llama(
-        model_path=model_path,
+        model_path=_model_path(),
         n_ctx=N_CTX,
         n_threads=N_THREADS,
         n_gpu_layers=N_GPU_LAYERS,
@@ -164,12 +307,11 @@ def _split_fallback(text: str) -> Tuple[str, str]:
     return prog, uni
 
 
-def _best_match(name: str, candidates: List[str], cutoff: float = 0.86) -> str | None:
-    """Fuzzy match via difflib (lightweight, Replit-friendly)."""
-    if not name or not candidates:
+def _best_match(name: str, index: CanonIndex, cutoff: float = 0.86) -> str | None:
+    """Fuzzy match with difflib's scoring, via the prebuilt canonical index."""
+    if not name:
         return None
-    matches = difflib.get_close_matches(name, candidates, n=1, cutoff=cutoff)
-    return matches[0] if matches else None
+    return index.best_match(name, cutoff)
 
 
 def _post_normalize_program(prog: str) -> str:
@@ -177,9 +319,9 @@ def _post_normalize_program(prog: str) -> str:
     p = (prog or "").strip()
     p = COMMON_PROG_FIXES.get(p, p)
     p = p.title()
-    if p in CANON_PROGS:
+    if p in CANON_PROG_INDEX:
         return p
-    match = _best_match(p, CANON_PROGS, cutoff=0.84)
+    match = _best_match(p, CANON_PROG_INDEX, cutoff=0.84)
     return match or p
 
 
@@ -201,16 +343,78 @@ def _post_normalize_university(uni: str) -> str:
         u = re.sub(r"\bOf\b", "of", u.title())
 
     # Canonical or fuzzy map
-    if u in CANON_UNIS:
+    if u in CANON_UNI_INDEX:
         return u
-    match = _best_match(u, CANON_UNIS, cutoff=0.86)
+    match = _best_match(u, CANON_UNI_INDEX, cutoff=0.86)
     return match or u or "Unknown"
 
 
-def _call_llm(program_text: str) -> Dict[str, str]:
-    """Query the tiny LLM and return standardized fields."""
-    llm = _load_llm()
+def _rules_standardize(program_text: str) -> Dict[str, str] | None:
+    """Return the deterministic split when both halves are exact canonical names.
+
+    Clean inputs like "Computer Science, Stanford University" need no model;
+    anything that would need fuzzy matching or inference returns None.
+    """
+    prog, uni = _split_fallback(program_text)
+    prog = COMMON_PROG_FIXES.get(prog, prog)
+    uni = COMMON_UNI_FIXES.get(uni, uni)
+    if prog in CANON_PROG_INDEX and uni in CANON_UNI_INDEX:
+        return {"standardized_program": prog, "standardized_university": uni}
+    return None
 
+
+class TierStats:
+    """Distinct program strings answered, and seconds spent, by each tier."""
+
+    TIERS = ("rules", "cache", "llm")
+
+    def __init__(self) -> None:
+        self.counts = dict.fromkeys(self.TIERS, 0)
+        self.seconds = dict.fromkeys(self.TIERS, 0.0)
+
+    def record(self, tier: str, seconds: float) -> None:
+        """Count one lookup answered by ``tier``."""
+        self.counts[tier] += 1
+        self.seconds[tier] += seconds
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """Return per-tier counts with total and mean latency in milliseconds."""
+        return {
+            tier: {
+                "count": self.counts[tier],
+                "total_ms": round(self.seconds[tier] * 1000, 3),
+                "mean_ms": round(
+                    self.seconds[tier] * 1000 / self.counts[tier], 3
+                ) if self.counts[tier] else 0.0,
+            }
+            for tier in self.TIERS
+        }
+
+
+def _call_llm(program_text: str) -> Tuple[Dict[str, str], str]:
+    """Return (standardized fields, tier), querying the tiny LLM only on a cache miss."""
+    cache = _get_cache()
+    cached = cache.get(program_text)
+    if cached is not None:
+        return cached, "cache"
+    result = _run_llm(program_text)
+    cache.put(program_text, result)
+    return result, "llm"
+
+
+def _standardize(program_text: str, tiers: TierStats) -> Dict[str, str]:
+    """Try the rules tier first and fall back to the cached LLM when unsure."""
+    started = time.perf_counter()
+    result = _rules_standardize(program_text)
+    tier = "rules"
+    if result is None:
+        result, tier = _call_llm(program_text)
+    tiers.record(tier, time.perf_counter() - started)
+    return result
+
+
+def _messages(program_text: str) -> List[Dict[str, str]]:
+    """Build the chat: system prompt, few-shot exchanges, then this row."""
     messages = [{"role": "system", "content": SYSTEM_PROMPT}]
     for x_in, x_out in FEW_SHOTS:
         messages.append(
@@ -228,13 +432,149 @@ def _call_llm(program_text: str) -> Dict[str, str]:
             "content": json.dumps({"program": program_text}, ensure_ascii=False),
         }
     )
+    return messages
+
+
+def _chat_formatter(llm: Llama) -> Jinja2ChatFormatter | None:
+    """Rebuild the formatter create_chat_completion uses for the GGUF chat template."""
+    template = llm.metadata.get("tokenizer.chat_template")
+    if not template:
+        return None
+
+    def token_text(token: int) -> str:
+        return llama_token_get_text(llm.model, token).decode("utf-8") if token != -1 else ""
+
+    return Jinja2ChatFormatter(
+        template=template,
+        eos_token=token_text(llm.token_eos()),
+        bos_token=token_text(llm.token_bos()),
+    )
+
+
+def _prefix_summary(counters: List[Dict[str, float]]) -> Dict[str, float]:
+    """Combine raw prefix counters from one or more models into report fields."""
+    rows = sum(c["rows"] for c in counters)
+    return {
+        "prefix_tokens": max(c["prefix_tokens"] for c in counters),
+        # Each model process evaluates the prefix once.
+        "prefix_evals": len(counters),
+        "prefix_eval_s": round(sum(c["prefix_eval_s"] for c in counters), 3),
+        "rows": rows,
+        "row_prompt_tokens_mean": round(sum(c["row_tokens"] for c in counters) / (rows or 1), 1),
+        "row_completion_s_mean": round(sum(c["row_seconds"] for c in counters) / (rows or 1), 3),
+    }
 
+
+class PromptPrefix:
+    """llama.cpp state saved after evaluating the prompt every row shares.
+
+    The prefix is found by rendering two probe rows through the model's own
+    chat template, tokenizing them as create_chat_completion does, and keeping
+    their common leading tokens. Restoring the snapshot before a row lets
+    llama.cpp's prefix match skip those tokens, so prompt evaluation only
+    covers the row's own tokens.
+    """
+
+    def __init__(self, llm: Llama, formatter: Jinja2ChatFormatter) -> None:
+        runs = []
+        for probe in ("a", "b"):
+            formatted = formatter(messages=_messages(probe))
+            runs.append(
+                llm.tokenize(
+                    formatted.prompt.encode("utf-8"),
+                    add_bos=not formatted.added_special,
+                    special=True,
+                )
+            )
+        shared = 0
+        for first, second in zip(*runs):
+            if first != second:
+                break
+            shared += 1
+        self.tokens = runs[0][:shared]
+
+        llm.reset()
+        started = time.perf_counter()
+        llm.eval(self.tokens)
+        self.eval_seconds = time.perf_counter() - started
+        self.state = llm.save_state()
+        self.rows = 0
+        self.row_tokens = 0
+        self.row_seconds = 0.0
+        print(
+            f"Prompt prefix: {len(self.tokens)} tokens evaluated once "
+            f"in {self.eval_seconds:.2f}s",
+            file=sys.stderr,
+        )
+
+    def restore(self, llm: Llama) -> None:
+        """Put the model back at the end of the shared prefix."""
+        llm.load_state(self.state)
+
+    def record(self, prompt_tokens: int, seconds: float) -> None:
+        """Count one row's own prompt tokens and its completion time."""
+        self.rows += 1
+        self.row_tokens += max(prompt_tokens - len(self.tokens), 0)
+        self.row_seconds += seconds
+
+    def counters(self) -> Dict[str, float]:
+        """Return the raw totals behind ``stats``, for merging across workers."""
+        return {
+            "prefix_tokens": len(self.tokens),
+            "prefix_eval_s": self.eval_seconds,
+            "rows": self.rows,
+            "row_tokens": self.row_tokens,
+            "row_seconds": self.row_seconds,
+        }
+
+    def stats(self) -> Dict[str, float]:
+        """Return prefix cost (paid once) next to the mean per-row cost."""
+        return _prefix_summary([self.counters()])
+
+
+_PREFIX: PromptPrefix | None = None
+_PREFIX_CHECKED = False
+
+
+def _get_prefix(llm: Llama) -> PromptPrefix | None:
+    """Build the shared-prefix snapshot on first use, unless disabled."""
+    global _PREFIX, _PREFIX_CHECKED
+    if not _PREFIX_CHECKED and PREFIX_CACHE:
+        _PREFIX_CHECKED = True
+        formatter = _chat_formatter(llm)
+        if formatter is None:
+            print("Prompt prefix: model has no chat template, prefix cache off", file=sys.stderr)
+        else:
+            _PREFIX = PromptPrefix(llm, formatter)
+    return _PREFIX
+
+
+def _prefix_counters() -> Dict[str, float] | None:
+    """Return this process's raw prefix counters, or None before the model has run."""
+    return _PREFIX.counters() if _PREFIX is not None else None
+
+
+def _prefix_stats() -> Dict[str, float]:
+    """Return prefix/per-row prompt costs, or {} before the model has run."""
+    return _PREFIX.stats() if _PREFIX is not None else {}
+
+
+def _run_llm(program_text: str) -> Dict[str, str]:
+    """Query the tiny LLM and return standardized fields."""
+    llm = _load_llm()
+    prefix = _get_prefix(llm)
+
+    started = time.perf_counter()
+    if prefix is not None:
+        prefix.restore(llm)
     out = llm.create_chat_completion(
-        messages=messages,
+        messages=_messages(program_text),
         temperature=0.0,
         max_tokens=128,
         top_p=1.0,
     )
+    if prefix is not None:
+        prefix.record(out["usage"]["prompt_tokens"], time.perf_counter() - started)
 
     text = (out["choices"][0]["message"]["content"] or "").strip()
     try:
@@ -262,6 +602,152 @@ def _normalize_input(payload: Any) -> List[Dict[str, Any]]:
     return []
 
 
+def _iter_standardized(
+    rows: List[Dict[str, Any]],
+    tiers: TierStats,
+) -> Iterator[Tuple[Dict[str, Any], bool]]:
+    """Yield (row, reused) in input order with the LLM fields filled in.
+
+    Rows are grouped by normalized program text, so each distinct string is
+    standardized once (and counted in ``tiers``) and its result is copied to
+    every later row sharing it.
+    """
+    results: Dict[str, Dict[str, str]] = {}
+    for row in rows:
+        program_text = (row or {}).get("program") or ""
+        key = _cache_key(program_text)
+        reused = key in results
+        if not reused:
+            results[key] = _standardize(program_text, tiers)
+        result = results[key]
+        row["llm-generated-program"] = result["standardized_program"]
+        row["llm-generated-university"] = result["standardized_university"]
+        yield row, reused
+
+
+def _init_worker(threads: int) -> None:
+    """Give each pool process its share of N_THREADS before it loads a model."""
+    global N_THREADS
+    N_THREADS = threads
+
+
+def _worker_run_llm(
+    program_text: str,
+) -> Tuple[Dict[str, str], int, float, Dict[str, float] | None]:
+    """Run the model in a pool process; return (result, pid, seconds, prefix counters)."""
+    started = time.perf_counter()
+    result = _run_llm(program_text)
+    return result, os.getpid(), time.perf_counter() - started, _prefix_counters()
+
+
+class LLMWorkerPool:
+    """Worker processes, each with its own model, for cache misses in the CLI.
+
+    N_THREADS is split evenly between the workers. Busy time is tracked per
+    worker so the report shows how evenly the rows were spread, and each
+    worker's latest prompt-prefix counters are kept for the combined summary.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.threads = max(1, N_THREADS // workers)
+        self.busy: Dict[int, float] = {}
+        self.tasks: Dict[int, int] = {}
+        self.prefix: Dict[int, Dict[str, float]] = {}
+        # Download in the parent so the workers never race on the same file.
+        _model_path()
+        self._executor = ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.threads,),
+        )
+        self.started = time.perf_counter()
+
+    def submit(self, program_text: str) -> Future:
+        """Queue one program string for the next free worker."""
+        return self._executor.submit(_worker_run_llm, program_text)
+
+    def collect(self, future: Future) -> Tuple[Dict[str, str], float]:
+        """Wait for ``future`` and return (result, seconds spent in the worker)."""
+        result, pid, seconds, prefix = future.result()
+        self.busy[pid] = self.busy.get(pid, 0.0) + seconds
+        self.tasks[pid] = self.tasks.get(pid, 0) + 1
+        if prefix is not None and prefix["rows"] >= self.prefix.get(pid, prefix)["rows"]:
+            # Counters are cumulative per worker; keep the furthest along, since
+            # futures are not necessarily collected in the order they finished.
+            self.prefix[pid] = prefix
+        return result, seconds
+
+    def prefix_stats(self) -> Dict[str, float]:
+        """Return prompt-prefix costs merged across workers, or {} if none ran one."""
+        return _prefix_summary(list(self.prefix.values())) if self.prefix else {}
+
+    def report(self, rows: int) -> str:
+        """Return rows/s and each worker's share of the wall-clock time spent busy."""
+        elapsed = time.perf_counter() - self.started
+        lines = [
+            f"{rows} rows in {elapsed:.1f}s ({rows / elapsed if elapsed else 0.0:.2f} rows/s), "
+            f"{self.workers} workers x {self.threads} threads"
+        ]
+        for number, pid in enumerate(sorted(self.busy), start=1):
+            lines.append(
+                f"  worker {number}: {self.tasks[pid]} strings, "
+                f"{self.busy[pid]:.1f}s busy ({100 * self.busy[pid] / elapsed:.0f}%)"
+            )
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown()
+
+
+def _iter_standardized_pooled(
+    rows: List[Dict[str, Any]],
+    tiers: TierStats,
+    pool: LLMWorkerPool,
+) -> Iterator[Tuple[Dict[str, Any], bool]]:
+    """Like ``_iter_standardized``, but cache misses run across ``pool``.
+
+    Every distinct string goes through the rules and cache tiers first and
+    misses are queued at once; rows are then yielded in input order as their
+    results arrive, so a single writer keeps the output ordered.
+    """
+    cache = _get_cache()
+    results: Dict[str, Any] = {}
+    for row in rows:
+        program_text = (row or {}).get("program") or ""
+        key = _cache_key(program_text)
+        if key in results:
+            continue
+        started = time.perf_counter()
+        result = _rules_standardize(program_text)
+        tier = "rules"
+        if result is None:
+            result, tier = cache.get(program_text), "cache"
+        if result is None:
+            results[key] = pool.submit(program_text)
+            continue
+        tiers.record(tier, time.perf_counter() - started)
+        results[key] = result
+
+    seen = set()
+    for row in rows:
+        program_text = (row or {}).get("program") or ""
+        key = _cache_key(program_text)
+        reused = key in seen
+        seen.add(key)
+        result = results[key]
+        if isinstance(result, Future):
+            result, seconds = pool.collect(result)
+            cache.put(program_text, result)
+            tiers.record("llm", seconds)
+            results[key] = result
+        row["llm-generated-program"] = result["standardized_program"]
+        row["llm-generated-university"] = result["standardized_university"]
+        yield row, reused
+
+
 @app.get("/")
 def health() -> Any:
     """Simple liveness check."""
@@ -275,14 +761,21 @@ def standardize() -> Any:
     rows = _normalize_input(payload)
 
     out: List[Dict[str, Any]] = []
-    for row in rows:
-        program_text = (row or {}).get("program") or ""
-        result = _call_llm(program_text)
-        row["llm-generated-program"] = result["standardized_program"]
-        row["llm-generated-university"] = result["standardized_university"]
+    deduplicated = 0
+    tiers = TierStats()
+    for row, reused in _iter_standardized(rows, tiers):
         out.append(row)
+        deduplicated += reused
 
-    return jsonify({"rows": out})
+    return jsonify(
+        {
+            "rows": out,
+            "deduplicated": deduplicated,
+            "tiers": tiers.as_dict(),
+            "cache": _get_cache().stats(),
+            "prompt_prefix": _prefix_stats(),
+        }
+    )
 
 
 def _cli_process_file(
@@ -290,8 +783,13 @@ def _cli_process_file(
     out_path: str | None,
     append: bool,
     to_stdout: bool,
+    workers: int = 1,
 ) -> None:
-    """Process a JSON file and write JSONL incrementally."""
+    """Process a JSON file and write JSONL incrementally.
+
+    With ``workers`` > 1, model calls run in that many processes and the
+    output is still written in input order.
+    """
     with open(in_path, "r", encoding="utf-8") as f:
         rows = _normalize_input(json.load(f))
 
@@ -303,19 +801,35 @@ def _cli_process_file(
 
     assert sink is not None  # for type-checkers
 
+    deduplicated = 0
+    tiers = TierStats()
+    pool = LLMWorkerPool(workers) if workers > 1 else None
+    standardized = (
+        _iter_standardized_pooled(rows, tiers, pool)
+        if pool is not None
+        else _iter_standardized(rows, tiers)
+    )
     try:
-        for row in rows:
-            program_text = (row or {}).get("program") or ""
-            result = _call_llm(program_text)
-            row["llm-generated-program"] = result["standardized_program"]
-            row["llm-generated-university"] = result["standardized_university"]
-
+        for row, reused in standardized:
+            deduplicated += reused
             json.dump(row, sink, ensure_ascii=False)
             sink.write("\n")
             sink.flush()
     finally:
         if sink is not sys.stdout:
             sink.close()
+        if pool is not None:
+            pool.close()
+    # stderr keeps the stats out of JSONL written to stdout. With a pool the
+    # model (and its prefix) lives in the workers, not in this process.
+    prefix_stats = pool.prefix_stats() if pool is not None else _prefix_stats()
+    print(
+        f"Deduplicated rows: {deduplicated}; tiers: {tiers.as_dict()}; "
+        f"LLM cache: {_get_cache().stats()}; prompt prefix: {prefix_stats}",
+        file=sys.stderr,
+    )
+    if pool is not None:
+        print(pool.report(len(rows)), file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -350,6 +864,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Write JSON Lines to stdout instead of a file.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Model processes for --file; N_THREADS is split between them.",
+    )
     args = parser.parse_args()
 
     if args.serve or args.file is None:
@@ -361,4 +881,5 @@ if __name__ == "__main__":
             out_path=args.out,
             append=bool(args.append),
             to_stdout=bool(args.stdout),
+            workers=max(1, args.workers),
         )
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Check CanonIndex against difflib and time both on noisy canonical names.
+
+Queries are every canonical university and program with a typo, a case
+change, a dropped word or an unrelated suffix applied, plus the names
+themselves, using the cutoffs app.py uses (0.86 and 0.84).
+
+Usage::
+
+    python bench_match.py [--seconds 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import random
+import time
+
+from canon_index import CanonIndex
+
+
+def _read_lines(path: str) -> list[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [ln.strip() for ln in f if ln.strip()]
+
+
+def _variants(name: str, rng: random.Random) -> list[str]:
+    chars = list(name)
+    drop = rng.randrange(len(chars))
+    swap = rng.randrange(max(len(chars) - 1, 1))
+    swapped = chars[:]
+    if len(swapped) > 1:
+        swapped[swap], swapped[swap + 1] = swapped[swap + 1], swapped[swap]
+    words = name.split()
+    return [
+        name,
+        "".join(chars[:drop] + chars[drop + 1:]),
+        "".join(swapped),
+        name.lower(),
+        " ".join(words[1:]) or name,
+        name + " Dept",
+    ]
+
+
+def _time(func, queries: list[str], cutoff: float, seconds: float) -> float:
+    calls, started = 0, time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for query in queries:
+            func(query, cutoff)
+        calls += 1
+    return calls * len(queries) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Refuse to time on any parity mismatch, then print lookups per second."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="Minimum time per run.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for label, path, cutoff in (
+        ("universities", "canon_universities.txt", 0.86),
+        ("programs", "canon_programs.txt", 0.84),
+    ):
+        names = _read_lines(path)
+        queries = [v for name in names for v in _variants(name, rng)]
+
+        def difflib_match(query, cut, names=names):
+            matches = difflib.get_close_matches(query, names, n=1, cutoff=cut)
+            return matches[0] if matches else None
+
+        index = CanonIndex(names)
+        mismatches = [q for q in queries if index.best_match(q, cutoff) != difflib_match(q, cutoff)]
+        if mismatches:
+            raise SystemExit(f"{label}: {len(mismatches)} mismatches, e.g. {mismatches[:3]}")
+
+        before = _time(difflib_match, queries, cutoff, args.seconds)
+        # Uncached: a fresh lookup per query, as on the first pass over a dataset.
+        indexed = _time(index._best_match, queries, cutoff, args.seconds)
+        cached = _time(index.best_match, queries, cutoff, args.seconds)
+        print(
+            f"{label:<12} {len(names):5d} names, {len(queries)} queries: "
+            f"difflib {before:8.0f}/s  index {indexed:8.0f}/s ({indexed / before:.1f}x)  "
+            f"cached {cached:10.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Prebuilt index that answers difflib close-match queries over a canonical list."""
+
+from __future__ import annotations
+
+import difflib
+import functools
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, List, Tuple
+
+
+def _token_ids(name: str, bits: Dict[Tuple[str, int], int]) -> List[int]:
+    """Return the bit of each (character, k-th occurrence) in ``name`` known to ``bits``."""
+    seen: Counter = Counter()
+    ids = []
+    for char in name:
+        seen[char] += 1
+        bit = bits.get((char, seen[char]))
+        if bit is not None:
+            ids.append(bit)
+    return ids
+
+
+def _ratio(matches: int, length: int) -> float:
+    """difflib's _calculate_ratio, so bounds round exactly as difflib's do."""
+    return 2.0 * matches / length if length else 1.0
+
+
+class CanonIndex:
+    """Canonical names with a hash set and per-length character-count bitmasks.
+
+    ``best_match`` returns exactly what
+    ``difflib.get_close_matches(name, names, n=1, cutoff=cutoff)`` would, at a
+    fraction of the cost:
+
+    - an exact hit in the hash set is the best possible match;
+    - ``real_quick_ratio`` depends only on the two lengths, so whole length
+      buckets outside the cutoff are skipped;
+    - ``quick_ratio`` counts the characters the two strings share as
+      multisets. Each name is a bitmask with one bit per (character, k-th
+      occurrence), so that count is ``(query & name).bit_count()``;
+    - only names passing both bounds run ``SequenceMatcher.ratio``.
+    """
+
+    def __init__(self, names: List[str], cache_size: int = 8192) -> None:
+        self.names = list(names)
+        self.name_set: FrozenSet[str] = frozenset(self.names)
+        self._bits: Dict[Tuple[str, int], int] = {}
+        for name in self.names:
+            seen: Counter = Counter()
+            for char in name:
+                seen[char] += 1
+                self._bits.setdefault((char, seen[char]), len(self._bits))
+        self._by_length: Dict[int, List[Tuple[int, str]]] = defaultdict(list)
+        for name in self.names:
+            mask = sum(1 << bit for bit in _token_ids(name, self._bits))
+            self._by_length[len(name)].append((mask, name))
+        # Normalized inputs repeat heavily, so remember recent answers.
+        self.best_match = functools.lru_cache(maxsize=cache_size)(self._best_match)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.name_set
+
+    def _best_match(self, name: str, cutoff: float) -> str | None:
+        if name in self.name_set:
+            return name
+        # Nothing shares a character with an empty query, so only "" matches it.
+        if not name or not self.names:
+            return None
+
+        size = len(name)
+        query = sum(1 << bit for bit in _token_ids(name, self._bits))
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(name)
+        best: Tuple[float, str] | None = None
+        for length, bucket in self._by_length.items():
+            total = length + size
+            if _ratio(min(length, size), total) < cutoff:
+                continue
+            # Fewest shared characters whose quick_ratio still reaches the cutoff.
+            need = next(m for m in range(total + 1) if _ratio(m, total) >= cutoff)
+            for mask, candidate in bucket:
+                if (query & mask).bit_count() < need:
+                    continue
+                matcher.set_seq1(candidate)
+                score = matcher.ratio()
+                # Same tie-break as difflib's nlargest over (score, name) pairs.
+                if score >= cutoff and (best is None or (score, candidate) > best):
+                    best = (score, candidate)
+        return best[1] if best else None
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import difflib
+import random
+from pathlib import Path
+
+import pytest
+
+from canon_index import CanonIndex
+
+
+# Same non-empty, stripped lines app.py indexes.
+CANON_UNIVERSITIES = [
+    line.strip()
+    for line in (Path(__file__).resolve().parents[1] / "canon_universities.txt")
+    .read_text(encoding="utf-8")
+    .splitlines()
+    if line.strip()
+]
+
+
+def _difflib_best(name: str, names: list[str], cutoff: float) -> str | None:
+    matches = difflib.get_close_matches(name, names, n=1, cutoff=cutoff)
+    return matches[0] if matches else None
+
+
+def test_best_match_breaks_ties_like_difflib():
+    # Both candidates score 0.75; difflib keeps the larger (score, name) pair.
+    names = ["abcd", "abce", "zzzz"]
+    index = CanonIndex(names)
+
+    assert difflib.SequenceMatcher(None, "abcd", "abcx").ratio() == 0.75
+    assert index.best_match("abcx", 0.7) == _difflib_best("abcx", names, 0.7) == "abce"
+    assert index.best_match("abcx", 0.7) == _difflib_best("abcx", list(reversed(names)), 0.7)
+
+
+@pytest.mark.parametrize("cutoff", [0.7499, 0.75, 0.7501])
+def test_best_match_cutoff_boundary_matches_difflib(cutoff):
+    # A score equal to the cutoff is kept; anything just above it is not.
+    names = ["abcd"]
+    assert CanonIndex(names).best_match("abce", cutoff) == _difflib_best("abce", names, cutoff)
+
+
+def test_best_match_empty_query_and_empty_index():
+    assert CanonIndex(CANON_UNIVERSITIES).best_match("", 0.5) is None
+    assert _difflib_best("", CANON_UNIVERSITIES, 0.5) is None
+    # An empty canonical entry is an exact hit for an empty query, as in difflib.
+    with_blank = CANON_UNIVERSITIES[:3] + [""]
+    assert CanonIndex(with_blank).best_match("", 0.5) == _difflib_best("", with_blank, 0.5) == ""
+    assert CanonIndex([]).best_match("Stanford University", 0.5) is None
+
+
+def test_best_match_memoizes_repeated_queries():
+    index = CanonIndex(CANON_UNIVERSITIES)
+    first = index.best_match("Stanfrod University", 0.86)
+    hits = index.best_match.cache_info().hits
+
+    assert index.best_match("Stanfrod University", 0.86) == first
+    assert index.best_match.cache_info().hits == hits + 1
+    assert first == _difflib_best("Stanfrod University", CANON_UNIVERSITIES, 0.86)
+
+
+@pytest.mark.parametrize("cutoff", [0.6, 0.86])
+def test_best_match_agrees_with_difflib_on_perturbed_canonical_names(cutoff):
+    # Typos, dropped and doubled characters, and case changes around real names.
+    rng = random.Random(23)
+    index = CanonIndex(CANON_UNIVERSITIES)
+    for _ in range(40):
+        chars = list(rng.choice(CANON_UNIVERSITIES))
+        for _ in range(rng.randint(0, 3)):
+            position = rng.randrange(len(chars))
+            edit = rng.randrange(4)
+            if edit == 0:
+                chars[position] = rng.choice("aeiou ")
+            elif edit == 1:
+                del chars[position]
+            elif edit == 2:
+                chars.insert(position, chars[position])
+            else:
+                chars[position] = chars[position].swapcase()
+        query = "".join(chars)
+        assert index.best_match(query, cutoff) == _difflib_best(query, CANON_UNIVERSITIES, cutoff)
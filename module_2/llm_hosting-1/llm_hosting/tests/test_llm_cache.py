@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import itertools
+import sqlite3
+
+import pytest
+
+import app
+
+
+RESULT = {"standardized_program": "Physics", "standardized_university": "McGill University"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Strictly increasing timestamps so last-used order is deterministic.
+    ticks = itertools.count(1)
+    monkeypatch.setattr(app.time, "time", lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return app.LLMCache(str(tmp_path / "cache.sqlite3"), max_rows=10)
+
+
+def _stored_last_used(cache: app.LLMCache, program_text: str) -> float:
+    # Read through a second connection, so only committed writes are visible.
+    with sqlite3.connect(cache._db.execute("PRAGMA database_list").fetchone()[2]) as other:
+        (used,) = other.execute(
+            "SELECT last_used FROM llm_cache WHERE program_key = ?",
+            (app._cache_key(program_text),),
+        ).fetchone()
+    return used
+
+
+def test_hits_and_misses_share_normalized_keys(cache):
+    cache.put("Physics,  McGill University", RESULT)
+
+    assert cache.get("physics, mcgill   university") == RESULT
+    assert cache.get("Chemistry, McGill University") is None
+    cache.put("PHYSICS, McGill University", {**RESULT, "standardized_program": "Physics (MSc)"})
+
+    assert cache.get("physics, mcgill university")["standardized_program"] == "Physics (MSc)"
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_entries_are_scoped_to_the_prompt_version(cache, monkeypatch):
+    cache.put("Physics, McGill", RESULT)
+    monkeypatch.setattr(app, "PROMPT_VERSION", "another-prompt")
+
+    assert cache.get("Physics, McGill") is None
+    cache.put("Physics, McGill", RESULT)
+    assert cache.stats() == {"hits": 0, "misses": 1, "size": 2}
+
+
+def test_eviction_drops_the_least_recently_used_tenth(cache, clock):
+    for number in range(10):
+        cache.put(f"program {number}", RESULT)
+    assert cache.get("program 0") == RESULT
+
+    # The eleventh row evicts two: the oldest untouched rows, not the one just read.
+    cache.put("program 10", RESULT)
+
+    assert cache.stats()["size"] == 9
+    assert cache.get("program 0") == RESULT
+    assert cache.get("program 1") is None
+    assert cache.get("program 2") is None
+    assert cache.get("program 3") == RESULT
+
+
+def test_hits_write_last_used_in_batches(cache, clock, monkeypatch):
+    monkeypatch.setattr(app, "LLM_CACHE_TOUCH_BATCH", 3)
+    for name in ("program a", "program b", "program c"):
+        cache.put(name, RESULT)
+    stored = _stored_last_used(cache, "program a")
+
+    cache.get("program a")
+    cache.get("program b")
+    cache.get("program a")
+    assert _stored_last_used(cache, "program a") == stored
+
+    # The third distinct hit fills the batch and writes all the stamps at once.
+    cache.get("program c")
+    assert _stored_last_used(cache, "program a") > stored
+
+
+def test_pending_hits_are_written_by_stats(cache, clock):
+    cache.put("program a", RESULT)
+    stored = _stored_last_used(cache, "program a")
+    cache.get("program a")
+    assert _stored_last_used(cache, "program a") == stored
+
+    cache.stats()
+    assert _stored_last_used(cache, "program a") > stored
+
+
+def test_put_keeps_a_running_count_instead_of_scanning(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    app.LLMCache(path).put("program a", RESULT)
+    cache = app.LLMCache(path, max_rows=3)
+    statements: list[str] = []
+    cache._db.set_trace_callback(statements.append)
+
+    cache.put("program b", RESULT)
+    cache.put("program b", RESULT)
+    cache.put("program c", RESULT)
+    assert cache.stats()["size"] == 3
+    assert not [sql for sql in statements if "COUNT(*)" in sql]
+
+    # Going over the limit recounts once, from the table, before evicting.
+    cache.put("program d", RESULT)
+    assert len([sql for sql in statements if "COUNT(*)" in sql]) == 1
+    assert cache.stats()["size"] == 3
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+
+import pytest
+
+import app
+
+
+def _model_answer(program_text: str) -> dict[str, str]:
+    return {"standardized_program": f"model:{program_text}", "standardized_university": "Unknown"}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = app.LLMCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(app, "_CACHE", cache)
+    return cache
+
+
+@pytest.fixture
+def model_calls(monkeypatch):
+    # Stands in for the llama.cpp completion; records every string it is asked about.
+    calls: list[str] = []
+
+    def fake_run_llm(program_text):
+        calls.append(program_text)
+        return _model_answer(program_text)
+
+    monkeypatch.setattr(app, "_run_llm", fake_run_llm)
+    return calls
+
+
+def _rows(*programs: str) -> list[dict]:
+    return [{"program": program, "row": number} for number, program in enumerate(programs)]
+
+
+def test_rules_tier_accepts_only_exact_canonical_pairs():
+    assert app._rules_standardize("Computer Science, Stanford University") == {
+        "standardized_program": "Computer Science",
+        "standardized_university": "Stanford University",
+    }
+    # Title-casing and the known fixes run before the exact lookup.
+    assert app._rules_standardize("info studies at mcgill university") == {
+        "standardized_program": "Information Studies",
+        "standardized_university": "McGill University",
+    }
+    # Anything that would need fuzzy matching or an abbreviation goes to the model.
+    assert app._rules_standardize("Compsci, Stanford University") is None
+    assert app._rules_standardize("Mathematics, Narnia College") is None
+    assert app._rules_standardize("") is None
+
+
+def test_call_llm_reports_the_tier_that_answered(cache, model_calls):
+    assert app._call_llm("Physics, Hogwarts") == (_model_answer("Physics, Hogwarts"), "llm")
+    assert app._call_llm("physics,  HOGWARTS") == (_model_answer("Physics, Hogwarts"), "cache")
+    assert model_calls == ["Physics, Hogwarts"]
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_iter_standardized_answers_each_distinct_string_once_in_order(cache, model_calls):
+    cache.put("Mathematics, Narnia College", _model_answer("cached"))
+    rows = _rows(
+        "Physics, Hogwarts",
+        "Computer Science, Stanford University",
+        "physics,   hogwarts",
+        "Mathematics, Narnia College",
+        "Physics, Hogwarts",
+        None,
+    )
+    tiers = app.TierStats()
+
+    out = list(app._iter_standardized(rows, tiers))
+
+    assert [row["row"] for row, _ in out] == [0, 1, 2, 3, 4, 5]
+    assert [reused for _, reused in out] == [False, False, True, False, True, False]
+    assert [row["llm-generated-program"] for row, _ in out] == [
+        "model:Physics, Hogwarts",
+        "Computer Science",
+        "model:Physics, Hogwarts",
+        "model:cached",
+        "model:Physics, Hogwarts",
+        "model:",
+    ]
+    assert model_calls == ["Physics, Hogwarts", ""]
+    assert {tier: stats["count"] for tier, stats in tiers.as_dict().items()} == {
+        "rules": 1, "cache": 1, "llm": 2,
+    }
+
+
+class _DrainingFuture(Future):
+    def __init__(self, executor: "_InlineExecutor") -> None:
+        super().__init__()
+        self._executor = executor
+
+    def result(self, timeout=None):
+        self._executor.drain()
+        return super().result(timeout)
+
+
+class _InlineExecutor:
+    """Single-process stand-in for the worker pool's ProcessPoolExecutor.
+
+    Tasks run only once a result is first waited on, and then newest first, so
+    the caller must have queued every miss up front and must restore the order.
+    """
+
+    def __init__(self, workers, **kwargs) -> None:
+        self.workers = workers
+        self.pending: list[tuple[_DrainingFuture, object, tuple]] = []
+        self.completed: list[str] = []
+        self.closed = False
+
+    def submit(self, fn, *args) -> Future:
+        future = _DrainingFuture(self)
+        self.pending.append((future, fn, args))
+        return future
+
+    def drain(self) -> None:
+        while self.pending:
+            future, fn, args = self.pending.pop()
+            future.set_result(fn(*args))
+            self.completed.append(args[0])
+
+    def shutdown(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch, model_calls):
+    monkeypatch.setattr(app, "ProcessPoolExecutor", _InlineExecutor)
+    monkeypatch.setattr(app, "_model_path", lambda: "model.gguf")
+    monkeypatch.setattr(app, "N_THREADS", 4)
+    served = []
+
+    def fake_worker_run_llm(program_text):
+        # Alternate between two worker pids, each reporting cumulative prefix counters.
+        pid = 100 + len(served) % 2
+        served.append(pid)
+        counters = {
+            "prefix_tokens": 50,
+            "prefix_eval_s": 1.0,
+            "rows": served.count(pid),
+            "row_tokens": 10 * served.count(pid),
+            "row_seconds": 0.5 * served.count(pid),
+        }
+        return app._run_llm(program_text), pid, 0.5, counters
+
+    monkeypatch.setattr(app, "_worker_run_llm", fake_worker_run_llm)
+    pool = app.LLMWorkerPool(2)
+    yield pool
+    pool.close()
+
+
+def test_pooled_rows_keep_input_order_and_fan_out_duplicates(cache, model_calls, pool):
+    cache.put("Mathematics, Narnia College", _model_answer("cached"))
+    rows = _rows(
+        "Physics, Hogwarts",
+        "Computer Science, Stanford University",
+        "Chemistry, Narnia",
+        "PHYSICS, HOGWARTS",
+        "Mathematics, Narnia College",
+        "Biology, Atlantis",
+        "chemistry,  narnia",
+    )
+    tiers = app.TierStats()
+
+    out = list(app._iter_standardized_pooled(rows, tiers, pool))
+
+    # All misses were queued before the first was collected, and ran newest first.
+    assert pool._executor.completed == [
+        "Biology, Atlantis", "Chemistry, Narnia", "Physics, Hogwarts",
+    ]
+    assert [row["row"] for row, _ in out] == [0, 1, 2, 3, 4, 5, 6]
+    assert [reused for _, reused in out] == [False, False, False, True, False, False, True]
+    assert [row["llm-generated-program"] for row, _ in out] == [
+        "model:Physics, Hogwarts",
+        "Computer Science",
+        "model:Chemistry, Narnia",
+        "model:Physics, Hogwarts",
+        "model:cached",
+        "model:Biology, Atlantis",
+        "model:Chemistry, Narnia",
+    ]
+    assert sorted(model_calls) == ["Biology, Atlantis", "Chemistry, Narnia", "Physics, Hogwarts"]
+    assert {tier: stats["count"] for tier, stats in tiers.as_dict().items()} == {
+        "rules": 1, "cache": 1, "llm": 3,
+    }
+    # Worker answers are written back to the shared cache by the parent.
+    assert cache.get("biology, atlantis") == _model_answer("Biology, Atlantis")
+
+
+def test_worker_pool_tracks_each_worker_and_merges_prefix_counters(pool):
+    futures = [pool.submit(text) for text in ("a", "b", "c")]
+    results = [pool.collect(future) for future in futures]
+
+    assert results == [(_model_answer(text), 0.5) for text in ("a", "b", "c")]
+    assert pool.threads == 2
+    # Tasks drain newest first: "c" on pid 100, "b" on pid 101, "a" on pid 100.
+    assert pool.tasks == {100: 2, 101: 1}
+    assert pool.busy == {100: 1.0, 101: 0.5}
+    assert pool.prefix_stats() == {
+        "prefix_tokens": 50,
+        "prefix_evals": 2,
+        "prefix_eval_s": 2.0,
+        "rows": 3,
+        "row_prompt_tokens_mean": 10.0,
+        "row_completion_s_mean": 0.5,
+    }
+    report = pool.report(3)
+    assert "2 workers x 2 threads" in report
+    assert "worker 1: 2 strings" in report and "worker 2: 1 strings" in report
+
+
+def test_worker_pool_without_prefix_counters_reports_none(pool, monkeypatch):
+    monkeypatch.setattr(
+        app, "_worker_run_llm", lambda text: (_model_answer(text), 7, 0.1, None)
+    )
+    pool.collect(pool.submit("a"))
+    assert pool.prefix_stats() == {}
+    pool.close()
+    assert pool._executor.closed
@@ -0,0 +1,90 @@
+"""Report rows cleaned per second by ``clean_data`` before and after precompiling.
+
+Rows are the recorded survey pages parsed once and repeated up to ``--rows``.
+The "before" column reruns the original per-field ``re.sub`` implementation;
+"parallel" runs ``iter_clean_parallel`` with ``--workers`` processes.
+
+Usage (from the module_6 root)::
+
+    python benchmarks/bench_clean.py [--rows 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import re
+import time
+
+from bench_common import add_source_paths, recorded_pages
+
+add_source_paths()
+
+# pylint: disable=wrong-import-position,import-error
+from app import data_cleaning, scrape_support
+
+
+def _clean_data_before(data):
+    # The implementation clean_data replaced, kept verbatim as the baseline.
+    cleaned = []
+    for row in data:
+        clean_row = {}
+        for key, value in row.items():
+            if value is None:
+                clean_value = ""
+            elif isinstance(value, str):
+                clean_value = re.sub(r"<[^>]+>", "", value)
+                clean_value = re.sub(r"\s+", " ", clean_value).strip()
+                if clean_value.lower() in {"n/a", "na", "none", "-", "â€”"}:
+                    clean_value = ""
+            else:
+                clean_value = value
+            clean_row[key] = clean_value
+        cleaned.append(clean_row)
+    return cleaned
+
+
+def _rows_per_second(func, rows) -> float:
+    started = time.perf_counter()
+    func(rows)
+    return len(rows) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Clean the same rows with both implementations and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows to clean.")
+    parser.add_argument(
+        "--workers", type=int, default=data_cleaning.CLEAN_WORKERS, help="Parallel cleaners."
+    )
+    args = parser.parse_args()
+
+    # Compare on legacy entry dicts, the shape the original cleaner accepted.
+    parsed = [
+        entry.to_dict() for html in recorded_pages() for entry in scrape_support.parse_page(html)
+    ]
+    rows = list(itertools.islice(itertools.cycle(parsed), args.rows))
+    # Refuse to report numbers if the fast path changes any output.
+    if data_cleaning.clean_data(rows) != _clean_data_before(rows):
+        raise SystemExit("clean_data output differs from the original implementation")
+
+    before = _rows_per_second(_clean_data_before, rows)
+    after = _rows_per_second(data_cleaning.clean_data, rows)
+    streamed = _rows_per_second(lambda data: sum(1 for _ in data_cleaning.iter_clean(data)), rows)
+    # Force the pool regardless of size so its startup cost shows in the number.
+    data_cleaning.PARALLEL_CLEAN_MIN_ROWS = 0
+    parallel = _rows_per_second(
+        lambda data: sum(1 for _ in data_cleaning.iter_clean_parallel(data, args.workers)), rows
+    )
+    print(f"{len(rows)} rows, {len(rows[0])} fields each")
+    print(f"before      {before:12.0f} rows/s")
+    print(f"clean_data  {after:12.0f} rows/s  ({after / before:.1f}x)")
+    print(f"iter_clean  {streamed:12.0f} rows/s  ({streamed / before:.1f}x)")
+    print(
+        f"parallel    {parallel:12.0f} rows/s  ({parallel / before:.1f}x, "
+        f"{args.workers} workers incl. pool startup)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Shared helpers for the module_6 benchmark scripts."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT_PATH / "tests" / "fixtures"
+
+
+def add_source_paths() -> None:
+    """Put the module_6 runtime packages on sys.path, mirroring pytest.ini."""
+    for path in (ROOT_PATH / "src", ROOT_PATH / "src" / "web", ROOT_PATH / "src" / "db"):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+
+def recorded_pages() -> list[str]:
+    """Return the recorded GradCafe survey pages used by tests and benchmarks."""
+    return [
+        path.read_text(encoding="utf-8")
+        for path in sorted(FIXTURE_DIR.glob("gradcafe_survey_page_*.html"))
+    ]
+
+
+def time_call(func: Callable[[], object], min_seconds: float = 1.0) -> tuple[int, float]:
+    """Call ``func`` repeatedly for at least ``min_seconds``; return (calls, elapsed)."""
+    calls = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - started
+    return calls, elapsed
@@ -0,0 +1,61 @@
+"""Compare date_added parsing with strptime against the memoized lookup parser.
+
+Dates are the ``date_added`` values of the recorded survey pages repeated up to
+``--rows``, so the distinct-value mix matches a real pull.
+
+Usage (from the module_6 root)::
+
+    python benchmarks/bench_dates.py [--rows 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+from datetime import datetime
+
+from bench_common import add_source_paths, recorded_pages, time_call
+
+add_source_paths()
+
+# pylint: disable=wrong-import-position,import-error
+from app import scrape_support
+from date_parsing import date_parse_stats, parse_month_day_year
+
+
+def _strptime_date(date_string):
+    if not date_string:
+        return None
+    try:
+        return datetime.strptime(date_string, "%B %d, %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def main() -> None:
+    """Parse the same date column both ways and print rows/s."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Dates to parse.")
+    args = parser.parse_args()
+
+    parsed = [entry for html in recorded_pages() for entry in scrape_support.parse_page(html)]
+    dates = list(itertools.islice(itertools.cycle(e.date_added for e in parsed), args.rows))
+    # Refuse to report numbers for a parser that disagrees with strptime.
+    if list(map(parse_month_day_year, dates)) != list(map(_strptime_date, dates)):
+        raise SystemExit("memoized parser output differs from strptime")
+
+    rates = {}
+    for name, func in (("strptime", _strptime_date), ("memoized", parse_month_day_year)):
+        calls, elapsed = time_call(lambda func=func: list(map(func, dates)))
+        rates[name] = calls * len(dates) / elapsed
+
+    print(f"{args.rows} dates, {len(set(dates))} distinct")
+    print(f"strptime  {rates['strptime']:12.0f} rows/s")
+    print(
+        f"memoized  {rates['memoized']:12.0f} rows/s  "
+        f"({rates['memoized'] / rates['strptime']:.1f}x, cache {date_parse_stats()['cached']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
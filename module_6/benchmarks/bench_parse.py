@@ -0,0 +1,43 @@
+"""Report survey pages parsed per second for each scrape parser backend.
+
+Usage (from the module_6 root)::
+
+    python benchmarks/bench_parse.py [--seconds 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from bench_common import add_source_paths, recorded_pages, time_call
+
+add_source_paths()
+
+from app import scrape_support  # pylint: disable=wrong-import-position,import-error
+
+
+def main() -> None:
+    """Parse every recorded page with each backend and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="Minimum time per backend.")
+    args = parser.parse_args()
+
+    pages = recorded_pages()
+    reference = [scrape_support.parse_page(html, "html.parser") for html in pages]
+    rates = {}
+    for backend in sorted(scrape_support.PARSER_BACKENDS):
+        # Refuse to report numbers for a backend that disagrees with html.parser.
+        if [scrape_support.parse_page(html, backend) for html in pages] != reference:
+            raise SystemExit(f"{backend}: output differs from html.parser")
+        calls, elapsed = time_call(
+            lambda name=backend: [scrape_support.parse_page(html, name) for html in pages],
+            args.seconds,
+        )
+        rates[backend] = calls * len(pages) / elapsed
+
+    for backend, rate in rates.items():
+        speedup = rate / rates["html.parser"]
+        print(f"{backend:<12} {rate:10.1f} pages/s  ({speedup:.1f}x html.parser)")
+
+if __name__ == "__main__":
+    main()
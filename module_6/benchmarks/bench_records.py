@@ -0,0 +1,92 @@
+"""Compare per-row memory and insert-value cost of entry dicts, ApplicantRecord and ApplicantBatch.
+
+Rows are the recorded survey pages parsed once and repeated up to ``--rows``,
+each copied so no two rows share a container. The interning line reloads the
+rows from NDJSON, as the backfill does, and measures fields and containers.
+
+Usage (from the module_6 root)::
+
+    python benchmarks/bench_records.py [--rows 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import tracemalloc
+
+from bench_common import add_source_paths, recorded_pages, time_call
+
+add_source_paths()
+
+# pylint: disable=wrong-import-position,import-error
+from app import data_cleaning, scrape_support
+from applicant_batch import ApplicantBatch
+from applicant_insert import build_insert_values
+from applicant_record import ApplicantRecord
+from load_data import parse_date, parse_float
+
+
+def _bytes_per_row(build) -> float:
+    tracemalloc.start()
+    rows = build()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(rows)
+
+
+def main() -> None:
+    """Build the same rows both ways and print memory and insert-value throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows to build.")
+    args = parser.parse_args()
+
+    parsed = [entry for html in recorded_pages() for entry in scrape_support.parse_page(html)]
+    sample = list(itertools.islice(itertools.cycle(parsed), args.rows))
+    # Field strings are shared by both shapes, so only the containers are measured.
+    dict_bytes = _bytes_per_row(lambda: [entry.to_dict() for entry in sample])
+    record_bytes = _bytes_per_row(
+        lambda: [ApplicantRecord.from_dict(entry.to_dict()) for entry in sample]
+    )
+
+    lines = [json.dumps(entry.to_dict()) for entry in sample]
+
+    def _loaded(interner=None):
+        records = [ApplicantRecord.from_dict(json.loads(line)) for line in lines]
+        return list(map(interner.intern_row, records)) if interner else records
+
+    loaded_bytes = _bytes_per_row(_loaded)
+    interner = data_cleaning.FieldInterner()
+    interned_bytes = _bytes_per_row(lambda: _loaded(interner))
+
+    dicts = [entry.to_dict() for entry in sample]
+    rates = {}
+    for name, rows in (("dict", dicts), ("record", sample)):
+        calls, elapsed = time_call(
+            lambda rows=rows: [build_insert_values(row, parse_date, parse_float) for row in rows]
+        )
+        rates[name] = calls * len(rows) / elapsed
+    calls, elapsed = time_call(
+        lambda: ApplicantBatch.from_rows(sample).insert_rows(parse_date, parse_float)
+    )
+    rates["batch"] = calls * len(sample) / elapsed
+
+    print(f"{args.rows} rows")
+    print(f"dict    {dict_bytes:7.0f} bytes/row  {rates['dict']:10.0f} insert rows/s")
+    print(
+        f"record  {record_bytes:7.0f} bytes/row  {rates['record']:10.0f} insert rows/s  "
+        f"({dict_bytes / record_bytes:.1f}x smaller, {rates['record'] / rates['dict']:.1f}x faster)"
+    )
+    print(
+        f"batch   {'':7}            {rates['batch']:10.0f} insert rows/s  "
+        f"({rates['batch'] / rates['record']:.1f}x record)"
+    )
+    print(
+        f"loaded  {loaded_bytes:7.0f} bytes/row  interned {interned_bytes:.0f} bytes/row  "
+        f"({loaded_bytes / interned_bytes:.1f}x smaller; distinct {interner.stats()})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark the scrape paths end to end against the local GradCafe stand-in.
+
+Runs ``scrape_data`` (backfill fetch + parse), the dashboard's
+``_scrape_new_rows`` and the worker's ``_scrape_until`` (both stopping at a
+watermark ``--watermark-page`` pages deep) and reports pages/s, rows/s and
+p99 page fetch latency for each.
+
+Usage (from the module_6 root)::
+
+    python benchmarks/bench_scrape.py [--pages 200] [--latency 0.02] [--error-rate 0.01]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Callable
+
+from bench_common import ROOT_PATH, add_source_paths
+from standin_server import StandInServer, StandInSurvey, SurveyOptions
+
+add_source_paths()
+sys.path.insert(0, str(ROOT_PATH / "src" / "worker"))
+
+# pylint: disable=wrong-import-position,import-error
+import consumer
+from app import scrape_support
+from app.blueprints import dashboard
+from app.rate_limit import PacingPolicy
+from etl import scrape as worker_scrape
+
+
+def _p99(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] if ordered else 0.0
+
+
+def _timed_fetch(fetch: Callable[[str], str], latencies: list[float]) -> Callable[[str], str]:
+    # Record client-side latency for every page fetch, including limiter waits.
+    def fetch_and_time(url: str) -> str:
+        started = time.perf_counter()
+        try:
+            return fetch(url)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    return fetch_and_time
+
+
+def _point_scrapers_at(base_url: str, workers: int, max_rate: float) -> None:
+    scrape_support.BASE_URL = base_url
+    worker_scrape.BASE_URL = base_url
+    consumer.BASE_URL = base_url
+    # Lift pacing to --max-rate so the stand-in, not the limiter, sets the pace.
+    for module in (scrape_support, worker_scrape):
+        module.LIMITER.policy = PacingPolicy(
+            max_concurrency=workers, max_rate=max_rate, start_rate=max_rate
+        )
+
+
+def _run(name: str, module, run: Callable[[], list[dict]]) -> dict[str, float | int | str]:
+    latencies: list[float] = []
+    original = module._fetch_html  # pylint: disable=protected-access
+    module._fetch_html = _timed_fetch(original, latencies)  # pylint: disable=protected-access
+    try:
+        started = time.perf_counter()
+        rows = run()
+        elapsed = time.perf_counter() - started
+    finally:
+        module._fetch_html = original  # pylint: disable=protected-access
+    return {
+        "name": name,
+        "pages": len(latencies),
+        "rows": len(rows),
+        "seconds": elapsed,
+        "pages_per_second": len(latencies) / elapsed,
+        "rows_per_second": len(rows) / elapsed,
+        "p99_ms": _p99(latencies) * 1000,
+    }
+
+
+def main() -> None:
+    """Start the stand-in, run each scrape path against it, and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="Pages served and backfilled.")
+    parser.add_argument("--rows", type=int, default=20, help="Results per synthetic page.")
+    parser.add_argument("--recorded", action="store_true", help="Serve tests/fixtures pages.")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server seconds per request.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered 503.")
+    parser.add_argument("--workers", type=int, default=scrape_support.SCRAPE_WORKERS)
+    parser.add_argument("--watermark-page", type=int, default=50)
+    parser.add_argument("--max-rate", type=float, default=1000.0, help="Limiter ceiling, req/s.")
+    args = parser.parse_args()
+
+    survey = StandInSurvey(
+        SurveyOptions(args.pages, args.rows, args.recorded, args.latency, args.error_rate)
+    )
+    watermark = survey.result_url(min(args.watermark_page, args.pages), index=1)
+    with StandInServer(survey) as server:
+        _point_scrapers_at(server.base_url, args.workers, args.max_rate)
+        results = [
+            _run(
+                f"scrape_data ({args.workers} workers)",
+                scrape_support,
+                lambda: scrape_support.scrape_data(args.pages, args.workers),
+            ),
+            _run(
+                "dashboard _scrape_new_rows",
+                scrape_support,
+                # pylint: disable-next=protected-access
+                lambda: dashboard._scrape_new_rows(scrape_support, watermark, None, 1)[0],
+            ),
+            _run(
+                "worker _scrape_until",
+                consumer,
+                lambda: consumer._scrape_until(watermark),  # pylint: disable=protected-access
+            ),
+        ]
+
+    print(
+        f"{args.pages} pages, {args.latency * 1000:.0f} ms latency, "
+        f"{args.error_rate:.1%} errors ({survey.errors} injected), "
+        f"watermark on page {min(args.watermark_page, args.pages)}"
+    )
+    print(f"{'scenario':<34}{'pages':>7}{'rows':>8}{'pages/s':>10}{'rows/s':>10}{'p99 ms':>9}")
+    for result in results:
+        print(
+            f"{result['name']:<34}{result['pages']:>7}{result['rows']:>8}"
+            f"{result['pages_per_second']:>10.1f}{result['rows_per_second']:>10.1f}"
+            f"{result['p99_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
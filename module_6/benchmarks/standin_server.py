@@ -0,0 +1,196 @@
+"""Local stand-in for the GradCafe survey used by scraper benchmarks and tests.
+
+Serves ``/survey/?page=N`` in the markup ``_parse_page`` expects, newest
+results first, with configurable page count, latency, and error injection.
+Pages past the end return an empty table, like the live site.
+
+Usage (from the module_6 root)::
+
+    python benchmarks/standin_server.py --pages 200 --latency 0.05 --error-rate 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from bench_common import recorded_pages
+
+
+FIRST_RESULT_ID = 990_000
+RESULT_LINK_RE = re.compile(r'href="(?:https://www\.thegradcafe\.com)?/result/\d+"')
+EMPTY_PAGE = "<html><body><table><tbody></tbody></table></body></html>"
+ROBOTS_TXT = "User-agent: *\nAllow: /survey/\n"
+
+
+def _synthetic_rows(first_id: int, rows: int) -> str:
+    # One summary row plus term/GPA and comment detail rows per result.
+    parts = []
+    for index in range(rows):
+        result_id = first_id - index
+        parts.append(
+            f"""
+      <tr>
+        <td><div>University {result_id % 97}</div></td>
+        <td><div><span>Program {result_id % 13}</span><span>PhD</span></div></td>
+        <td>February {1 + result_id % 28}, 2026</td>
+        <td><div>Accepted on {1 + result_id % 28} Feb</div></td>
+        <td><a href="/result/{result_id}">See More</a></td>
+      </tr>
+      <tr class="tw-border-none">
+        <td colspan="3">
+          <div>Fall 2026</div> <div>American</div> <div>GPA: 3.{result_id % 10}</div>
+        </td>
+      </tr>
+      <tr class="tw-border-none"><td colspan="3"><p>Synthetic note {result_id}</p></td></tr>"""
+        )
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class SurveyOptions:
+    """Shape of the stand-in survey and the faults it injects."""
+
+    pages: int = 100
+    rows_per_page: int = 20
+    # Serve the recorded tests/fixtures pages instead of synthetic rows.
+    recorded: bool = False
+    # Seconds added to every survey request.
+    latency: float = 0.0
+    # Fraction of survey requests answered with a 503.
+    error_rate: float = 0.0
+
+
+class StandInSurvey:
+    """Page generator plus the knobs the request handler reads."""
+
+    def __init__(self, options: SurveyOptions | None = None) -> None:
+        self.options = options or SurveyOptions()
+        self.recorded = recorded_pages() if self.options.recorded else []
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(0)
+        self._lock = threading.Lock()
+
+    def first_id(self, page: int) -> int:
+        """Return the newest result id shown on ``page``."""
+        return FIRST_RESULT_ID - (page - 1) * self.options.rows_per_page
+
+    def result_url(self, page: int, index: int = 0) -> str:
+        """Return the absolute result URL of row ``index`` on ``page``."""
+        return f"https://www.thegradcafe.com/result/{self.first_id(page) - index}"
+
+    def render(self, page: int) -> str:
+        """Return the survey HTML for ``page`` (an empty table past the end)."""
+        if page < 1 or page > self.options.pages:
+            return EMPTY_PAGE
+        if not self.recorded:
+            rows = _synthetic_rows(self.first_id(page), self.options.rows_per_page)
+            return f"<html><body><table><tbody>{rows}</tbody></table></body></html>"
+        # Recorded markup with result ids renumbered so pages stay newest first.
+        ids = iter(range(self.first_id(page), 0, -1))
+        return RESULT_LINK_RE.sub(
+            lambda _match: f'href="/result/{next(ids)}"',
+            self.recorded[(page - 1) % len(self.recorded)],
+        )
+
+    def should_fail(self) -> bool:
+        """Count one request and decide whether to inject a 503."""
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.options.error_rate
+            self.errors += failed
+            return failed
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        return None
+
+    def _send(self, status: int, body: str, headers: dict[str, str] | None = None) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve robots.txt and survey pages with the configured latency and errors."""
+        survey: StandInSurvey = self.server.survey
+        parts = urlsplit(self.path)
+        if parts.path == "/robots.txt":
+            self._send(200, ROBOTS_TXT)
+            return
+        if parts.path.rstrip("/") != "/survey":
+            self._send(404, "not found")
+            return
+        if survey.options.latency:
+            time.sleep(survey.options.latency)
+        if survey.should_fail():
+            self._send(503, "temporarily unavailable", {"Retry-After": "0"})
+            return
+        page = int(parse_qs(parts.query).get("page", ["1"])[0])
+        self._send(200, survey.render(page))
+
+
+class StandInServer:
+    """Run a ``StandInSurvey`` on a background thread; use as a context manager."""
+
+    def __init__(self, survey: StandInSurvey, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.survey = survey
+        self.httpd = ThreadingHTTPServer((host, port), _StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.survey = survey
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Return the survey URL scrapers should use as ``BASE_URL``."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/survey/"
+
+    def __enter__(self) -> StandInServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main() -> None:
+    """Serve the stand-in survey until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=100, help="Pages before the empty end page.")
+    parser.add_argument("--rows", type=int, default=20, help="Results per synthetic page.")
+    parser.add_argument("--recorded", action="store_true", help="Serve tests/fixtures pages.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per request.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered 503.")
+    args = parser.parse_args()
+
+    survey = StandInSurvey(
+        SurveyOptions(args.pages, args.rows, args.recorded, args.latency, args.error_rate)
+    )
+    with StandInServer(survey, port=args.port) as server:
+        print(f"Serving {args.pages} pages at {server.base_url} (Ctrl+C to stop)")
+        print(f"Point the scrapers at it with GRADCAFE_BASE_URL={server.base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ setup(
         "psycopg[binary]==3.3.2",
         "pika==1.3.2",
         "beautifulsoup4==4.14.3",
+        "lxml==6.1.3",
         "Werkzeug==3.1.6",
     ],
     python_requires=">=3.10",
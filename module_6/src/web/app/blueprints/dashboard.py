@@ -1,6 +1,7 @@
 """Flask dashboard blueprint for GradCafe data and query reporting."""
 from __future__ import annotations
 
+import itertools
 import json
 import os
 import re
@@ -13,7 +14,9 @@ from psycopg import OperationalError
 from publisher import publish_task
 
 from app import data_cleaning, scrape_support
-from applicant_insert import InsertEntriesOptions, build_insert_values, insert_entries
+from app.scrape_support import fetch_pages_in_order, locate_watermark_page
+from applicant_insert import build_insert_values, insert_entries_batched
+from applicant_record import to_json
 from load_data import create_applicants_table as _create_applicants_table, parse_date, parse_float
 import query_data
 
@@ -215,37 +218,6 @@ def fetch_applicant_row_by_url(connection, url: str) -> dict[str, Any] | None:
     return dict(zip(keys, row))
 
 
-# Get a set of URLs already in the DB so the program can skip duplicates.
-def _fetch_existing_urls(connection) -> set[str]:
-    batch_size = query_data.clamp_query_limit(
-        query_data.MAX_QUERY_LIMIT, default=query_data.MAX_QUERY_LIMIT
-    )
-    offset = 0
-    urls: set[str] = set()
-
-    while True:
-        cursor = connection.execute(
-            """
-            SELECT url
-            FROM applicants
-            WHERE url IS NOT NULL AND url <> ''
-            ORDER BY url
-            LIMIT %s OFFSET %s;
-            """,
-            (batch_size, offset),
-        )
-        rows = cursor.fetchall()
-        if not rows:
-            break
-        urls.update(row[0] for row in rows)
-        has_more = len(rows) == batch_size
-        offset += batch_size if has_more else 0
-        if not has_more:
-            break
-
-    return urls
-
-
 # Return the newest applicant URL in the database.
 def _fetch_latest_url(connection) -> str | None:
     cursor = connection.execute(
@@ -257,6 +229,12 @@ def _fetch_latest_url(connection) -> str | None:
     return row[0] if row else None
 
 
+def _fetch_db_state(connection) -> str | None:
+    """Return a token that changes whenever applicants rows are added or removed."""
+    row = connection.execute("SELECT COUNT(*), MAX(p_id) FROM applicants;").fetchone()
+    return f"{row[0]}:{row[1]}" if row else None
+
+
 # Parse page number from a scrape URL.
 def _extract_page_number(url: str) -> int:
     match = re.search(r"page=(\d+)", url)
@@ -269,138 +247,151 @@ def _resolve_scrape_modules(scraper_module, clean_module):
 
 
 def _load_existing_context(connection_factory):
-    """Load stop URL and existing URLs from database using a short-lived connection."""
+    """Load the stop URL and DB state token using a short-lived connection."""
     connection = connection_factory()
     try:
         # Ensure first-run pulls work even when the applicants table is not created yet.
         create_applicants_table(connection)
         stop_url = _fetch_latest_url(connection)
-        existing_urls = _fetch_existing_urls(connection)
+        db_state = _fetch_db_state(connection)
     finally:
         connection.close()
-    return stop_url, existing_urls
+    return stop_url, db_state
 
 
-def _notify_page_progress(progress_callback, pages_scraped, page):
+def _notify_page_progress(progress_callback, pages_scraped, page, limiter_stats=None):
     if progress_callback:
         progress_callback(
             progress={
                 "pages_scraped": pages_scraped,
                 "current_page": page,
+                # Current fetch rate and concurrency when the scraper is paced.
+                **(limiter_stats() if limiter_stats else {}),
             }
         )
 
 
 def _resolve_scraper_callables(scraper_module):
     """Resolve scraper callables with support for public and legacy private names."""
-    return (
-        getattr(scraper_module, "fetch_html", None) or getattr(scraper_module, "_fetch_html"),
-        getattr(scraper_module, "parse_page", None) or getattr(scraper_module, "_parse_page"),
+    fetch_html = (
+        getattr(scraper_module, "fetch_html", None) or getattr(scraper_module, "_fetch_html")
+    )
+    parse_page = (
+        getattr(scraper_module, "parse_page", None) or getattr(scraper_module, "_parse_page")
     )
+    # Scrapers without a lazy iterator still work by walking their parsed list.
+    iter_entries = getattr(scraper_module, "iter_page_entries", None) or (
+        lambda html: iter(parse_page(html))
+    )
+    return fetch_html, iter_entries
+
+
+def _cache_stats(scraper_module) -> dict[str, int]:
+    """Read conditional-GET cache counters from scrapers that expose them."""
+    cache_stats = getattr(scraper_module, "cache_stats", None)
+    if cache_stats is None:
+        return {"cache_hits": 0, "cache_misses": 0}
+    return cache_stats()
+
 
+def _take_until_stop(entries, stop_url):
+    """Collect entries up to ``stop_url``; return (rows, whether stop_url was seen)."""
+    rows = []
+    for entry in entries:
+        # Stop consuming the iterator so the rest of the page is never parsed.
+        if stop_url and entry.get("url") == stop_url:
+            return rows, True
+        rows.append(entry)
+    return rows, False
 
-def _scrape_new_rows(scraper_module, stop_url, progress_callback, start_page):
+
+def _scrape_new_rows(scraper_module, stop_url, progress_callback, start_page, fingerprints=None):
     """Scrape pages until no data or stop_url is encountered."""
     raw_data = []
     last_page = 0
     pages_scraped = 0
-    page = start_page
-    fetch_html, parse_page = _resolve_scraper_callables(scraper_module)
-
-    # Scrape until a page returns no data.
-    while True:
-        html = fetch_html(f"{scraper_module.BASE_URL}?page={page}")
-        page_data = parse_page(html)
-        if not page_data:
+    fetch_html, iter_entries = _resolve_scraper_callables(scraper_module)
+
+    def fetch_page(page):
+        url = f"{scraper_module.BASE_URL}?page={page}"
+        html = fetch_html(url)
+        # A table body identical to the last pull means nothing new reached this
+        # page, so it reads as empty and is never parsed, cleaned, or inserted.
+        if fingerprints is not None and fingerprints.unchanged(url, html):
+            return ""
+        return html
+
+    # Jump straight to the watermark page when its result id allows a search,
+    # then fetch everything before it in parallel; otherwise walk page by page.
+    target_page, probed = (
+        locate_watermark_page(fetch_page, iter_entries, stop_url) if stop_url else (None, {})
+    )
+    if target_page is None:
+        page_numbers, workers = itertools.count(start_page), 1
+    else:
+        page_numbers = range(start_page, target_page + 1)
+        workers = getattr(scraper_module, "SCRAPE_WORKERS", 1)
+
+    def load_page(page):
+        return probed.pop(page) if page in probed else fetch_page(page)
+
+    for page, html in fetch_pages_in_order(load_page, page_numbers, workers):
+        page_data, found_stop = _take_until_stop(iter_entries(html), stop_url)
+        if not page_data and not found_stop:
             break
 
-        if stop_url:
-            stop_index = next(
-                (
-                    index
-                    for index, entry in enumerate(page_data)
-                    if entry.get("url") == stop_url
-                ),
-                None,
-            )
-            if stop_index is not None:
-                raw_data.extend(page_data[:stop_index])
-                last_page = page
-                pages_scraped += 1
-                _notify_page_progress(progress_callback, pages_scraped, page)
-                break
-
         raw_data.extend(page_data)
         last_page = page
         pages_scraped += 1
-        _notify_page_progress(progress_callback, pages_scraped, page)
-        page += 1
+        _notify_page_progress(
+            progress_callback,
+            pages_scraped,
+            page,
+            getattr(scraper_module, "limiter_stats", None),
+        )
+        if found_stop:
+            break
 
     return raw_data, last_page, pages_scraped
 
 
-def _insert_cleaned_rows(connection_factory, cleaned_data, existing_urls, progress_callback):
-    """Insert cleaned rows and return insert counters plus collected new entries."""
-    connection = connection_factory()
+def _insert_cleaned_rows(connection_factory, cleaned_data, progress_callback):
+    """Insert cleaned rows; return counters, new entries, and the resulting DB state."""
+    with_urls = [entry for entry in cleaned_data if entry.get("url")]
+    missing_urls = len(cleaned_data) - len(with_urls)
 
-    stats = {
-        "inserted": 0,
-        "errors": 0,
-        "duplicates": 0,
-        "missing_urls": 0,
-    }
-    new_entries = []
-
-    def should_skip(entry):
-        url = entry.get("url") or ""
-        if not url:
-            stats["missing_urls"] += 1
-            return True
-        if url in existing_urls:
-            stats["duplicates"] += 1
-            return True
-        return False
-
-    def on_inserted(entry, _index, inserted):
-        stats["inserted"] = inserted
-        url = entry.get("url") or ""
-        existing_urls.add(url)
-        new_entries.append(entry)
-
-    def on_insert_error(_entry, _index, _error, errors):
-        stats["errors"] = errors
-
-    def on_progress(index, inserted, errors):
+    def on_batch(result, done):
         if progress_callback:
             progress_callback(
                 progress={
-                    "processed": index,
-                    "inserted": inserted,
-                    "duplicates": stats["duplicates"],
-                    "missing_urls": stats["missing_urls"],
-                    "errors": errors,
+                    "processed": missing_urls + done,
+                    "inserted": len(result.inserted),
+                    "duplicates": result.duplicates,
+                    "missing_urls": missing_urls,
+                    "errors": result.errors,
                 }
             )
 
+    # The unique URL index drops rows already stored, so nothing is preloaded.
+    connection = connection_factory()
     try:
-        inserted_count, error_count = insert_entries(
+        result = insert_entries_batched(
             connection,
-            cleaned_data,
+            with_urls,
             lambda entry: build_insert_values(entry, parse_date, parse_float),
-            InsertEntriesOptions(
-                should_skip=should_skip,
-                on_inserted=on_inserted,
-                on_insert_error=on_insert_error,
-                on_progress=on_progress,
-                should_commit=lambda index, _inserted, _errors: index % 100 == 0,
-            ),
+            on_batch=on_batch,
         )
+        db_state = _fetch_db_state(connection)
     finally:
         connection.close()
 
-    stats["inserted"] = inserted_count
-    stats["errors"] = error_count
-    return stats, new_entries
+    stats = {
+        "inserted": len(result.inserted),
+        "errors": result.errors,
+        "duplicates": result.duplicates,
+        "missing_urls": missing_urls,
+    }
+    return stats, result.inserted, db_state
 
 
 # Scrape new GradCafe pages, clean them, and insert new rows.
@@ -414,15 +405,19 @@ def pull_gradcafe_data(
     scraper_module, clean_module = _resolve_scrape_modules(scraper_module, clean_module)
     connection_factory = connection_factory or create_connection
     start_page = 1
-    stop_url, existing_urls = _load_existing_context(connection_factory)
+    stop_url, db_state = _load_existing_context(connection_factory)
+    cache_before = _cache_stats(scraper_module)
+    load_fingerprints = getattr(scraper_module, "load_fingerprints", None)
+    fingerprints = load_fingerprints(db_state) if load_fingerprints else None
     raw_data, last_page, pages_scraped = _scrape_new_rows(
-        scraper_module, stop_url, progress_callback, start_page
+        scraper_module, stop_url, progress_callback, start_page, fingerprints
     )
+    cache_after = _cache_stats(scraper_module)
 
     # Normalize the scraped data before inserting.
     cleaned_data = clean_module.clean_data(raw_data)
-    insert_stats, new_entries = _insert_cleaned_rows(
-        connection_factory, cleaned_data, existing_urls, progress_callback
+    insert_stats, new_entries, db_state = _insert_cleaned_rows(
+        connection_factory, cleaned_data, progress_callback
     )
 
     # Save the new entries for inspection/debugging.
@@ -430,7 +425,11 @@ def pull_gradcafe_data(
         os.path.join(os.path.dirname(__file__), "..", "new_data.json")
     )
     with open(new_data_path, "w", encoding="utf-8") as file_handle:
-        json.dump(new_entries, file_handle, indent=2, ensure_ascii=False)
+        json.dump(new_entries, file_handle, indent=2, ensure_ascii=False, default=to_json)
+    # Only remember page fingerprints once every row on them was stored; a
+    # failed row must be scraped again rather than hidden behind a skip.
+    if fingerprints is not None and not insert_stats["errors"]:
+        fingerprints.save(db_state)
 
     return {
         "start_page": start_page,
@@ -441,6 +440,10 @@ def pull_gradcafe_data(
         "duplicates": insert_stats["duplicates"],
         "missing_urls": insert_stats["missing_urls"],
         "errors": insert_stats["errors"],
+        # Counters are cumulative per session, so report this pull's share.
+        "cache_hits": cache_after["cache_hits"] - cache_before["cache_hits"],
+        "cache_misses": cache_after["cache_misses"] - cache_before["cache_misses"],
+        "pages_unchanged": fingerprints.skipped if fingerprints is not None else 0,
     }
 
 
@@ -3,8 +3,27 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
 import re
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator
+
+from applicant_record import FIELDS, ApplicantRecord, to_json
+
+
+TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
+PLACEHOLDER_VALUES = frozenset({"n/a", "na", "none", "-", "â€”"})
+PLACEHOLDER_MAX_LENGTH = max(len(value) for value in PLACEHOLDER_VALUES)
+# Cleaner processes for large inputs and rows sent to each per task.
+CLEAN_WORKERS = int(os.getenv("CLEAN_WORKERS", str(os.cpu_count() or 1)))
+CLEAN_CHUNK_SIZE = int(os.getenv("CLEAN_CHUNK_SIZE", "5000"))
+# Below this many rows, pool startup and pickling rows to and from the workers
+# cost more than cleaning in-process (about 30k rows for a full backfill).
+PARALLEL_CLEAN_MIN_ROWS = int(os.getenv("CLEAN_PARALLEL_MIN_ROWS", "200000"))
+# Legacy keys of fields with few distinct values; rows share one string per value.
+INTERNED_FIELDS = ("program", "status", "term", "US/International", "Degree")
 
 
 def load_data(filename: str = "applicant_data.json") -> list[dict[str, Any]]:
@@ -14,29 +33,107 @@ def load_data(filename: str = "applicant_data.json") -> list[dict[str, Any]]:
     return payload if isinstance(payload, list) else []
 
 
-def clean_data(data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def load_ndjson(filename: str = "applicant_data.ndjson") -> list[ApplicantRecord]:
+    """Load applicant records written one JSON object per line by the backfill."""
+    with open(filename, "r", encoding="utf-8") as file_handle:
+        return [ApplicantRecord.from_dict(json.loads(line)) for line in file_handle if line.strip()]
+
+
+def _clean_string(value: str) -> str:
+    """Strip tags, collapse whitespace, and blank out placeholder values."""
+    # Most scraped fields hold no markup and only single spaces, so skip the regexes.
+    if "<" in value or "  " in value or not value.isprintable():
+        value = WHITESPACE_RE.sub(" ", TAG_RE.sub("", value))
+    value = value.strip()
+    if len(value) <= PLACEHOLDER_MAX_LENGTH and value.lower() in PLACEHOLDER_VALUES:
+        return ""
+    return value
+
+
+class FieldInterner:
+    """Replace repeated values of ``INTERNED_FIELDS`` with one shared string each.
+
+    Parsed and JSON-loaded rows carry their own copy of every status, term and
+    program string; after interning, rows held in memory share one per value.
+    The whole ``program`` value is interned since it embeds the university.
+    """
+
+    def __init__(self, fields: Iterable[str] = INTERNED_FIELDS) -> None:
+        self.tables: dict[str, dict[str, str]] = {key: {} for key in fields}
+        self._attributes = [
+            (attribute, self.tables[key]) for attribute, key in FIELDS if key in self.tables
+        ]
+
+    def intern_row(self, row: Any) -> Any:
+        """Swap the row's interned fields for the shared strings, in place."""
+        if isinstance(row, ApplicantRecord):
+            for attribute, table in self._attributes:
+                value = getattr(row, attribute)
+                if isinstance(value, str):
+                    setattr(row, attribute, table.setdefault(value, value))
+            return row
+        for key, table in self.tables.items():
+            value = row.get(key)
+            if isinstance(value, str):
+                row[key] = table.setdefault(value, value)
+        return row
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of distinct values seen per interned field."""
+        return {key: len(table) for key, table in self.tables.items()}
+
+
+def iter_clean(rows: Iterable[Any], interner: FieldInterner | None = None) -> Iterator[Any]:
+    """Yield each raw scraped record normalized into a display-safe record or dict.
+
+    Low-cardinality fields are interned through ``interner`` (a fresh one per
+    call by default); pass one in to read its ``stats()`` afterwards.
+    """
+    interner = interner or FieldInterner()
+    for row in rows:
+        # Records keep never-set fields as None so they stay out of saved JSON.
+        if isinstance(row, ApplicantRecord):
+            yield interner.intern_row(row.map_strings(_clean_string))
+            continue
+        yield interner.intern_row({
+            key: (
+                _clean_string(value)
+                if isinstance(value, str)
+                else "" if value is None else value
+            )
+            for key, value in row.items()
+        })
+
+
+def clean_data(data: list[Any], interner: FieldInterner | None = None) -> list[Any]:
     """Normalize raw scraped records into a cleaner, display-safe structure."""
-    cleaned: list[dict[str, Any]] = []
-
-    for row in data:
-        clean_row: dict[str, Any] = {}
-        for key, value in row.items():
-            if value is None:
-                clean_value: Any = ""
-            elif isinstance(value, str):
-                clean_value = re.sub(r"<[^>]+>", "", value)
-                clean_value = re.sub(r"\s+", " ", clean_value).strip()
-                if clean_value.lower() in {"n/a", "na", "none", "-", "â€”"}:
-                    clean_value = ""
-            else:
-                clean_value = value
-            clean_row[key] = clean_value
-        cleaned.append(clean_row)
-
-    return cleaned
+    return list(iter_clean(data, interner))
+
+
+def iter_clean_parallel(
+    rows: list[dict[str, Any]],
+    workers: int = CLEAN_WORKERS,
+    chunk_size: int = CLEAN_CHUNK_SIZE,
+    interner: FieldInterner | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield cleaned rows in input order, cleaning chunks across a process pool.
+
+    Inputs smaller than ``PARALLEL_CLEAN_MIN_ROWS`` (or a single worker) are
+    cleaned in-process, where pool startup and pickling would dominate.
+    """
+    interner = interner or FieldInterner()
+    if workers <= 1 or len(rows) < PARALLEL_CLEAN_MIN_ROWS:
+        yield from iter_clean(rows, interner)
+        return
+    chunks = (rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size))
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        # map yields chunk results in submission order as each one completes;
+        # each chunk comes back with its own copies, so intern again here.
+        for cleaned in pool.map(clean_data, chunks):
+            yield from map(interner.intern_row, cleaned)
 
 
 def save_data(data: list[dict[str, Any]], filename: str = "cleaned_applicant_data.json") -> None:
     """Persist cleaned applicant data to JSON."""
     with open(filename, "w", encoding="utf-8") as file_handle:
-        json.dump(data, file_handle, indent=2, ensure_ascii=False)
+        json.dump(data, file_handle, indent=2, ensure_ascii=False, default=to_json)
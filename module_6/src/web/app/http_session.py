@@ -0,0 +1,316 @@
+"""Keep-alive HTTP fetch session shared by the GradCafe scrape helpers."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import tempfile
+import threading
+import zlib
+from base64 import b64encode
+from typing import NamedTuple
+from urllib.error import HTTPError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+CONNECT_TIMEOUT = float(os.getenv("SCRAPE_CONNECT_TIMEOUT", "10"))
+READ_TIMEOUT = float(os.getenv("SCRAPE_READ_TIMEOUT", "30"))
+MAX_REDIRECTS = 5
+MAX_BACKOFF_RETRIES = 3
+# An empty SCRAPE_CACHE_DIR disables the conditional-GET cache.
+CACHE_DIR = os.getenv(
+    "SCRAPE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "gradcafe_http_cache")
+)
+
+
+class FetchResponse(NamedTuple):
+    """Status, lower-cased headers, and decompressed body of one HTTP response."""
+
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+def _decompress(body: bytes, encoding: str | None) -> bytes:
+    """Undo gzip/deflate content encoding; pass other bodies through unchanged."""
+    encoding = (encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate streams without the zlib header.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+class HttpCache:
+    """On-disk store of validators and bodies, one JSON file per URL."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def lookup(self, url: str) -> dict[str, str] | None:
+        """Return the cached entry for ``url``, or None when absent or unreadable."""
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as file_handle:
+                return json.load(file_handle)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def conditional_headers(entry: dict[str, str] | None) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cached entry."""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, response: FetchResponse, text: str) -> bool:
+        """Persist a validated response; return False when there is nothing to store."""
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not (etag or last_modified):
+            return False
+        path = self._path(url)
+        # Write then rename so concurrent fetchers never read a partial file.
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file_handle:
+                json.dump(
+                    {"url": url, "etag": etag, "last_modified": last_modified, "body": text},
+                    file_handle,
+                )
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+        return True
+
+    def record(self, hit: bool) -> None:
+        """Count one fetch as served from cache (hit) or downloaded (miss)."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return the running hit/miss counters."""
+        with self._lock:
+            return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+
+def cache_from_env() -> HttpCache | None:
+    """Build the cache configured by SCRAPE_CACHE_DIR, or None when disabled."""
+    return HttpCache(CACHE_DIR) if CACHE_DIR else None
+
+
+class _Proxy(NamedTuple):
+    host: str
+    port: int
+    headers: dict[str, str]
+
+
+def _proxy_for(proxies: dict[str, str], scheme: str, netloc: str) -> _Proxy | None:
+    """Return the HTTP proxy urllib would use for ``scheme://netloc``, if any."""
+    proxy_url = proxies.get(scheme)
+    if not proxy_url or proxy_bypass(urlsplit(f"//{netloc}").hostname or netloc):
+        return None
+    parts = urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    headers = {}
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + b64encode(credentials.encode()).decode()
+    return _Proxy(parts.hostname or "", parts.port or 80, headers)
+
+
+class FetchSession:
+    """Reuse one connection per host and thread, with compression and timeouts.
+
+    Like urllib, it honours ``http_proxy``/``https_proxy``/``no_proxy``: plain
+    HTTP requests go to the proxy in absolute form and HTTPS is tunnelled
+    through it with CONNECT.
+    """
+
+    def __init__(
+        self,
+        headers: dict[str, str] | None = None,
+        timeouts: tuple[float, float] = (CONNECT_TIMEOUT, READ_TIMEOUT),
+        cache: HttpCache | None = None,
+        limiter=None,
+    ) -> None:
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.cache = cache
+        # Optional pacer with acquire(host) / release(host, status, retry_after).
+        self.limiter = limiter
+        # (connect, read) seconds.
+        self.timeouts = timeouts
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open: list[http.client.HTTPConnection] = []
+
+    def _pool(self) -> dict[tuple[str, str], http.client.HTTPConnection]:
+        # Connections are not thread-safe, so each fetcher thread keeps its own pool.
+        if not hasattr(self._local, "pool"):
+            self._local.pool = {}
+        return self._local.pool
+
+    def _connection(
+        self, scheme: str, netloc: str, proxy: _Proxy | None = None
+    ) -> http.client.HTTPConnection:
+        pool = self._pool()
+        connection = pool.get((scheme, netloc))
+        if connection is None:
+            connection_cls = (
+                http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            )
+            if proxy is None:
+                connection = connection_cls(netloc, timeout=self.timeouts[0])
+            else:
+                connection = connection_cls(proxy.host, proxy.port, timeout=self.timeouts[0])
+                if scheme == "https":
+                    connection.set_tunnel(netloc, headers=proxy.headers)
+            pool[(scheme, netloc)] = connection
+            with self._lock:
+                self._open.append(connection)
+        return connection
+
+    def _discard(self, scheme: str, netloc: str) -> None:
+        connection = self._pool().pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+            with self._lock:
+                if connection in self._open:
+                    self._open.remove(connection)
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> FetchResponse:
+        """Send one GET over a pooled connection and return the decoded response."""
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        request_headers = {**self.headers, **(headers or {})}
+        proxy = _proxy_for(getproxies(), parts.scheme, parts.netloc)
+        if proxy is not None and parts.scheme == "http":
+            # A plain HTTP proxy needs the absolute URL; HTTPS uses the tunnel.
+            path = f"http://{parts.netloc}{path}"
+            request_headers.update(proxy.headers)
+
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh connection before surfacing the error.
+        for attempt in range(2):
+            connection = self._connection(parts.scheme, parts.netloc, proxy)
+            try:
+                connection.request("GET", path, headers=request_headers)
+                connection.sock.settimeout(self.timeouts[1])
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                self._discard(parts.scheme, parts.netloc)
+                if attempt:
+                    raise
+                continue
+            except OSError:
+                # A timeout can strike mid-body; the unread bytes would be taken
+                # as the next response, so drop the connection but do not retry.
+                self._discard(parts.scheme, parts.netloc)
+                raise
+            if response.will_close:
+                self._discard(parts.scheme, parts.netloc)
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            return FetchResponse(
+                url=url,
+                status=response.status,
+                headers=response_headers,
+                body=_decompress(body, response_headers.get("content-encoding")),
+            )
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _paced_get(self, url: str, headers: dict[str, str]) -> FetchResponse:
+        """GET through the limiter, retrying while it asks to back off (429/503)."""
+        if self.limiter is None:
+            return self.get(url, headers)
+        host = urlsplit(url).netloc
+        for attempt in range(MAX_BACKOFF_RETRIES + 1):
+            self.limiter.acquire(host)
+            response = None
+            try:
+                response = self.get(url, headers)
+            finally:
+                # Any failure (transport, bad gzip/deflate body, ...) must still
+                # free the slot, or every later acquire() would block forever.
+                if response is None:
+                    self.limiter.release(host, None)
+            backoff = self.limiter.release(
+                host, response.status, response.headers.get("retry-after")
+            )
+            if not backoff or attempt == MAX_BACKOFF_RETRIES:
+                break
+        return response
+
+    def fetch_text(self, url: str, headers: dict[str, str] | None = None) -> str:
+        """Fetch a page, following redirects, and return its UTF-8 text.
+
+        With a cache attached, requests are conditional and a 304 returns the
+        cached body instead of downloading the page again.
+        """
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            entry = self.cache.lookup(current) if self.cache else None
+            response = self._paced_get(
+                current, {**(headers or {}), **HttpCache.conditional_headers(entry)}
+            )
+            location = response.headers.get("location")
+            if response.status in {301, 302, 303, 307, 308} and location:
+                current = urljoin(current, location)
+                continue
+            if response.status == 304 and entry:
+                self.cache.record(hit=True)
+                return entry["body"]
+            if response.status >= 400:
+                raise HTTPError(current, response.status, "HTTP error", response.headers, None)
+            text = response.body.decode("utf-8")
+            if self.cache:
+                self.cache.record(hit=False)
+                self.cache.store(current, response, text)
+            return text
+        raise HTTPError(current, 310, "Too many redirects", {}, None)
+
+    def limiter_stats(self) -> dict[str, float | int]:
+        """Return the limiter's current rate and concurrency (empty without one)."""
+        return self.limiter.snapshot() if self.limiter else {}
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return cache hit/miss counters (zeros when caching is disabled)."""
+        if self.cache is None:
+            return {"cache_hits": 0, "cache_misses": 0}
+        return self.cache.stats()
+
+    def close(self) -> None:
+        """Close every connection opened by this session across all threads."""
+        with self._lock:
+            connections, self._open = self._open, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
@@ -1,18 +1,24 @@
 """Utilities for loading applicant data into PostgreSQL."""
 
+import itertools
 import json
 import os
-from datetime import datetime
 
 import psycopg
 from psycopg import OperationalError
-from applicant_insert import InsertEntriesOptions, build_insert_values, insert_entries
+from applicant_batch import ApplicantBatch
+from applicant_insert import InsertEntriesOptions, insert_entries, migrate_url_unique_index
+from date_parsing import parse_month_day_year, warn_unparsed_date
 from db_connection import (
     build_db_config,
     create_connection_from_env,
     create_connection_with_driver,
 )
 
+# JSONL lines whose dates and scores are converted together.
+PAYLOAD_CHUNK_SIZE = 1000
+
+
 def create_connection(db_name, db_user, db_password, db_host, db_port):
     """Create and return a PostgreSQL connection."""
     # Delegate shared validation and connect-call wiring to db_connection helpers.
@@ -23,7 +29,7 @@ def create_connection(db_name, db_user, db_password, db_host, db_port):
     )
 
 def create_applicants_table(connection):
-    """Create the applicants table if it does not already exist."""
+    """Create the applicants table and, migrating older tables, its unique URL index."""
     create_table_query = """
     CREATE TABLE IF NOT EXISTS applicants (
         p_id SERIAL PRIMARY KEY,
@@ -46,6 +52,9 @@ def create_applicants_table(connection):
     try:
         # DDL is committed explicitly so downstream inserts always see the table.
         connection.execute(create_table_query)
+        # Batched inserts rely on the unique URL index; older tables are
+        # deduplicated once, with the deleted-row count printed.
+        migrate_url_unique_index(connection)
         connection.commit()
         print("Applicants table created successfully")
     except Exception as e:
@@ -55,14 +64,10 @@ def create_applicants_table(connection):
 
 def parse_date(date_string):
     """Parse a date like ``Month DD, YYYY`` into ``YYYY-MM-DD``."""
-    if not date_string:
-        return None
-    try:
-        dt = datetime.strptime(date_string, "%B %d, %Y")
-        return dt.strftime("%Y-%m-%d")
-    except ValueError:
-        print(f"Warning: Could not parse date '{date_string}'")
-        return None
+    parsed = parse_month_day_year(date_string)
+    if parsed is None and date_string:
+        warn_unparsed_date(date_string)
+    return parsed
 
 def parse_float(value):
     """Parse a float value, returning ``None`` when empty or invalid."""
@@ -102,6 +107,14 @@ def _iter_json_entries(file_handle, error_state):
                 print(f"Line content: {line[:100]}...")
 
 
+def _iter_insert_payloads(entries, chunk_size=PAYLOAD_CHUNK_SIZE):
+    """Pair each parsed entry with its insert values, converted a chunk at a time."""
+    iterator = iter(entries)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        batch = ApplicantBatch.from_rows(item["data"] for item in chunk)
+        yield from zip(chunk, batch.insert_rows(parse_date, parse_float))
+
+
 def _handle_insert_error(entry, _index, error, total_errors, error_state):
     """Track and report insert errors from insert_entries callback."""
     error_state["error_count"] += 1
@@ -126,15 +139,15 @@ def load_data_from_jsonl(connection, jsonl_file):
         print(f"Detected file encoding: {encoding}")
 
         with open(jsonl_file, 'r', encoding=encoding) as file_handle:
-            entries = _iter_json_entries(file_handle, error_state)
+            entries = _iter_insert_payloads(_iter_json_entries(file_handle, error_state))
             # insert_entries centralizes batch commit and rollback behavior.
             inserted_count, _insert_error_count = insert_entries(
                 connection,
                 entries,
-                lambda item: build_insert_values(item["data"], parse_date, parse_float),
+                lambda pair: pair[1],
                 InsertEntriesOptions(
-                    on_insert_error=lambda item, index, error, count: _handle_insert_error(
-                        item, index, error, count, error_state
+                    on_insert_error=lambda pair, index, error, count: _handle_insert_error(
+                        pair[0], index, error, count, error_state
                     ),
                     on_progress=lambda _index, inserted, _errors: print(
                         f"Inserted {inserted} records..."
@@ -2,20 +2,47 @@
 
 from __future__ import annotations
 
+import time
+
 from app import data_cleaning, scrape_support
 
 
+BACKFILL_PAGES = 1600
+RAW_DATA_FILE = "applicant_data.ndjson"
+
+
 def main() -> None:
     """Run the raw scrape step followed by the clean step."""
     print("Starting scraping process...")
     print(scrape_support.check_robots_allowed(scrape_support.BASE_URL))
 
-    raw_data = scrape_support.scrape_data(pages=1600)
-    scrape_support.save_data(raw_data, "applicant_data.json")
-    print(f"Scraping complete: {len(raw_data)} records saved to applicant_data.json")
+    workers = scrape_support.SCRAPE_WORKERS
+    stats = scrape_support.PipelineStats()
+    started = time.perf_counter()
+    # Stream pages to disk with a checkpoint so a rerun resumes after a crash.
+    record_count = scrape_support.backfill_data(
+        pages=BACKFILL_PAGES, filename=RAW_DATA_FILE, workers=workers, stats=stats
+    )
+    elapsed = time.perf_counter() - started
+    pages_per_second = BACKFILL_PAGES / elapsed if elapsed > 0 else 0.0
+    print(f"Scraping complete: {record_count} records saved to {RAW_DATA_FILE}")
+    print(
+        f"Fetched {BACKFILL_PAGES} pages in {elapsed:.1f}s "
+        f"({pages_per_second:.2f} pages/s, {workers} workers)"
+    )
+    # Summed stage time shows whether fetching, parsing, or writing is the bottleneck.
+    print(
+        f"Stage seconds: fetch {stats.fetch_seconds:.1f}, parse {stats.parse_seconds:.1f}, "
+        f"parse waiting {stats.parse_wait_seconds:.1f}, write {stats.consume_seconds:.1f}; "
+        f"max HTML queue depth {stats.max_html_queue_depth}"
+    )
 
     print("\nStarting cleaning process...")
-    loaded = data_cleaning.load_data("applicant_data.json")
-    cleaned = data_cleaning.clean_data(loaded)
+    loaded = data_cleaning.load_ndjson(RAW_DATA_FILE)
+    # Large backfills are cleaned in chunks across processes, small ones in-process.
+    interner = data_cleaning.FieldInterner()
+    cleaned = list(data_cleaning.iter_clean_parallel(loaded, interner=interner))
     data_cleaning.save_data(cleaned, "cleaned_applicant_data.json")
     print(f"Cleaning complete: {len(cleaned)} records saved to cleaned_applicant_data.json")
+    distinct = ", ".join(f"{key} {count}" for key, count in interner.stats().items())
+    print(f"Distinct values shared across rows: {distinct}")
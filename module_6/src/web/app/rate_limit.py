@@ -0,0 +1,133 @@
+"""Per-host request pacing with AIMD concurrency control for the scrape fetchers."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+
+# Ceiling and starting point for requests per second to a single host.
+MAX_RATE = float(os.getenv("SCRAPE_MAX_RATE", "10"))
+START_RATE = float(os.getenv("SCRAPE_START_RATE", "2"))
+MIN_RATE = 0.1
+RATE_STEP = 0.5
+DECREASE = 0.5
+BACKOFF_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: str | None, now: Callable[[], float] = time.time) -> float:
+    """Return the Retry-After delay in seconds from a delta or HTTP-date header."""
+    if not value:
+        return 0.0
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, retry_at - now())
+
+
+@dataclass
+class PacingPolicy:
+    """Bounds the limiter adapts within."""
+
+    max_concurrency: int = 1
+    max_rate: float = MAX_RATE
+    start_rate: float = START_RATE
+
+
+@dataclass
+class _HostBucket:
+    """Token bucket of capacity one: requests are spaced ``1 / rate`` apart."""
+
+    rate: float
+    max_rate: float
+    next_at: float = 0.0
+    paused_until: float = 0.0
+
+
+class AimdLimiter:
+    """Pace each host with a token bucket and adapt concurrency with AIMD.
+
+    Healthy responses raise the request rate and the concurrency window
+    additively; 429/503 responses and transport errors cut both
+    multiplicatively, and a Retry-After header pauses the host outright.
+    """
+
+    def __init__(
+        self,
+        policy: PacingPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.policy = policy or PacingPolicy()
+        self.concurrency = 1.0
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, _HostBucket] = {}
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            max_rate = self.policy.max_rate
+            bucket = _HostBucket(min(self.policy.start_rate, max_rate), max_rate)
+            self._buckets[host] = bucket
+        return bucket
+
+    def set_crawl_delay(self, host: str, delay: float | None) -> None:
+        """Cap a host's rate so requests are at least robots.txt Crawl-delay apart."""
+        if not delay:
+            return
+        with self._cond:
+            bucket = self._bucket(host)
+            bucket.max_rate = min(self.policy.max_rate, 1.0 / float(delay))
+            bucket.rate = min(bucket.rate, bucket.max_rate)
+
+    def acquire(self, host: str) -> None:
+        """Block until a concurrency slot is free and the host's next token is due."""
+        with self._cond:
+            while self._in_flight >= int(self.concurrency):
+                self._cond.wait()
+            self._in_flight += 1
+            bucket = self._bucket(host)
+            now = self._clock()
+            # Reserve the slot under the lock so concurrent callers queue in order.
+            start = max(now, bucket.next_at, bucket.paused_until)
+            bucket.next_at = start + 1.0 / bucket.rate
+        if start > now:
+            self._sleep(start - now)
+
+    def release(self, host: str, status: int | None, retry_after: str | None = None) -> bool:
+        """Record one response (``None`` for a transport error); True means back off."""
+        backoff = status is None or status in BACKOFF_STATUSES
+        with self._cond:
+            self._in_flight -= 1
+            bucket = self._bucket(host)
+            if backoff:
+                self.concurrency = max(1.0, self.concurrency * DECREASE)
+                bucket.rate = max(MIN_RATE, bucket.rate * DECREASE)
+                delay = parse_retry_after(retry_after)
+                if delay:
+                    bucket.paused_until = max(bucket.paused_until, self._clock() + delay)
+            else:
+                # Grow by roughly one slot per window of healthy responses.
+                self.concurrency = min(
+                    float(self.policy.max_concurrency), self.concurrency + 1.0 / self.concurrency
+                )
+                bucket.rate = min(bucket.max_rate, bucket.rate + RATE_STEP)
+            self._cond.notify_all()
+        return backoff
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Return the current total request rate and concurrency window."""
+        with self._cond:
+            rate = sum(bucket.rate for bucket in self._buckets.values())
+            return {"rate": round(rate, 2), "concurrency": int(self.concurrency)}
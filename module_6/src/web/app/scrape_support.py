@@ -2,16 +2,49 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import multiprocessing
+import os
+import queue
 import re
+import tempfile
+import threading
+import time
 import urllib.robotparser
-from urllib.request import Request, urlopen
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import chain
+from typing import Callable, Iterable, Iterator, NamedTuple
+from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup
+from lxml import etree
+
+from app.http_session import FetchSession, cache_from_env
+from app.rate_limit import AimdLimiter, PacingPolicy
+from applicant_record import ApplicantRecord, to_json
 
 
 HEADERS = {"User-Agent": "Mozilla/5.0"}
-BASE_URL = "https://www.thegradcafe.com/survey/"
+# Overridable so scrapers can target a local stand-in such as benchmarks/standin_server.py.
+BASE_URL = os.getenv("GRADCAFE_BASE_URL", "https://www.thegradcafe.com/survey/")
+# Concurrent page fetches used by backfills; 1 keeps the original serial behavior.
+SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS", "4"))
+# Parser processes for backfills; 1 parses inline on the consuming thread.
+PARSE_WORKERS = int(os.getenv("SCRAPE_PARSE_WORKERS", str(os.cpu_count() or 1)))
+# Fetched pages allowed to wait for a parser before fetchers block.
+HTML_QUEUE_SIZE = int(os.getenv("SCRAPE_QUEUE_SIZE", "32"))
+# Paces each host and widens concurrency up to the worker count while healthy.
+LIMITER = AimdLimiter(PacingPolicy(max_concurrency=SCRAPE_WORKERS))
+# One keep-alive session for all survey fetches so pages reuse open connections.
+SESSION = FetchSession(headers=HEADERS, cache=cache_from_env(), limiter=LIMITER)
+# Per-page table fingerprints from the last pull; an empty value disables skipping.
+FINGERPRINT_PATH = os.getenv(
+    "SCRAPE_FINGERPRINT_PATH",
+    os.path.join(tempfile.gettempdir(), "gradcafe_page_fingerprints.json"),
+)
 
 
 def _check_robots_allowed(base_url: str, user_agent: str = "Mozilla/5.0") -> str:
@@ -19,6 +52,7 @@ def _check_robots_allowed(base_url: str, user_agent: str = "Mozilla/5.0") -> str
     parser = urllib.robotparser.RobotFileParser()
     parser.set_url("https://www.thegradcafe.com/robots.txt")
     parser.read()
+    LIMITER.set_crawl_delay(urlsplit(base_url).netloc, parser.crawl_delay(user_agent))
     if parser.can_fetch(user_agent, base_url):
         return f"Scraping is ALLOWED for {base_url} according to robots.txt."
     return f"Scraping is DISALLOWED for {base_url} according to robots.txt."
@@ -31,9 +65,17 @@ def check_robots_allowed(base_url: str, user_agent: str = "Mozilla/5.0") -> str:
 
 def _fetch_html(url: str) -> str:
     """Fetch one survey page and return the decoded HTML body."""
-    request = Request(url, headers=HEADERS)
-    with urlopen(request) as response:
-        return response.read().decode("utf-8")
+    return SESSION.fetch_text(url)
+
+
+def cache_stats() -> dict[str, int]:
+    """Return conditional-GET cache hit/miss counters for the shared session."""
+    return SESSION.cache_stats()
+
+
+def limiter_stats() -> dict[str, float | int]:
+    """Return the shared limiter's current request rate and concurrency window."""
+    return SESSION.limiter_stats()
 
 
 def fetch_html(url: str) -> str:
@@ -41,126 +83,657 @@ def fetch_html(url: str) -> str:
     return _fetch_html(url)
 
 
-def _parse_page(html: str) -> list[dict]:
-    """Parse one GradCafe survey page into structured applicant rows."""
+# Shape of one summary <tr>: university, program, degree, date, status text, link.
+class _SummaryRow(NamedTuple):
+    university: str
+    program_name: str
+    degree_type: str
+    date_added: str
+    status_text: str
+    href: str | None
+
+
+# Shape of one "tw-border-none" detail <tr> that follows a summary row.
+class _DetailRow(NamedTuple):
+    text: str
+    comments: str | None
+
+
+ACCEPTED_RE = re.compile(r"Accepted on (.+)")
+REJECTED_RE = re.compile(r"Rejected on (.+)")
+RESULT_LINK_RE = re.compile(r"/result/")
+RESULT_ID_RE = re.compile(r"/result/(\d+)")
+TBODY_RE = re.compile(r"<tbody\b[^>]*>(.*?)</tbody>", re.IGNORECASE | re.DOTALL)
+TERM_RE = re.compile(r"(Fall|Spring|Summer)\s+\d{4}")
+GPA_RE = re.compile(r"GPA\s*[:]?[\s]*([\d.]+)")
+GRE_RE = re.compile(r"GRE\s*[:]?[\s]*([\d]{3})")
+GRE_V_RE = re.compile(r"V\s*[:]?[\s]*([\d]{2,3})")
+GRE_AW_RE = re.compile(r"AW\s*[:]?[\s]*([\d.]+)")
+# Characters handed to the lxml pull parser per feed() call.
+LXML_FEED_CHUNK = 16384
+# Any start or end tag, with a trailing "/" for self-closed ones.
+ROW_TAG_RE = re.compile(r"<(/?)([a-z][^\s/>]*)([^>]*)>", re.IGNORECASE)
+# Elements without end tags.
+VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+)
+# The only child libxml2 leaves in place directly under each table element.
+ROW_CHILD_TAGS = {"tbody": "tr", "tr": "td"}
+# Tags that make libxml2 end a cell or the table, or read the rest as raw text.
+TABLE_BREAKING_TAGS = frozenset(
+    {
+        "table", "thead", "tbody", "tfoot", "caption", "colgroup", "col", "th",
+        "textarea", "title", "xmp", "plaintext", "iframe", "noembed", "noframes",
+        "template", "html", "head", "body",
+    }
+)
+# Block tags that make libxml2 close an open <p> early.
+P_CLOSING_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "center", "dd", "details", "dir",
+        "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form",
+        "h1", "h2", "h3", "h4", "h5", "h6", "header", "hgroup", "hr", "li", "main",
+        "menu", "nav", "ol", "p", "pre", "section", "summary", "ul",
+    }
+)
+# get_text() leaves these out; lxml's itertext() would not.
+LXML_SKIPPED_TEXT_TAGS = frozenset({"script", "style"})
+
+
+def _soup_rows(html: str) -> Iterator[_SummaryRow | _DetailRow | None]:
+    """Yield table rows using BeautifulSoup with the pure-Python html.parser."""
     soup = BeautifulSoup(html, "html.parser")
     tbody = soup.find("tbody")
     if not tbody:
-        return []
-
-    rows = tbody.find_all("tr", recursive=False)
-    results: list[dict] = []
-
-    index = 0
-    while index < len(rows):
-        row = rows[index]
+        return
 
+    for row in tbody.find_all("tr", recursive=False):
         if "tw-border-none" in row.get("class", []):
-            index += 1
+            paragraph = row.find("p")
+            yield _DetailRow(
+                row.get_text(" ", strip=True),
+                paragraph.get_text(strip=True) if paragraph else None,
+            )
             continue
 
         cols = row.find_all("td", recursive=False)
         if len(cols) < 4:
-            index += 1
+            yield None
             continue
 
-        university = cols[0].get_text(strip=True)
         spans = cols[1].find_all("span")
-        program_name = spans[0].get_text(strip=True) if spans else ""
-        degree_type = spans[1].get_text(strip=True) if len(spans) > 1 else ""
-        program = f"{program_name}, {university}"
-        date_added = cols[2].get_text(strip=True)
-
-        status_text = cols[3].get_text(" ", strip=True)
-        applicant_status = ""
-        decision_date = ""
-        if "Accepted" in status_text:
-            applicant_status = "Accepted"
-            match = re.search(r"Accepted on (.+)", status_text)
-            decision_date = match.group(1) if match else ""
-        elif "Rejected" in status_text:
-            applicant_status = "Rejected"
-            match = re.search(r"Rejected on (.+)", status_text)
-            decision_date = match.group(1) if match else ""
-
-        link = row.find("a", href=re.compile(r"/result/"))
-        entry_url = "https://www.thegradcafe.com" + link["href"] if link else ""
-
-        comments = ""
-        term = ""
-        citizenship = ""
-        gre_total = ""
-        gre_v = ""
-        gre_aw = ""
-        gpa = ""
-
-        detail_index = index + 1
-        while detail_index < len(rows) and "tw-border-none" in rows[detail_index].get("class", []):
-            text = rows[detail_index].get_text(" ", strip=True)
-            paragraph = rows[detail_index].find("p")
-            if paragraph:
-                comments = paragraph.get_text(strip=True)
-
-            match = re.search(r"(Fall|Spring|Summer)\s+\d{4}", text)
-            if match:
-                term = match.group(0)
-            if "American" in text:
-                citizenship = "American"
-            elif "International" in text:
-                citizenship = "International"
-
-            match = re.search(r"GPA\s*[:]?[\s]*([\d.]+)", text)
-            if match:
-                gpa = match.group(1)
-            match = re.search(r"GRE\s*[:]?[\s]*([\d]{3})", text)
-            if match:
-                gre_total = match.group(1)
-            match = re.search(r"V\s*[:]?[\s]*([\d]{2,3})", text)
-            if match:
-                gre_v = match.group(1)
-            match = re.search(r"AW\s*[:]?[\s]*([\d.]+)", text)
-            if match:
-                gre_aw = match.group(1)
-
-            detail_index += 1
-
-        results.append(
-            {
-                "program": program,
-                "comments": comments,
-                "date_added": date_added,
-                "url": entry_url,
-                "status": applicant_status,
-                "decision_date": decision_date,
-                "term": term,
-                "US/International": citizenship,
-                "GRE_SCORE": gre_total,
-                "GRE_V": gre_v,
-                "GRE_AW": gre_aw,
-                "GPA": gpa,
-                "Degree": degree_type,
-            }
+        link = row.find("a", href=RESULT_LINK_RE)
+        yield _SummaryRow(
+            university=cols[0].get_text(strip=True),
+            program_name=spans[0].get_text(strip=True) if spans else "",
+            degree_type=spans[1].get_text(strip=True) if len(spans) > 1 else "",
+            date_added=cols[2].get_text(strip=True),
+            status_text=cols[3].get_text(" ", strip=True),
+            href=link["href"] if link else None,
         )
-        index = detail_index
 
-    return results
 
+def _lxml_strings(element) -> Iterator[str]:
+    """Yield an element's text nodes in document order, minus script/style/comments."""
+    if isinstance(element.tag, str) and element.tag not in LXML_SKIPPED_TEXT_TAGS:
+        if element.text:
+            yield element.text
+        for child in element:
+            yield from _lxml_strings(child)
+            if child.tail:
+                yield child.tail
 
-def parse_page(html: str) -> list[dict]:
-    """Public wrapper for parsing one survey page."""
-    return _parse_page(html)
 
+def _lxml_text(element, separator: str = "") -> str:
+    """Match BeautifulSoup ``get_text(separator, strip=True)`` for an lxml element."""
+    return separator.join(text.strip() for text in _lxml_strings(element) if text.strip())
 
-def scrape_data(pages: int = 5) -> list[dict]:
-    """Scrape a fixed number of GradCafe survey pages."""
-    data: list[dict] = []
-    for page in range(1, pages + 1):
+
+def _lxml_row(row) -> _SummaryRow | _DetailRow | None:
+    """Convert one complete lxml ``<tr>`` element into a backend row shape."""
+    if "tw-border-none" in row.get("class", "").split():
+        paragraph = next(row.iter("p"), None)
+        return _DetailRow(
+            _lxml_text(row, " "),
+            _lxml_text(paragraph) if paragraph is not None else None,
+        )
+
+    cols = list(row.iterchildren("td"))
+    if len(cols) < 4:
+        return None
+
+    spans = list(cols[1].iter("span"))
+    link = next(
+        (a for a in row.iter("a") if RESULT_LINK_RE.search(a.get("href", ""))),
+        None,
+    )
+    return _SummaryRow(
+        university=_lxml_text(cols[0]),
+        program_name=_lxml_text(spans[0]) if spans else "",
+        degree_type=_lxml_text(spans[1]) if len(spans) > 1 else "",
+        date_added=_lxml_text(cols[2]),
+        status_text=_lxml_text(cols[3], " "),
+        href=link.get("href") if link is not None else None,
+    )
+
+
+def _rows_well_nested(html: str) -> bool:
+    """Return True when every tag in the first tbody is explicitly closed in order.
+
+    libxml2 repairs markup that html.parser takes literally: it closes an
+    unclosed ``<td>``, ``<tr>`` or ``<p>`` when a sibling or block starts, moves
+    anything but ``<tr>`` directly inside ``<tbody>`` (or ``<td>`` inside
+    ``<tr>``) out of the table, and ends a cell or the table at a nested
+    ``<table>``-level tag. A tbody with none of these builds the same tree, and
+    so the same rows, in both.
+    """
+    start = html.lower().find("<tbody")
+    if start < 0:
+        return True
+    open_tags: list[str] = []
+    for match in ROW_TAG_RE.finditer(html, start):
+        closing, tag = match.group(1), match.group(2).lower()
+        if closing:
+            if not open_tags or open_tags.pop() != tag:
+                return False
+            if not open_tags:
+                return True
+            continue
+        if open_tags and (
+            tag in TABLE_BREAKING_TAGS
+            or ROW_CHILD_TAGS.get(open_tags[-1], tag) != tag
+            or (tag in P_CLOSING_TAGS and "p" in open_tags)
+        ):
+            return False
+        if not match.group(3).endswith("/"):
+            if tag not in VOID_TAGS:
+                open_tags.append(tag)
+        elif tag in ROW_CHILD_TAGS.values():
+            # html.parser closes a self-closed <tr/> or <td/>; libxml2 opens it.
+            return False
+    return False
+
+
+def _lxml_rows(html: str) -> Iterator[_SummaryRow | _DetailRow | None]:
+    """Yield table rows from libxml2 incrementally, as each ``</tr>`` is parsed.
+
+    The page is fed to a pull parser in chunks, so a caller that stops early
+    (for example at the watermark URL) skips parsing the rest of the page.
+    A tbody that libxml2 would repair differently (see ``_rows_well_nested``),
+    or a table it cannot find, is handed to html.parser instead.
+    """
+    if not html:
+        return
+    if not _rows_well_nested(html):
+        yield from _soup_rows(html)
+        return
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    tbody = None
+    chunks = (
+        html[offset:offset + LXML_FEED_CHUNK] for offset in range(0, len(html), LXML_FEED_CHUNK)
+    )
+    for chunk in chain(chunks, [None]):
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+        for event, element in parser.read_events():
+            if tbody is None:
+                if event == "start" and element.tag == "tbody":
+                    tbody = element
+            elif element is tbody:
+                return
+            elif event == "end" and element.tag == "tr" and element.getparent() is tbody:
+                yield _lxml_row(element)
+    if tbody is None and "<tbody" in html.lower():
+        # Broken markup before the table (e.g. an unclosed <title>) hid it from libxml2.
+        yield from _soup_rows(html)
+
+
+# Parser backends selectable by name; all must yield identical row shapes.
+PARSER_BACKENDS: dict[str, Callable[[str], Iterator[_SummaryRow | _DetailRow | None]]] = {
+    "html.parser": _soup_rows,
+    "lxml": _lxml_rows,
+}
+PARSER_BACKEND = os.getenv("SCRAPE_PARSER", "html.parser")
+
+
+def _summary_entry(row: _SummaryRow) -> ApplicantRecord:
+    """Start one applicant entry from a summary row."""
+    applicant_status = ""
+    decision_date = ""
+    if "Accepted" in row.status_text:
+        applicant_status = "Accepted"
+        match = ACCEPTED_RE.search(row.status_text)
+        decision_date = match.group(1) if match else ""
+    elif "Rejected" in row.status_text:
+        applicant_status = "Rejected"
+        match = REJECTED_RE.search(row.status_text)
+        decision_date = match.group(1) if match else ""
+
+    return ApplicantRecord(
+        program=f"{row.program_name}, {row.university}",
+        comments="",
+        date_added=row.date_added,
+        url="https://www.thegradcafe.com" + row.href if row.href else "",
+        status=applicant_status,
+        decision_date=decision_date,
+        term="",
+        us_or_international="",
+        gre="",
+        gre_v="",
+        gre_aw="",
+        gpa="",
+        degree=row.degree_type,
+    )
+
+
+def _apply_detail(entry: ApplicantRecord, row: _DetailRow) -> None:
+    """Fold one detail row's comments, term, citizenship, and scores into an entry."""
+    text = row.text
+    if row.comments is not None:
+        entry.comments = row.comments
+
+    match = TERM_RE.search(text)
+    if match:
+        entry.term = match.group(0)
+    if "American" in text:
+        entry.us_or_international = "American"
+    elif "International" in text:
+        entry.us_or_international = "International"
+
+    for attribute, pattern in (
+        ("gpa", GPA_RE),
+        ("gre", GRE_RE),
+        ("gre_v", GRE_V_RE),
+        ("gre_aw", GRE_AW_RE),
+    ):
+        match = pattern.search(text)
+        if match:
+            setattr(entry, attribute, match.group(1))
+
+
+def _build_entries(
+    rows: Iterable[_SummaryRow | _DetailRow | None],
+) -> Iterator[ApplicantRecord]:
+    """Group each summary row with the detail rows that follow it."""
+    entry: ApplicantRecord | None = None
+    for row in rows:
+        if isinstance(row, _DetailRow):
+            # Detail rows only belong to an immediately preceding summary row.
+            if entry is not None:
+                _apply_detail(entry, row)
+            continue
+        if entry is not None:
+            yield entry
+        entry = _summary_entry(row) if row is not None else None
+    if entry is not None:
+        yield entry
+
+
+def iter_page_entries(html: str, backend: str | None = None) -> Iterator[ApplicantRecord]:
+    """Yield applicant entries from one survey page, one row group at a time."""
+    name = backend or PARSER_BACKEND
+    if name not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend {name!r}; expected one of {sorted(PARSER_BACKENDS)}"
+        )
+    if "\r" in html:
+        # libxml2 normalizes CR/CRLF while parsing; do it up front for every backend.
+        html = html.replace("\r\n", "\n").replace("\r", "\n")
+    return _build_entries(PARSER_BACKENDS[name](html))
+
+
+def _parse_page(html: str, backend: str | None = None) -> list[ApplicantRecord]:
+    """Parse one GradCafe survey page into structured applicant rows."""
+    return list(iter_page_entries(html, backend))
+
+
+def parse_page(html: str, backend: str | None = None) -> list[ApplicantRecord]:
+    """Public wrapper for parsing one survey page."""
+    return _parse_page(html, backend)
+
+
+def fetch_pages_in_order(
+    fetch_page: Callable[[int], str], page_numbers: Iterable[int], workers: int = 1
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(page, html)`` in page order, running up to ``workers`` fetches at once."""
+    if workers <= 1:
+        for page in page_numbers:
+            yield page, fetch_page(page)
+        return
+
+    # Keep a bounded window of in-flight fetches so results stay ordered and
+    # memory does not grow with the total page count.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        for page in page_numbers:
+            pending.append((page, executor.submit(fetch_page, page)))
+            if len(pending) >= workers * 2:
+                done_page, future = pending.popleft()
+                yield done_page, future.result()
+        while pending:
+            done_page, future = pending.popleft()
+            yield done_page, future.result()
+
+
+def _iter_page_html(page_numbers: Iterable[int], workers: int = 1) -> Iterator[tuple[int, str]]:
+    """Yield ``(page, html)`` for survey pages fetched through ``_fetch_html``."""
+    return fetch_pages_in_order(
+        lambda page: _fetch_html(f"{BASE_URL}?page={page}"), page_numbers, workers
+    )
+
+
+def result_id(url: str | None) -> int | None:
+    """Return the numeric id of a ``/result/<id>`` URL; ids grow with submission order."""
+    match = RESULT_ID_RE.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+def locate_watermark_page(
+    fetch_page: Callable[[int], str],
+    iter_entries: Callable[[str], Iterator[ApplicantRecord | dict]],
+    watermark_url: str,
+) -> tuple[int | None, dict[int, str]]:
+    """Find the first page holding ``watermark_url`` or anything older than it.
+
+    Survey pages list results newest first, so probing pages 1, 2, 4, 8, ...
+    brackets the watermark in a logarithmic number of fetches and a binary
+    search over result ids narrows the bracket. Returns the page and the HTML
+    of every probed page, or ``(None, {})`` when the watermark has no id.
+    ``iter_entries`` may yield records or the entry dicts of legacy scrapers.
+    """
+    target_id = result_id(watermark_url)
+    probed: dict[int, str] = {}
+    if target_id is None:
+        return None, probed
+
+    def reaches_watermark(page: int) -> bool:
+        html = probed[page] = fetch_page(page)
+        seen_entries = False
+        for entry in iter_entries(html):
+            entry_id = result_id(entry.get("url"))
+            if entry_id is not None and entry_id <= target_id:
+                return True
+            seen_entries = True
+        # An empty page is past the end of the survey, so nothing older remains.
+        return not seen_entries
+
+    newer_page, probe = 0, 1
+    while not reaches_watermark(probe):
+        newer_page, probe = probe, probe * 2
+    low, high = newer_page + 1, probe
+    while low < high:
+        middle = (low + high) // 2
+        if reaches_watermark(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return high, probed
+
+
+def page_fingerprint(html: str) -> str | None:
+    """Hash the survey table body, ignoring ads and page chrome around it.
+
+    Returns None for pages without result rows so empty pages are never skipped.
+    """
+    match = TBODY_RE.search(html)
+    if match is None or "<tr" not in match.group(1):
+        return None
+    return hashlib.sha256(match.group(1).encode("utf-8")).hexdigest()
+
+
+class PageFingerprints:
+    """Table-body hashes per survey page from the last completed pull.
+
+    ``unchanged`` compares against the saved hashes and stages new ones;
+    ``save`` persists staged hashes once the pulled rows are safely stored.
+    Hashes are saved with an opaque ``db_state`` token (for example the row
+    count and highest id) and are only trusted while the database still
+    reports the same token, so a reset or restored table is pulled again.
+    """
+
+    def __init__(self, path: str | None = FINGERPRINT_PATH, db_state: str | None = None) -> None:
+        self.path = path
+        self.db_state = db_state
+        self.known: dict[str, str] = {}
+        self.pending: dict[str, str] = {}
+        self.skipped = 0
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as file_handle:
+                    stored = json.load(file_handle)
+            except (OSError, ValueError):
+                stored = {}
+            if isinstance(stored, dict) and stored.get("db_state") == db_state:
+                self.known = dict(stored.get("pages") or {})
+
+    def unchanged(self, page_url: str, html: str) -> bool:
+        """Return True when the page body matches the saved fingerprint."""
+        digest = page_fingerprint(html)
+        if digest is None:
+            return False
+        if self.known.get(page_url) == digest:
+            self.skipped += 1
+            return True
+        self.pending[page_url] = digest
+        return False
+
+    def save(self, db_state: str | None = None) -> None:
+        """Merge staged fingerprints and atomically rewrite the store for ``db_state``."""
+        self.known.update(self.pending)
+        self.pending.clear()
+        self.db_state = db_state
+        if not self.path:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file_handle:
+            json.dump({"db_state": db_state, "pages": self.known}, file_handle)
+        os.replace(temp_path, self.path)
+
+
+def load_fingerprints(db_state: str | None = None) -> PageFingerprints:
+    """Load the SCRAPE_FINGERPRINT_PATH store, trusting it only for ``db_state``."""
+    return PageFingerprints(FINGERPRINT_PATH, db_state)
+
+
+@dataclass
+class PipelineStats:
+    """Live per-stage timings and queue depth for ``scrape_pages``.
+
+    Seconds are summed across the threads or processes of a stage, so compare
+    them against each other: the stage with the largest share is the bottleneck,
+    and a high ``parse_wait_seconds`` means parsers are starved by fetching.
+    """
+
+    pages: int = 0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    parse_wait_seconds: float = 0.0
+    consume_seconds: float = 0.0
+    html_queue_depth: int = 0
+    max_html_queue_depth: int = 0
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the counters with seconds rounded for progress reports."""
+        return {
+            key: round(value, 3) if isinstance(value, float) else value
+            for key, value in asdict(self).items()
+        }
+
+
+def _timed_parse(html: str, backend: str | None) -> tuple[list[ApplicantRecord], float]:
+    """Parse one page into records and report how long it took (runs in parser processes)."""
+    started = time.perf_counter()
+    entries = _parse_page(html, backend)
+    return entries, time.perf_counter() - started
+
+
+_END_OF_PAGES = object()
+
+
+def scrape_pages(
+    page_numbers: Iterable[int],
+    fetch_workers: int = 1,
+    parse_workers: int = 1,
+    stats: PipelineStats | None = None,
+) -> Iterator[tuple[int, list[ApplicantRecord]]]:
+    """Yield ``(page, records)`` in page order from a fetch -> parse pipeline.
+
+    Fetcher threads push raw HTML into a bounded queue and a process pool parses
+    it, so I/O and GIL-bound parsing overlap. The caller's loop body is the
+    consume stage; ``stats`` is updated as pages move through.
+    """
+    stats = stats if stats is not None else PipelineStats()
+    html_queue: queue.Queue = queue.Queue(maxsize=HTML_QUEUE_SIZE)
+    stop = threading.Event()
+    fetch_lock = threading.Lock()
+
+    def fetch_page(page: int) -> str:
+        started = time.perf_counter()
         html = _fetch_html(f"{BASE_URL}?page={page}")
+        with fetch_lock:
+            stats.fetch_seconds += time.perf_counter() - started
+        return html
+
+    def put(item) -> bool:
+        # Give up once the consumer has stopped so the producer can exit.
+        while not stop.is_set():
+            try:
+                html_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in fetch_pages_in_order(fetch_page, page_numbers, fetch_workers):
+                if not put(item):
+                    return
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # Hand fetch failures to the consumer, which re-raises them in order.
+            put(error)
+            return
+        put(_END_OF_PAGES)
+
+    backend = PARSER_BACKEND
+    # Spawned workers start from a clean interpreter even though fetchers are running.
+    pool = (
+        ProcessPoolExecutor(parse_workers, mp_context=multiprocessing.get_context("spawn"))
+        if parse_workers > 1
+        else None
+    )
+
+    def submit(html: str) -> Future:
+        if pool is not None:
+            return pool.submit(_timed_parse, html, backend)
+        future: Future = Future()
+        future.set_result(_timed_parse(html, backend))
+        return future
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    pending: deque = deque()
+    window = parse_workers * 2 if pool is not None else 1
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < window:
+                started = time.perf_counter()
+                item = html_queue.get()
+                stats.parse_wait_seconds += time.perf_counter() - started
+                stats.html_queue_depth = html_queue.qsize()
+                stats.max_html_queue_depth = max(
+                    stats.max_html_queue_depth, stats.html_queue_depth + 1
+                )
+                if isinstance(item, Exception):
+                    raise item
+                if item is _END_OF_PAGES:
+                    exhausted = True
+                    break
+                page, html = item
+                pending.append((page, submit(html)))
+            if not pending:
+                return
+            page, future = pending.popleft()
+            entries, parse_seconds = future.result()
+            stats.parse_seconds += parse_seconds
+            stats.pages += 1
+            started = time.perf_counter()
+            yield page, entries
+            stats.consume_seconds += time.perf_counter() - started
+    finally:
+        stop.set()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        producer.join()
+
+
+def scrape_data(pages: int = 5, workers: int = 1) -> list[ApplicantRecord]:
+    """Scrape a fixed number of survey pages into records, optionally fetching concurrently."""
+    data: list[ApplicantRecord] = []
+    for _page, html in _iter_page_html(range(1, pages + 1), workers):
         data.extend(_parse_page(html))
     return data
 
 
-def save_data(data: list[dict], filename: str = "applicant_data.json") -> None:
-    """Persist scraped raw data to JSON."""
+def _load_checkpoint(checkpoint_path: str, filename: str) -> dict[str, int]:
+    """Return the saved backfill position, or a fresh one if it cannot be trusted."""
+    fresh = {"last_page": 0, "offset": 0, "entries": 0}
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as file_handle:
+            state = json.load(file_handle)
+    except (OSError, ValueError):
+        return fresh
+    # A missing or shortened output file means the recorded offset is stale.
+    size = os.path.getsize(filename) if os.path.exists(filename) else 0
+    if not isinstance(state, dict) or size < state.get("offset", 0):
+        return fresh
+    return {key: int(state.get(key, 0)) for key in fresh}
+
+
+def _save_checkpoint(checkpoint_path: str, state: dict[str, int]) -> None:
+    """Atomically replace the checkpoint so a crash never leaves it half-written."""
+    temp_path = f"{checkpoint_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file_handle:
+        json.dump(state, file_handle)
+    os.replace(temp_path, checkpoint_path)
+
+
+def backfill_data(
+    pages: int,
+    filename: str = "applicant_data.ndjson",
+    workers: int = 1,
+    checkpoint_path: str | None = None,
+    stats: PipelineStats | None = None,
+) -> int:
+    """Stream pages 1..pages to an NDJSON file, resuming from the last checkpoint.
+
+    Pages are fetched by ``workers`` threads and parsed by ``PARSE_WORKERS``
+    processes. Each completed page is appended and flushed before the checkpoint
+    records its page number and the file offset, so a restart truncates any
+    partial page and continues with the next one. Returns the total entries on disk.
+    """
+    checkpoint_path = checkpoint_path or f"{filename}.checkpoint"
+    state = _load_checkpoint(checkpoint_path, filename)
+    with open(filename, "ab") as file_handle:
+        file_handle.truncate(state["offset"])
+        page_numbers = range(state["last_page"] + 1, pages + 1)
+        for page, entries in scrape_pages(page_numbers, workers, PARSE_WORKERS, stats):
+            for entry in entries:
+                line = json.dumps(entry, ensure_ascii=False, default=to_json) + "\n"
+                file_handle.write(line.encode("utf-8"))
+                state["entries"] += 1
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+            state["last_page"] = page
+            state["offset"] = file_handle.tell()
+            _save_checkpoint(checkpoint_path, state)
+    return state["entries"]
+
+
+def save_data(data: list[ApplicantRecord], filename: str = "applicant_data.json") -> None:
+    """Persist scraped records to JSON as their original field-name dicts."""
     with open(filename, "w", encoding="utf-8") as file_handle:
-        json.dump(data, file_handle, indent=2, ensure_ascii=False)
+        json.dump(data, file_handle, indent=2, ensure_ascii=False, default=to_json)
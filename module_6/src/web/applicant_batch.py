@@ -0,0 +1,75 @@
+"""Column-per-field applicant batches converted to insert payloads a column at a time."""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
+from applicant_record import FIELDS, ApplicantRecord
+
+
+# applicants columns in INSERT_APPLICANTS_QUERY order, named by record attribute.
+INSERT_COLUMNS = (
+    "program",
+    "comments",
+    "date_added",
+    "url",
+    "status",
+    "term",
+    "us_or_international",
+    "gpa",
+    "gre",
+    "gre_v",
+    "gre_aw",
+    "degree",
+    "llm_generated_program",
+    "llm_generated_university",
+)
+FLOAT_COLUMNS = ("gpa", "gre", "gre_v", "gre_aw")
+
+
+def convert_column(values: list, convert: Callable[[Any], Any]) -> list:
+    """Apply ``convert`` once per distinct value and map the results over the column.
+
+    Scraped columns repeat a small set of values (GPAs, scores, posting dates),
+    so the Python-level conversion runs per distinct value rather than per row.
+    """
+    table = {value: convert(value) for value in set(values)}
+    return list(map(table.__getitem__, values))
+
+
+class ApplicantBatch:
+    """A run of applicant rows held as one list per field."""
+
+    def __init__(self, columns: dict[str, list]) -> None:
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[ApplicantRecord | dict]) -> ApplicantBatch:
+        """Transpose records (or legacy entry dicts) into per-field columns."""
+        records = [
+            row if isinstance(row, ApplicantRecord) else ApplicantRecord.from_dict(row)
+            for row in rows
+        ]
+        # One C-level attrgetter pass per column rather than a Python loop per row.
+        return cls({
+            attribute: list(map(attrgetter(attribute), records)) for attribute, _ in FIELDS
+        })
+
+    def __len__(self) -> int:
+        return len(self.columns["url"])
+
+    def insert_rows(
+        self,
+        parse_date_func: Callable[[Any], Any],
+        parse_float_func: Callable[[Any], Any],
+    ) -> list[tuple]:
+        """Return INSERT parameter tuples with dates and scores converted per column.
+
+        Values the parsers reject come back as None, i.e. NULL in the database.
+        """
+        columns = {name: self.columns[name] for name in INSERT_COLUMNS}
+        columns["date_added"] = convert_column(columns["date_added"], parse_date_func)
+        for name in FLOAT_COLUMNS:
+            columns[name] = convert_column(columns[name], parse_float_func)
+        return list(zip(*(columns[name] for name in INSERT_COLUMNS)))
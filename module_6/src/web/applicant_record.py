@@ -0,0 +1,102 @@
+"""Compact applicant row passed from scraping through cleaning to insert."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+# (attribute, JSON key) pairs in scraped-entry order; the JSON keys are the
+# legacy entry-dict keys, so files written from records read back unchanged.
+FIELDS = (
+    ("program", "program"),
+    ("comments", "comments"),
+    ("date_added", "date_added"),
+    ("url", "url"),
+    ("status", "status"),
+    ("decision_date", "decision_date"),
+    ("term", "term"),
+    ("us_or_international", "US/International"),
+    ("gre", "GRE_SCORE"),
+    ("gre_v", "GRE_V"),
+    ("gre_aw", "GRE_AW"),
+    ("gpa", "GPA"),
+    ("degree", "Degree"),
+    ("llm_generated_program", "llm-generated-program"),
+    ("llm_generated_university", "llm-generated-university"),
+)
+_ATTRIBUTE_BY_KEY = {key: attribute for attribute, key in FIELDS}
+
+
+class ApplicantRecord:
+    """One applicant row with a fixed field set and no per-row ``__dict__``.
+
+    ``None`` marks a field the source never set; it is left out of ``to_dict``.
+    ``get`` and ``[]`` accept the legacy JSON keys so code written against entry
+    dicts keeps working without converting.
+    """
+
+    __slots__ = tuple(attribute for attribute, _ in FIELDS)
+
+    def __init__(self, **values: Any) -> None:
+        for attribute in self.__slots__:
+            setattr(self, attribute, values.get(attribute))
+
+    @classmethod
+    def from_dict(cls, entry: dict[str, Any]) -> ApplicantRecord:
+        """Build a record from a legacy entry dict; unknown keys are dropped."""
+        return cls(**{attribute: entry.get(key) for attribute, key in FIELDS})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the legacy entry dict, omitting fields that were never set."""
+        return {
+            key: value
+            for (_, key), value in zip(FIELDS, self.__getstate__())
+            if value is not None
+        }
+
+    def map_strings(self, func: Callable[[str], Any]) -> ApplicantRecord:
+        """Return a copy with ``func`` applied to every string field."""
+        record = ApplicantRecord.__new__(ApplicantRecord)
+        record.__setstate__(
+            tuple(
+                func(value) if isinstance(value, str) else value
+                for value in self.__getstate__()
+            )
+        )
+        return record
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the field stored under a legacy JSON key, like ``dict.get``."""
+        attribute = _ATTRIBUTE_BY_KEY.get(key)
+        value = getattr(self, attribute) if attribute else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, attribute) for attribute in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for attribute, value in zip(self.__slots__, state):
+            setattr(self, attribute, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ApplicantRecord):
+            return NotImplemented
+        return self.__getstate__() == other.__getstate__()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ApplicantRecord({self.to_dict()!r})"
+
+
+def to_json(value: Any) -> Any:
+    """``json.dump`` default hook that writes records as their legacy dicts."""
+    if isinstance(value, ApplicantRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,69 @@
+"""Memoized ``Month DD, YYYY`` date parsing shared by the loaders and the worker."""
+
+from __future__ import annotations
+
+import calendar
+import functools
+import re
+
+
+# Distinct date strings remembered; a full backfill has a few hundred.
+DATE_CACHE_SIZE = 4096
+# Distinct bad values remembered for warning suppression before starting over.
+WARNED_VALUES_LIMIT = 1024
+
+MONTHS = {
+    name.lower(): number
+    for number, name in enumerate(
+        (
+            "January", "February", "March", "April", "May", "June", "July",
+            "August", "September", "October", "November", "December",
+        ),
+        start=1,
+    )
+}
+# Same shape strptime accepts for "%B %d, %Y": whitespace runs, 1-2 digit day.
+_DATE_PATTERN = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})")
+
+_warned_counts: dict[str, int] = {}
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_month_day_year(date_string: str) -> str | None:
+    match = _DATE_PATTERN.fullmatch(date_string)
+    if match is None:
+        return None
+    month = MONTHS.get(match.group(1).lower())
+    year, day = int(match.group(3)), int(match.group(2))
+    if month is None or year < 1 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def parse_month_day_year(date_string: str | None) -> str | None:
+    """Return ``YYYY-MM-DD`` for ``Month DD, YYYY`` text, or None when empty or invalid."""
+    if not date_string:
+        return None
+    return _parse_month_day_year(date_string)
+
+
+def warn_unparsed_date(date_string: str) -> None:
+    """Print a warning the first time a bad date is seen and count the repeats."""
+    if date_string in _warned_counts:
+        _warned_counts[date_string] += 1
+        return
+    if len(_warned_counts) >= WARNED_VALUES_LIMIT:
+        _warned_counts.clear()
+    _warned_counts[date_string] = 1
+    print(f"Warning: Could not parse date '{date_string}'")
+
+
+def date_parse_stats() -> dict[str, int]:
+    """Return memo cache hits/misses and how many bad-date warnings were suppressed."""
+    info = _parse_month_day_year.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "cached": info.currsize,
+        "suppressed_warnings": sum(_warned_counts.values()) - len(_warned_counts),
+    }
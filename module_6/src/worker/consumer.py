@@ -5,11 +5,23 @@ from __future__ import annotations
 import json
 import os
 import time
-from datetime import datetime
 
 import pika
 import psycopg
-from etl.scrape import BASE_URL, _fetch_html, _parse_page
+from etl.applicant_batch import ApplicantBatch
+from etl.applicant_insert import migrate_url_unique_index
+from etl.applicant_record import ApplicantRecord
+from etl.date_parsing import parse_month_day_year
+from etl.scrape import (
+    BASE_URL,
+    SCRAPE_WORKERS,
+    _fetch_html,
+    cache_stats,
+    fetch_pages_in_order,
+    iter_page_entries,
+    load_fingerprints,
+    locate_watermark_page,
+)
 from pika.exceptions import AMQPConnectionError
 
 EXCHANGE = "tasks"
@@ -20,24 +32,22 @@ RABBITMQ_CONNECT_RETRIES = 30
 RABBITMQ_CONNECT_DELAY_SECONDS = 2
 PULL_TASK_NAME = "scrape_new_data"
 ANALYTICS_TASK_NAME = "recompute_analytics"
+# Page walk limit when the watermark has no result id to search on.
+FALLBACK_MAX_PAGES = 10
 
 INSERT_APPLICANT_SQL = """
     INSERT INTO applicants (
         program, comments, date_added, url, status, term,
         us_or_international, gpa, gre, gre_v, gre_aw,
         degree, llm_generated_program, llm_generated_university
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    ON CONFLICT DO NOTHING;
+    ) VALUES {rows}
+    ON CONFLICT (url) DO NOTHING
+    RETURNING url;
 """
+ROW_PLACEHOLDERS = "(" + ", ".join(["%s"] * 14) + ")"
 
-
-def _parse_date(date_string: str | None) -> str | None:
-    if not date_string:
-        return None
-    try:
-        return datetime.strptime(date_string, "%B %d, %Y").strftime("%Y-%m-%d")
-    except ValueError:
-        return None
+# Rows per multi-row INSERT when storing pulled entries.
+INSERT_BATCH_SIZE = 100
 
 
 def _parse_float(value: str | None) -> float | None:
@@ -71,12 +81,7 @@ def _ensure_schema(conn) -> None:
         );
         """
     )
-    conn.execute(
-        """
-        CREATE UNIQUE INDEX IF NOT EXISTS applicants_url_unique_idx
-        ON applicants (url);
-        """
-    )
+    migrate_url_unique_index(conn)
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS ingestion_watermarks (
@@ -99,23 +104,29 @@ def _ensure_schema(conn) -> None:
     )
 
 
-def _build_row(entry: dict) -> tuple:
-    return (
-        entry.get("program"),
-        entry.get("comments"),
-        _parse_date(entry.get("date_added")),
-        entry.get("url"),
-        entry.get("status"),
-        entry.get("term"),
-        entry.get("US/International"),
-        _parse_float(entry.get("GPA")),
-        _parse_float(entry.get("GRE_SCORE")),
-        _parse_float(entry.get("GRE_V")),
-        _parse_float(entry.get("GRE_AW")),
-        entry.get("Degree"),
-        entry.get("llm-generated-program"),
-        entry.get("llm-generated-university"),
-    )
+def _insert_payload(entries: list) -> list[tuple]:
+    """Build INSERT tuples column-wise, parsing each distinct date or score once."""
+    return ApplicantBatch.from_rows(entries).insert_rows(parse_month_day_year, _parse_float)
+
+
+def _insert_rows(conn, rows: list[tuple]) -> int:
+    """Insert rows in multi-row batches and return how many new URLs were stored."""
+    inserted = 0
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        chunk = rows[start:start + INSERT_BATCH_SIZE]
+        # One round trip per batch; the URL index drops rows already stored.
+        cursor = conn.execute(
+            INSERT_APPLICANT_SQL.format(rows=", ".join([ROW_PLACEHOLDERS] * len(chunk))),
+            [value for row in chunk for value in row],
+        )
+        inserted += len(cursor.fetchall())
+    return inserted
+
+
+def _get_db_state(conn) -> str | None:
+    """Return a token that changes whenever applicants rows are added or removed."""
+    row = conn.execute("SELECT COUNT(*), MAX(p_id) FROM applicants;").fetchone()
+    return f"{row[0]}:{row[1]}" if row else None
 
 
 def _get_last_seen(conn) -> str | None:
@@ -201,41 +212,63 @@ def _seed_if_empty(conn) -> None:
 
     rows = _load_seed_rows(seed_path)
     newest_url = None
+    new_entries = []
     for entry in rows:
         url = entry.get("url")
         if not url:
             continue
         if newest_url is None:
             newest_url = url
-        conn.execute(INSERT_APPLICANT_SQL, _build_row(entry))
+        new_entries.append(entry)
+    _insert_rows(conn, _insert_payload(new_entries))
 
     if newest_url:
         _set_last_seen(conn, newest_url)
     conn.commit()
 
 
-def _scrape_until(last_seen: str | None, max_pages: int = 10) -> list[dict]:
-    page = 1
-    rows: list[dict] = []
-
-    while page <= max_pages:
-        html = _fetch_html(f"{BASE_URL}?page={page}")
-        parsed = _parse_page(html)
-        if not parsed:
-            break
-
-        if last_seen:
-            stop_index = next(
-                (idx for idx, entry in enumerate(parsed) if entry.get("url") == last_seen),
-                None,
-            )
-            if stop_index is not None:
-                rows.extend(parsed[:stop_index])
-                break
-
-        rows.extend(parsed)
-        page += 1
-
+def _scrape_until(last_seen: str | None, fingerprints=None) -> list[ApplicantRecord]:
+    def fetch_page(page: int) -> str:
+        url = f"{BASE_URL}?page={page}"
+        html = _fetch_html(url)
+        # Pages identical to the last pull hold nothing new; treat them as the end.
+        if fingerprints is not None and fingerprints.unchanged(url, html):
+            return ""
+        return html
+
+    # Search for the watermark page, then fetch every page before it in parallel.
+    target_page, probed = (
+        locate_watermark_page(fetch_page, iter_page_entries, last_seen)
+        if last_seen
+        else (None, {})
+    )
+    if target_page is None:
+        page_numbers, workers = range(1, FALLBACK_MAX_PAGES + 1), 1
+    else:
+        page_numbers, workers = range(1, target_page + 1), SCRAPE_WORKERS
+
+    def load_page(page: int) -> str:
+        return probed.pop(page) if page in probed else fetch_page(page)
+
+    rows: list[ApplicantRecord] = []
+    page_rows = 0
+    for _page, html in fetch_pages_in_order(load_page, page_numbers, workers):
+        page_rows = 0
+        for entry in iter_page_entries(html):
+            # Stop parsing the page as soon as the watermark row appears.
+            if last_seen and entry.get("url") == last_seen:
+                return rows
+            rows.append(entry)
+            page_rows += 1
+        if not page_rows:
+            return rows
+
+    if target_page is None and page_rows:
+        print(
+            f"Stopped after {FALLBACK_MAX_PAGES} pages without reaching the watermark; "
+            "older entries were not pulled.",
+            flush=True,
+        )
     return rows
 
 
@@ -252,12 +285,14 @@ def handle_scrape_new_data(conn, payload):
     since_url = payload.get("since")
     last_seen = since_url or _get_last_seen(conn)
 
-    batch = _scrape_until(last_seen)
+    cache_before = cache_stats()
+    fingerprints = load_fingerprints(_get_db_state(conn))
+    batch = _scrape_until(last_seen, fingerprints)
+    cache_after = cache_stats()
     newest_url = None
     processed = len(batch)
-    inserted = 0
-    duplicates = 0
     missing_urls = 0
+    rows = []
 
     for entry in batch:
         url = entry.get("url")
@@ -266,14 +301,16 @@ def handle_scrape_new_data(conn, payload):
             continue
         if newest_url is None:
             newest_url = url
-        cursor = conn.execute(INSERT_APPLICANT_SQL, _build_row(entry))
-        if max(cursor.rowcount, 0):
-            inserted += 1
-        else:
-            duplicates += 1
+        rows.append(entry)
+
+    inserted = _insert_rows(conn, _insert_payload(rows))
+    duplicates = len(rows) - inserted
 
     if newest_url:
         _set_last_seen(conn, newest_url)
+    # Commit before recording fingerprints so skipped pages always match stored rows.
+    conn.commit()
+    fingerprints.save(_get_db_state(conn))
     _set_job_status(
         conn,
         PULL_TASK_NAME,
@@ -287,6 +324,9 @@ def handle_scrape_new_data(conn, payload):
             "errors": 0,
             "pages_scraped": 0,
             "current_page": None,
+            "cache_hits": cache_after["cache_hits"] - cache_before["cache_hits"],
+            "cache_misses": cache_after["cache_misses"] - cache_before["cache_misses"],
+            "pages_unchanged": fingerprints.skipped,
         },
     )
 
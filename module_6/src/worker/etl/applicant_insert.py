@@ -0,0 +1,256 @@
+"""Shared applicant insert helpers used by multiple modules."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+from etl.applicant_record import ApplicantRecord
+
+
+# Single canonical insert statement so all loaders write rows consistently.
+INSERT_APPLICANTS_QUERY = """
+    INSERT INTO applicants (
+        program, comments, date_added, url, status, term,
+        us_or_international, gpa, gre, gre_v, gre_aw,
+        degree, llm_generated_program, llm_generated_university
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# Rows per multi-row INSERT in the batched, database-deduplicated mode.
+INSERT_BATCH_SIZE = 100
+
+
+def build_batch_insert_query(row_count: int) -> str:
+    """Return a multi-row INSERT that skips known URLs and returns inserted ones."""
+    row_placeholders = "(" + ", ".join(["%s"] * 14) + ")"
+    insert_head = INSERT_APPLICANTS_QUERY.rsplit("VALUES", 1)[0]
+    return (
+        f"{insert_head}VALUES {', '.join([row_placeholders] * row_count)}\n"
+        "    ON CONFLICT (url) DO NOTHING\n"
+        "    RETURNING url\n"
+    )
+
+
+# Unique index behind ON CONFLICT (url) in the batched insert mode.
+URL_INDEX_NAME = "applicants_url_unique_idx"
+URL_INDEX_EXISTS_QUERY = f"SELECT to_regclass('{URL_INDEX_NAME}') IS NOT NULL;"
+# Tables loaded before the index existed may hold '' or repeated URLs. One
+# statement clears '' to NULL, deletes every newer copy of a URL (keeping the
+# oldest row) and counts both, so the index can build.
+DEDUPLICATE_URLS_QUERY = """
+    WITH cleared AS (
+        UPDATE applicants SET url = NULL WHERE url = '' RETURNING p_id
+    ), deleted AS (
+        DELETE FROM applicants newer
+        USING applicants older
+        WHERE newer.url = older.url AND newer.url <> '' AND newer.p_id > older.p_id
+        RETURNING newer.p_id
+    )
+    SELECT (SELECT COUNT(*) FROM cleared), (SELECT COUNT(*) FROM deleted);
+"""
+CREATE_URL_INDEX_QUERY = f"CREATE UNIQUE INDEX IF NOT EXISTS {URL_INDEX_NAME} ON applicants (url);"
+
+
+@dataclass
+class UrlIndexMigration:
+    """Rows changed while building the unique URL index."""
+
+    # Rows whose '' URL was cleared to NULL.
+    cleared: int = 0
+    # Newer duplicate-URL rows deleted; the oldest row per URL is kept.
+    deleted: int = 0
+
+
+def migrate_url_unique_index(connection) -> UrlIndexMigration | None:
+    """Deduplicate applicant URLs and build the unique URL index if it is missing.
+
+    Returns None when the index already exists (a single catalog lookup).
+    Otherwise the migration runs once and its counts are printed, since the
+    deleted rows cannot be recovered. The caller commits.
+    """
+    if connection.execute(URL_INDEX_EXISTS_QUERY).fetchone()[0]:
+        return None
+    cleared, deleted = connection.execute(DEDUPLICATE_URLS_QUERY).fetchone()
+    connection.execute(CREATE_URL_INDEX_QUERY)
+    print(
+        f"Built {URL_INDEX_NAME}: cleared {cleared} empty URL(s), "
+        f"deleted {deleted} duplicate-URL row(s)"
+    )
+    return UrlIndexMigration(cleared=cleared, deleted=deleted)
+
+
+def build_insert_values(
+    entry: dict | ApplicantRecord,
+    parse_date_func: Callable[[str | None], str | None],
+    parse_float_func: Callable[[str | None], float | None],
+) -> tuple:
+    """Build insert values in applicants-column order."""
+    # Records read their fields directly instead of 14 dict lookups.
+    if isinstance(entry, ApplicantRecord):
+        return (
+            entry.program,
+            entry.comments,
+            parse_date_func(entry.date_added),
+            entry.url,
+            entry.status,
+            entry.term,
+            entry.us_or_international,
+            parse_float_func(entry.gpa),
+            parse_float_func(entry.gre),
+            parse_float_func(entry.gre_v),
+            parse_float_func(entry.gre_aw),
+            entry.degree,
+            entry.llm_generated_program,
+            entry.llm_generated_university,
+        )
+    # Keep this order exactly aligned with INSERT_APPLICANTS_QUERY.
+    # Source keys reflect upstream scraped/cleaned field names.
+    return (
+        entry.get("program"),
+        entry.get("comments"),
+        parse_date_func(entry.get("date_added")),
+        entry.get("url"),
+        entry.get("status"),
+        entry.get("term"),
+        entry.get("US/International"),
+        parse_float_func(entry.get("GPA")),
+        parse_float_func(entry.get("GRE_SCORE")),
+        parse_float_func(entry.get("GRE_V")),
+        parse_float_func(entry.get("GRE_AW")),
+        entry.get("Degree"),
+        entry.get("llm-generated-program"),
+        entry.get("llm-generated-university"),
+    )
+
+
+@dataclass
+class InsertEntriesOptions:
+    """Optional callbacks and policies used while inserting entries."""
+
+    # Return True to skip an entry before attempting INSERT.
+    should_skip: Callable | None = None
+    # Called after a successful INSERT.
+    on_inserted: Callable | None = None
+    # Called when an INSERT fails (after rollback).
+    on_insert_error: Callable | None = None
+    # Called on periodic progress checkpoints.
+    on_progress: Callable | None = None
+    # Custom policy that decides when to commit.
+    should_commit: Callable | None = None
+
+
+def insert_entries(
+    connection,
+    entries,
+    build_values: Callable,
+    options: InsertEntriesOptions | None = None,
+) -> tuple[int, int]:
+    """Insert entries with commit/rollback handling and optional callbacks."""
+    inserted_count = 0
+    error_count = 0
+    # Normalize optional callback config once for the full insert run.
+    callbacks = options or InsertEntriesOptions()
+
+    def default_should_commit(index, inserted, errors):
+        _ = index, errors
+        # Default batching: commit every 100 successful inserts.
+        return inserted > 0 and inserted % 100 == 0
+
+    commit_check = callbacks.should_commit or default_should_commit
+
+    for index, entry in enumerate(entries, 1):
+        # Skip policy lets callers short-circuit known duplicates/invalid rows.
+        if callbacks.should_skip and callbacks.should_skip(entry):
+            continue
+        try:
+            # Build values outside SQL text to keep INSERT parameterized.
+            connection.execute(INSERT_APPLICANTS_QUERY, build_values(entry))
+            inserted_count += 1
+            if callbacks.on_inserted:
+                callbacks.on_inserted(entry, index, inserted_count)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            error_count += 1
+            # Keep the connection usable after statement-level failures.
+            connection.rollback()
+            if callbacks.on_insert_error:
+                callbacks.on_insert_error(entry, index, error, error_count)
+
+        # Commit policy is caller-overridable for batch size/perf tuning.
+        if commit_check(index, inserted_count, error_count):
+            connection.commit()
+            if callbacks.on_progress:
+                callbacks.on_progress(index, inserted_count, error_count)
+
+    # Final commit flushes any trailing successful inserts.
+    connection.commit()
+    return inserted_count, error_count
+
+
+@dataclass
+class BatchInsertResult:
+    """Outcome of ``insert_entries_batched``."""
+
+    # Entries whose URL the database accepted, in input order.
+    inserted: list = field(default_factory=list)
+    # Entries skipped because their URL was already stored or earlier in the run.
+    duplicates: int = 0
+    # Entries whose INSERT failed even when retried on its own.
+    errors: int = 0
+
+
+def _insert_batch(connection, batch, build_values) -> tuple[list, int]:
+    """Insert and commit one batch, returning (inserted entries, duplicate count)."""
+    params = [value for entry in batch for value in build_values(entry)]
+    cursor = connection.execute(build_batch_insert_query(len(batch)), params)
+    returned = {row[0] for row in cursor.fetchall()}
+    inserted = []
+    for entry in batch:
+        # RETURNING lists each inserted URL once; later copies were conflicts.
+        if entry.get("url") in returned:
+            returned.discard(entry["url"])
+            inserted.append(entry)
+    # Commit before reporting: a failed commit must not leave the batch counted
+    # once here and again when the caller retries it row by row.
+    connection.commit()
+    return inserted, len(batch) - len(inserted)
+
+
+def _record_batch(result: BatchInsertResult, outcome: tuple[list, int]) -> None:
+    """Add a committed batch's outcome to the running result."""
+    inserted, duplicates = outcome
+    result.inserted.extend(inserted)
+    result.duplicates += duplicates
+
+
+def insert_entries_batched(
+    connection,
+    entries,
+    build_values: Callable,
+    batch_size: int = INSERT_BATCH_SIZE,
+    on_batch: Callable | None = None,
+) -> BatchInsertResult:
+    """Insert entries in multi-row batches, letting the URL index drop duplicates.
+
+    Each batch is one ``INSERT ... ON CONFLICT (url) DO NOTHING RETURNING url``
+    plus a commit. A failing batch is rolled back and retried row by row so a
+    single bad entry is counted as an error without losing its neighbours.
+    ``on_batch(result, done)`` runs after each batch with the entries handled so far.
+    """
+    result = BatchInsertResult()
+    entries = list(entries)
+    for start in range(0, len(entries), batch_size):
+        batch = entries[start:start + batch_size]
+        try:
+            _record_batch(result, _insert_batch(connection, batch, build_values))
+        except Exception:  # pylint: disable=broad-exception-caught
+            connection.rollback()
+            for entry in batch:
+                try:
+                    _record_batch(result, _insert_batch(connection, [entry], build_values))
+                except Exception:  # pylint: disable=broad-exception-caught
+                    connection.rollback()
+                    result.errors += 1
+        if on_batch:
+            on_batch(result, start + len(batch))
+    return result
@@ -1,14 +1,37 @@
 """GradCafe scraping helpers used by the worker pull task."""
 
+import hashlib
 import json
+import os
 import re
+import tempfile
 import urllib.robotparser
-from urllib.request import Request, urlopen
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Callable, Iterable, Iterator, NamedTuple
+from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup
+from etl.applicant_record import ApplicantRecord, to_json
+from etl.http_session import FetchSession, cache_from_env
+from etl.rate_limit import AimdLimiter, PacingPolicy
+from lxml import etree
 
 HEADERS = {"User-Agent": "Mozilla/5.0"}
-BASE_URL = "https://www.thegradcafe.com/survey/"
+# Overridable so scrapers can target a local stand-in such as benchmarks/standin_server.py.
+BASE_URL = os.getenv("GRADCAFE_BASE_URL", "https://www.thegradcafe.com/survey/")
+# Concurrent fetches for the pages ahead of a located watermark.
+SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS", "4"))
+# Paces each host and widens concurrency up to the worker count while healthy.
+LIMITER = AimdLimiter(PacingPolicy(max_concurrency=SCRAPE_WORKERS))
+# Shared keep-alive session so incremental pulls reuse one connection per host.
+SESSION = FetchSession(headers=HEADERS, cache=cache_from_env(), limiter=LIMITER)
+# Per-page table fingerprints from the last pull; an empty value disables skipping.
+FINGERPRINT_PATH = os.getenv(
+    "SCRAPE_FINGERPRINT_PATH",
+    os.path.join(tempfile.gettempdir(), "gradcafe_page_fingerprints.json"),
+)
 
 
 def _check_robots_allowed(base_url: str, user_agent: str = "Mozilla/5.0") -> str:
@@ -16,6 +39,7 @@ def _check_robots_allowed(base_url: str, user_agent: str = "Mozilla/5.0") -> str
     rp = urllib.robotparser.RobotFileParser()
     rp.set_url("https://www.thegradcafe.com/robots.txt")
     rp.read()
+    LIMITER.set_crawl_delay(urlsplit(base_url).netloc, rp.crawl_delay(user_agent))
 
     allowed = rp.can_fetch(user_agent, base_url)
     if allowed:
@@ -25,127 +49,463 @@ def _check_robots_allowed(base_url: str, user_agent: str = "Mozilla/5.0") -> str
 
 def _fetch_html(url: str) -> str:
     """Send a request to one GradCafe page and return its HTML."""
-    req = Request(url, headers=HEADERS)
-    with urlopen(req) as resp:
-        return resp.read().decode("utf-8")
-
-
-def _parse_page(html: str) -> list:
-    """Parse one GradCafe results page into applicant dictionaries."""
+    return SESSION.fetch_text(url)
+
+
+def cache_stats() -> dict[str, int]:
+    """Return conditional-GET cache hit/miss counters for the shared session."""
+    return SESSION.cache_stats()
+
+
+def limiter_stats() -> dict[str, float | int]:
+    """Return the shared limiter's current request rate and concurrency window."""
+    return SESSION.limiter_stats()
+
+
+# Shape of one summary <tr>: university, program, degree, date, status text, link.
+class _SummaryRow(NamedTuple):
+    university: str
+    program_name: str
+    degree_type: str
+    date_added: str
+    status_text: str
+    href: str | None
+
+
+# Shape of one "tw-border-none" detail <tr> that follows a summary row.
+class _DetailRow(NamedTuple):
+    text: str
+    comments: str | None
+
+
+ACCEPTED_RE = re.compile(r"Accepted on (.+)")
+REJECTED_RE = re.compile(r"Rejected on (.+)")
+RESULT_LINK_RE = re.compile(r"/result/")
+RESULT_ID_RE = re.compile(r"/result/(\d+)")
+TBODY_RE = re.compile(r"<tbody\b[^>]*>(.*?)</tbody>", re.IGNORECASE | re.DOTALL)
+TERM_RE = re.compile(r"(Fall|Spring|Summer)\s+\d{4}")
+GPA_RE = re.compile(r"GPA\s*[:]?[\s]*([\d.]+)")
+GRE_RE = re.compile(r"GRE\s*[:]?[\s]*([\d]{3})")
+GRE_V_RE = re.compile(r"V\s*[:]?[\s]*([\d]{2,3})")
+GRE_AW_RE = re.compile(r"AW\s*[:]?[\s]*([\d.]+)")
+# Characters handed to the lxml pull parser per feed() call.
+LXML_FEED_CHUNK = 16384
+# Any start or end tag, with a trailing "/" for self-closed ones.
+ROW_TAG_RE = re.compile(r"<(/?)([a-z][^\s/>]*)([^>]*)>", re.IGNORECASE)
+# Elements without end tags.
+VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+)
+# The only child libxml2 leaves in place directly under each table element.
+ROW_CHILD_TAGS = {"tbody": "tr", "tr": "td"}
+# Tags that make libxml2 end a cell or the table, or read the rest as raw text.
+TABLE_BREAKING_TAGS = frozenset(
+    {
+        "table", "thead", "tbody", "tfoot", "caption", "colgroup", "col", "th",
+        "textarea", "title", "xmp", "plaintext", "iframe", "noembed", "noframes",
+        "template", "html", "head", "body",
+    }
+)
+# Block tags that make libxml2 close an open <p> early.
+P_CLOSING_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "center", "dd", "details", "dir",
+        "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form",
+        "h1", "h2", "h3", "h4", "h5", "h6", "header", "hgroup", "hr", "li", "main",
+        "menu", "nav", "ol", "p", "pre", "section", "summary", "ul",
+    }
+)
+# get_text() leaves these out; lxml's itertext() would not.
+LXML_SKIPPED_TEXT_TAGS = frozenset({"script", "style"})
+
+
+def _soup_rows(html: str) -> Iterator[_SummaryRow | _DetailRow | None]:
+    """Yield table rows using BeautifulSoup with the pure-Python html.parser."""
     soup = BeautifulSoup(html, "html.parser")
     tbody = soup.find("tbody")
     if not tbody:
-        return []
-
-    rows = tbody.find_all("tr", recursive=False)
-    results = []
-
-    i = 0
-    while i < len(rows):
-        row = rows[i]
+        return
 
+    for row in tbody.find_all("tr", recursive=False):
         if "tw-border-none" in row.get("class", []):
-            i += 1
+            paragraph = row.find("p")
+            yield _DetailRow(
+                row.get_text(" ", strip=True),
+                paragraph.get_text(strip=True) if paragraph else None,
+            )
             continue
 
         cols = row.find_all("td", recursive=False)
         if len(cols) < 4:
-            i += 1
+            yield None
             continue
 
-        university = cols[0].get_text(strip=True)
-
         spans = cols[1].find_all("span")
-        program_name = spans[0].get_text(strip=True) if len(spans) > 0 else ""
-        degree_type = spans[1].get_text(strip=True) if len(spans) > 1 else ""
-
-        program = f"{program_name}, {university}"
-        date_added = cols[2].get_text(strip=True)
-
-        status_text = cols[3].get_text(" ", strip=True)
-        applicant_status = ""
-        decision_date = ""
-
-        if "Accepted" in status_text:
-            applicant_status = "Accepted"
-            match = re.search(r"Accepted on (.+)", status_text)
-            decision_date = match.group(1) if match else ""
-        elif "Rejected" in status_text:
-            applicant_status = "Rejected"
-            match = re.search(r"Rejected on (.+)", status_text)
-            decision_date = match.group(1) if match else ""
-
-        link = row.find("a", href=re.compile(r"/result/"))
-        entry_url = "https://www.thegradcafe.com" + link["href"] if link else ""
-
-        comments = ""
-        term = ""
-        citizenship = ""
-        gre_total = ""
-        gre_v = ""
-        gre_aw = ""
-        gpa = ""
-
-        j = i + 1
-        while j < len(rows) and "tw-border-none" in rows[j].get("class", []):
-            text = rows[j].get_text(" ", strip=True)
-
-            paragraph = rows[j].find("p")
-            if paragraph:
-                comments = paragraph.get_text(strip=True)
-
-            match = re.search(r"(Fall|Spring|Summer)\s+\d{4}", text)
-            if match:
-                term = match.group(0)
-
-            if "American" in text:
-                citizenship = "American"
-            elif "International" in text:
-                citizenship = "International"
-
-            match = re.search(r"GPA\s*[:]?[\s]*([\d.]+)", text)
-            if match:
-                gpa = match.group(1)
-
-            match = re.search(r"GRE\s*[:]?[\s]*([\d]{3})", text)
-            if match:
-                gre_total = match.group(1)
-
-            match = re.search(r"V\s*[:]?[\s]*([\d]{2,3})", text)
-            if match:
-                gre_v = match.group(1)
-
-            match = re.search(r"AW\s*[:]?[\s]*([\d.]+)", text)
-            if match:
-                gre_aw = match.group(1)
-
-            j += 1
-
-        results.append(
-            {
-                "program": program,
-                "comments": comments,
-                "date_added": date_added,
-                "url": entry_url,
-                "status": applicant_status,
-                "decision_date": decision_date,
-                "term": term,
-                "US/International": citizenship,
-                "GRE_SCORE": gre_total,
-                "GRE_V": gre_v,
-                "GRE_AW": gre_aw,
-                "GPA": gpa,
-                "Degree": degree_type,
-            }
+        link = row.find("a", href=RESULT_LINK_RE)
+        yield _SummaryRow(
+            university=cols[0].get_text(strip=True),
+            program_name=spans[0].get_text(strip=True) if spans else "",
+            degree_type=spans[1].get_text(strip=True) if len(spans) > 1 else "",
+            date_added=cols[2].get_text(strip=True),
+            status_text=cols[3].get_text(" ", strip=True),
+            href=link["href"] if link else None,
         )
 
-        i = j
 
-    return results
+def _lxml_strings(element) -> Iterator[str]:
+    """Yield an element's text nodes in document order, minus script/style/comments."""
+    if isinstance(element.tag, str) and element.tag not in LXML_SKIPPED_TEXT_TAGS:
+        if element.text:
+            yield element.text
+        for child in element:
+            yield from _lxml_strings(child)
+            if child.tail:
+                yield child.tail
+
 
+def _lxml_text(element, separator: str = "") -> str:
+    """Match BeautifulSoup ``get_text(separator, strip=True)`` for an lxml element."""
+    return separator.join(text.strip() for text in _lxml_strings(element) if text.strip())
 
-def scrape_data(pages: int = 5) -> list:
-    """Collect applicant data across multiple survey pages."""
+
+def _lxml_row(row) -> _SummaryRow | _DetailRow | None:
+    """Convert one complete lxml ``<tr>`` element into a backend row shape."""
+    if "tw-border-none" in row.get("class", "").split():
+        paragraph = next(row.iter("p"), None)
+        return _DetailRow(
+            _lxml_text(row, " "),
+            _lxml_text(paragraph) if paragraph is not None else None,
+        )
+
+    cols = list(row.iterchildren("td"))
+    if len(cols) < 4:
+        return None
+
+    spans = list(cols[1].iter("span"))
+    link = next(
+        (a for a in row.iter("a") if RESULT_LINK_RE.search(a.get("href", ""))),
+        None,
+    )
+    return _SummaryRow(
+        university=_lxml_text(cols[0]),
+        program_name=_lxml_text(spans[0]) if spans else "",
+        degree_type=_lxml_text(spans[1]) if len(spans) > 1 else "",
+        date_added=_lxml_text(cols[2]),
+        status_text=_lxml_text(cols[3], " "),
+        href=link.get("href") if link is not None else None,
+    )
+
+
+def _rows_well_nested(html: str) -> bool:
+    """Return True when every tag in the first tbody is explicitly closed in order.
+
+    libxml2 repairs markup that html.parser takes literally: it closes an
+    unclosed ``<td>``, ``<tr>`` or ``<p>`` when a sibling or block starts, moves
+    anything but ``<tr>`` directly inside ``<tbody>`` (or ``<td>`` inside
+    ``<tr>``) out of the table, and ends a cell or the table at a nested
+    ``<table>``-level tag. A tbody with none of these builds the same tree, and
+    so the same rows, in both.
+    """
+    start = html.lower().find("<tbody")
+    if start < 0:
+        return True
+    open_tags: list[str] = []
+    for match in ROW_TAG_RE.finditer(html, start):
+        closing, tag = match.group(1), match.group(2).lower()
+        if closing:
+            if not open_tags or open_tags.pop() != tag:
+                return False
+            if not open_tags:
+                return True
+            continue
+        if open_tags and (
+            tag in TABLE_BREAKING_TAGS
+            or ROW_CHILD_TAGS.get(open_tags[-1], tag) != tag
+            or (tag in P_CLOSING_TAGS and "p" in open_tags)
+        ):
+            return False
+        if not match.group(3).endswith("/"):
+            if tag not in VOID_TAGS:
+                open_tags.append(tag)
+        elif tag in ROW_CHILD_TAGS.values():
+            # html.parser closes a self-closed <tr/> or <td/>; libxml2 opens it.
+            return False
+    return False
+
+
+def _lxml_rows(html: str) -> Iterator[_SummaryRow | _DetailRow | None]:
+    """Yield table rows from libxml2 incrementally, as each ``</tr>`` is parsed.
+
+    The page is fed to a pull parser in chunks, so a caller that stops early
+    (for example at the watermark URL) skips parsing the rest of the page.
+    A tbody that libxml2 would repair differently (see ``_rows_well_nested``),
+    or a table it cannot find, is handed to html.parser instead.
+    """
+    if not html:
+        return
+    if not _rows_well_nested(html):
+        yield from _soup_rows(html)
+        return
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    tbody = None
+    chunks = (
+        html[offset:offset + LXML_FEED_CHUNK] for offset in range(0, len(html), LXML_FEED_CHUNK)
+    )
+    for chunk in chain(chunks, [None]):
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+        for event, element in parser.read_events():
+            if tbody is None:
+                if event == "start" and element.tag == "tbody":
+                    tbody = element
+            elif element is tbody:
+                return
+            elif event == "end" and element.tag == "tr" and element.getparent() is tbody:
+                yield _lxml_row(element)
+    if tbody is None and "<tbody" in html.lower():
+        # Broken markup before the table (e.g. an unclosed <title>) hid it from libxml2.
+        yield from _soup_rows(html)
+
+
+# Parser backends selectable by name; all must yield identical row shapes.
+PARSER_BACKENDS: dict[str, Callable[[str], Iterator[_SummaryRow | _DetailRow | None]]] = {
+    "html.parser": _soup_rows,
+    "lxml": _lxml_rows,
+}
+PARSER_BACKEND = os.getenv("SCRAPE_PARSER", "html.parser")
+
+
+def _summary_entry(row: _SummaryRow) -> ApplicantRecord:
+    """Start one applicant entry from a summary row."""
+    applicant_status = ""
+    decision_date = ""
+    if "Accepted" in row.status_text:
+        applicant_status = "Accepted"
+        match = ACCEPTED_RE.search(row.status_text)
+        decision_date = match.group(1) if match else ""
+    elif "Rejected" in row.status_text:
+        applicant_status = "Rejected"
+        match = REJECTED_RE.search(row.status_text)
+        decision_date = match.group(1) if match else ""
+
+    return ApplicantRecord(
+        program=f"{row.program_name}, {row.university}",
+        comments="",
+        date_added=row.date_added,
+        url="https://www.thegradcafe.com" + row.href if row.href else "",
+        status=applicant_status,
+        decision_date=decision_date,
+        term="",
+        us_or_international="",
+        gre="",
+        gre_v="",
+        gre_aw="",
+        gpa="",
+        degree=row.degree_type,
+    )
+
+
+def _apply_detail(entry: ApplicantRecord, row: _DetailRow) -> None:
+    """Fold one detail row's comments, term, citizenship, and scores into an entry."""
+    text = row.text
+    if row.comments is not None:
+        entry.comments = row.comments
+
+    match = TERM_RE.search(text)
+    if match:
+        entry.term = match.group(0)
+    if "American" in text:
+        entry.us_or_international = "American"
+    elif "International" in text:
+        entry.us_or_international = "International"
+
+    for attribute, pattern in (
+        ("gpa", GPA_RE),
+        ("gre", GRE_RE),
+        ("gre_v", GRE_V_RE),
+        ("gre_aw", GRE_AW_RE),
+    ):
+        match = pattern.search(text)
+        if match:
+            setattr(entry, attribute, match.group(1))
+
+
+def _build_entries(
+    rows: Iterable[_SummaryRow | _DetailRow | None],
+) -> Iterator[ApplicantRecord]:
+    """Group each summary row with the detail rows that follow it."""
+    entry: ApplicantRecord | None = None
+    for row in rows:
+        if isinstance(row, _DetailRow):
+            # Detail rows only belong to an immediately preceding summary row.
+            if entry is not None:
+                _apply_detail(entry, row)
+            continue
+        if entry is not None:
+            yield entry
+        entry = _summary_entry(row) if row is not None else None
+    if entry is not None:
+        yield entry
+
+
+def iter_page_entries(html: str, backend: str | None = None) -> Iterator[ApplicantRecord]:
+    """Yield applicant entries from one survey page, one row group at a time."""
+    name = backend or PARSER_BACKEND
+    if name not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend {name!r}; expected one of {sorted(PARSER_BACKENDS)}"
+        )
+    if "\r" in html:
+        # libxml2 normalizes CR/CRLF while parsing; do it up front for every backend.
+        html = html.replace("\r\n", "\n").replace("\r", "\n")
+    return _build_entries(PARSER_BACKENDS[name](html))
+
+
+def _parse_page(html: str, backend: str | None = None) -> list[ApplicantRecord]:
+    """Parse one GradCafe survey page into structured applicant rows."""
+    return list(iter_page_entries(html, backend))
+
+
+def fetch_pages_in_order(
+    fetch_page: Callable[[int], str], page_numbers: Iterable[int], workers: int = 1
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(page, html)`` in page order, running up to ``workers`` fetches at once."""
+    if workers <= 1:
+        for page in page_numbers:
+            yield page, fetch_page(page)
+        return
+
+    # Keep a bounded window of in-flight fetches so results stay ordered and
+    # memory does not grow with the total page count.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        for page in page_numbers:
+            pending.append((page, executor.submit(fetch_page, page)))
+            if len(pending) >= workers * 2:
+                done_page, future = pending.popleft()
+                yield done_page, future.result()
+        while pending:
+            done_page, future = pending.popleft()
+            yield done_page, future.result()
+
+
+def result_id(url: str | None) -> int | None:
+    """Return the numeric id of a ``/result/<id>`` URL; ids grow with submission order."""
+    match = RESULT_ID_RE.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+def locate_watermark_page(
+    fetch_page: Callable[[int], str],
+    iter_entries: Callable[[str], Iterator[ApplicantRecord | dict]],
+    watermark_url: str,
+) -> tuple[int | None, dict[int, str]]:
+    """Find the first page holding ``watermark_url`` or anything older than it.
+
+    Survey pages list results newest first, so probing pages 1, 2, 4, 8, ...
+    brackets the watermark in a logarithmic number of fetches and a binary
+    search over result ids narrows the bracket. Returns the page and the HTML
+    of every probed page, or ``(None, {})`` when the watermark has no id.
+    ``iter_entries`` may yield records or the entry dicts of legacy scrapers.
+    """
+    target_id = result_id(watermark_url)
+    probed: dict[int, str] = {}
+    if target_id is None:
+        return None, probed
+
+    def reaches_watermark(page: int) -> bool:
+        html = probed[page] = fetch_page(page)
+        seen_entries = False
+        for entry in iter_entries(html):
+            entry_id = result_id(entry.get("url"))
+            if entry_id is not None and entry_id <= target_id:
+                return True
+            seen_entries = True
+        # An empty page is past the end of the survey, so nothing older remains.
+        return not seen_entries
+
+    newer_page, probe = 0, 1
+    while not reaches_watermark(probe):
+        newer_page, probe = probe, probe * 2
+    low, high = newer_page + 1, probe
+    while low < high:
+        middle = (low + high) // 2
+        if reaches_watermark(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return high, probed
+
+
+def page_fingerprint(html: str) -> str | None:
+    """Hash the survey table body, ignoring ads and page chrome around it.
+
+    Returns None for pages without result rows so empty pages are never skipped.
+    """
+    match = TBODY_RE.search(html)
+    if match is None or "<tr" not in match.group(1):
+        return None
+    return hashlib.sha256(match.group(1).encode("utf-8")).hexdigest()
+
+
+class PageFingerprints:
+    """Table-body hashes per survey page from the last completed pull.
+
+    ``unchanged`` compares against the saved hashes and stages new ones;
+    ``save`` persists staged hashes once the pulled rows are safely stored.
+    Hashes are saved with an opaque ``db_state`` token (for example the row
+    count and highest id) and are only trusted while the database still
+    reports the same token, so a reset or restored table is pulled again.
+    """
+
+    def __init__(self, path: str | None = FINGERPRINT_PATH, db_state: str | None = None) -> None:
+        self.path = path
+        self.db_state = db_state
+        self.known: dict[str, str] = {}
+        self.pending: dict[str, str] = {}
+        self.skipped = 0
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as file_handle:
+                    stored = json.load(file_handle)
+            except (OSError, ValueError):
+                stored = {}
+            if isinstance(stored, dict) and stored.get("db_state") == db_state:
+                self.known = dict(stored.get("pages") or {})
+
+    def unchanged(self, page_url: str, html: str) -> bool:
+        """Return True when the page body matches the saved fingerprint."""
+        digest = page_fingerprint(html)
+        if digest is None:
+            return False
+        if self.known.get(page_url) == digest:
+            self.skipped += 1
+            return True
+        self.pending[page_url] = digest
+        return False
+
+    def save(self, db_state: str | None = None) -> None:
+        """Merge staged fingerprints and atomically rewrite the store for ``db_state``."""
+        self.known.update(self.pending)
+        self.pending.clear()
+        self.db_state = db_state
+        if not self.path:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file_handle:
+            json.dump({"db_state": db_state, "pages": self.known}, file_handle)
+        os.replace(temp_path, self.path)
+
+
+def load_fingerprints(db_state: str | None = None) -> PageFingerprints:
+    """Load the SCRAPE_FINGERPRINT_PATH store, trusting it only for ``db_state``."""
+    return PageFingerprints(FINGERPRINT_PATH, db_state)
+
+
+def scrape_data(pages: int = 5) -> list[ApplicantRecord]:
+    """Collect applicant records across multiple survey pages."""
     data = []
     for page in range(1, pages + 1):
         print(f"Fetching page {page}...")
@@ -155,10 +515,10 @@ def scrape_data(pages: int = 5) -> list:
     return data
 
 
-def save_data(data: list, filename: str = "applicant_data.json") -> None:
-    """Write scraped applicant data to a JSON file."""
+def save_data(data: list[ApplicantRecord], filename: str = "applicant_data.json") -> None:
+    """Write scraped applicant records to a JSON file."""
     with open(filename, "w", encoding="utf-8") as file_handle:
-        json.dump(data, file_handle, indent=2, ensure_ascii=False)
+        json.dump(data, file_handle, indent=2, ensure_ascii=False, default=to_json)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -41,6 +41,7 @@ class MockConnection:
         self.executed = []
         self.commit_count = 0
         self.rollback_count = 0
+        self.url_index = False
         self._initialize_schema()
     
     def _initialize_schema(self):
@@ -60,6 +61,40 @@ class MockConnection:
             self.tables["applicants"] = []
             return self
         
+        # Handle the unique URL index lookup, migration, and build
+        if "to_regclass(" in sql:
+            return MockCursor([(self.url_index,)])
+        if "WITH cleared AS" in sql:
+            rows = self.tables["applicants"]
+            cleared = sum(1 for row in rows if row["url"] == "")
+            for row in rows:
+                if row["url"] == "":
+                    row["url"] = None
+            kept, seen = [], set()
+            for row in rows:
+                if row["url"] is not None and row["url"] in seen:
+                    continue
+                seen.add(row["url"])
+                kept.append(row)
+            self.tables["applicants"] = kept
+            return MockCursor([(cleared, len(rows) - len(kept))])
+        if "CREATE UNIQUE INDEX" in sql:
+            self.url_index = True
+            return self
+
+        # Handle batched INSERT ... ON CONFLICT (url) DO NOTHING RETURNING url
+        if "INSERT INTO applicants" in sql and "ON CONFLICT (url)" in sql:
+            stored = {row["url"] for row in self.tables["applicants"]}
+            returned = []
+            for start in range(0, len(params), 14):
+                values = params[start:start + 14]
+                if values[3] in stored:
+                    continue
+                stored.add(values[3])
+                self.execute("INSERT INTO applicants", values)
+                returned.append((values[3],))
+            return MockCursor(returned)
+
         # Handle INSERT
         if "INSERT INTO applicants" in sql:
             if params:
@@ -94,6 +129,11 @@ class MockConnection:
                        if row.get("status", "").lower() == "accepted")
             return MockCursor([(count,)])
         
+        # Handle the row count/max id state token used to validate page fingerprints
+        if "SELECT COUNT(*), MAX(p_id) FROM applicants" in sql:
+            count = len(self.tables["applicants"])
+            return MockCursor([(count, count or None)])
+
         # Handle SELECT COUNT(*)
         if "SELECT COUNT(*) FROM applicants" in sql:
             count = len(self.tables["applicants"])
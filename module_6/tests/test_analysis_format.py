@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import re
 from types import SimpleNamespace
 
@@ -227,6 +228,116 @@ def test_data_cleaning_load_clean_save(tmp_path):
     assert output_path.exists()
 
 
+@pytest.mark.analysis
+def test_data_cleaning_iter_clean_streams_and_matches_regex_path():
+    # Fast-path strings and regex-path strings clean the same way, one row at a time.
+    from app import data_cleaning as clean_mod
+
+    rows = iter(
+        [
+            {"plain": " Computer Science ", "tabs": "MIT\tPhD", "nbsp": "Fall\xa02026"},
+            {"tag": "<i>Accepted</i> on 1 Feb", "gap": "GPA  3.9", "none": "  none "},
+        ]
+    )
+    cleaned = clean_mod.iter_clean(rows)
+
+    assert next(cleaned) == {"plain": "Computer Science", "tabs": "MIT PhD", "nbsp": "Fall 2026"}
+    # The second row is untouched until it is requested.
+    assert next(rows, None) is not None
+    assert list(cleaned) == []
+    assert clean_mod.clean_data([{"tag": "<i>x</i>", "gap": "a  b", "none": "-"}]) == [
+        {"tag": "x", "gap": "a b", "none": ""}
+    ]
+
+
+@pytest.mark.analysis
+def test_applicant_records_clean_insert_and_serialize_like_entry_dicts(tmp_path):
+    # Records flow through cleaning, insert values, pickling, and JSON exactly like dicts.
+    import pickle
+
+    from app import data_cleaning as clean_mod
+    from applicant_insert import build_insert_values
+    from applicant_record import ApplicantRecord, to_json
+    from load_data import parse_date, parse_float
+
+    record = ApplicantRecord(
+        program="<b>CS</b>,  MIT", comments="n/a", date_added="January 15, 2026",
+        url="https://www.thegradcafe.com/result/1", status="Accepted", term="Fall 2026",
+        us_or_international="American", gpa="3.90", gre="", degree="PhD",
+    )
+    entry = record.to_dict()
+    assert "llm-generated-program" not in entry
+    assert ApplicantRecord.from_dict(entry) == record
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert (record.get("GPA"), record.get("GRE_V", "-"), record["Degree"]) == ("3.90", "-", "PhD")
+    with pytest.raises(KeyError):
+        record["GRE_V"]
+
+    [cleaned] = clean_mod.clean_data([record])
+    [cleaned_entry] = clean_mod.clean_data([entry])
+    assert cleaned.to_dict() == cleaned_entry
+    assert build_insert_values(cleaned, parse_date, parse_float) == build_insert_values(
+        cleaned_entry, parse_date, parse_float
+    )
+
+    output_path = tmp_path / "records.json"
+    clean_mod.save_data([cleaned], str(output_path))
+    assert json.loads(output_path.read_text(encoding="utf-8")) == [cleaned_entry]
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=to_json)
+
+
+@pytest.mark.analysis
+def test_data_cleaning_interns_low_cardinality_fields_and_reports_counts(monkeypatch):
+    # Equal status/term/program values come back as one shared string per value.
+    from app import data_cleaning as clean_mod
+    from applicant_record import ApplicantRecord
+
+    def fresh(text):
+        return "".join(list(text))
+
+    rows = [
+        {"program": fresh("CS, MIT"), "status": fresh("Accepted"), "comments": fresh("hi there")},
+        ApplicantRecord(program=fresh("CS, MIT"), status=fresh(" Accepted"), term=fresh("Fall 2026")),
+        {"program": fresh("EE, MIT"), "status": fresh("Accepted"), "comments": fresh("hi there")},
+    ]
+    interner = clean_mod.FieldInterner()
+    cleaned = clean_mod.clean_data(rows, interner)
+
+    assert [row["status"] for row in cleaned] == ["Accepted"] * 3
+    assert cleaned[0]["status"] is cleaned[1].status is cleaned[2]["status"]
+    assert cleaned[0]["program"] is cleaned[1].program
+    assert cleaned[0]["comments"] is not cleaned[2]["comments"]
+    assert interner.stats() == {
+        "program": 2, "status": 1, "term": 1, "US/International": 0, "Degree": 0,
+    }
+
+    monkeypatch.setattr(clean_mod, "PARALLEL_CLEAN_MIN_ROWS", 1)
+    pooled = list(clean_mod.iter_clean_parallel(rows, workers=2, chunk_size=1))
+    assert pooled == cleaned
+    assert pooled[0]["status"] is pooled[2]["status"]
+
+
+@pytest.mark.analysis
+def test_data_cleaning_parallel_keeps_order_and_falls_back_for_small_inputs(monkeypatch):
+    # Chunks cleaned in worker processes come back in input order; small inputs stay in-process.
+    from app import data_cleaning as clean_mod
+
+    rows = [{"id": index, "note": f"<b>row</b>  {index}"} for index in range(7)]
+    expected = clean_mod.clean_data(rows)
+
+    def no_pool(*_args, **_kwargs):
+        raise AssertionError("small inputs must not start a pool")
+
+    monkeypatch.setattr(clean_mod, "ProcessPoolExecutor", no_pool)
+    assert list(clean_mod.iter_clean_parallel(rows, workers=2)) == expected
+    assert list(clean_mod.iter_clean_parallel(rows, workers=1, chunk_size=2)) == expected
+
+    monkeypatch.undo()
+    monkeypatch.setattr(clean_mod, "PARALLEL_CLEAN_MIN_ROWS", 1)
+    assert list(clean_mod.iter_clean_parallel(rows, workers=2, chunk_size=2)) == expected
+
+
 @pytest.mark.analysis
 def test_scrape_support_helpers_without_network(monkeypatch, tmp_path):
     # Exercise scrape helpers with mocked network/robots to keep test fully offline.
@@ -242,23 +353,20 @@ def test_scrape_support_helpers_without_network(monkeypatch, tmp_path):
         def can_fetch(self, ua, base):
             return True
 
+        def crawl_delay(self, ua):
+            return None
+
     monkeypatch.setattr(scrape_mod.urllib.robotparser, "RobotFileParser", FakeRP)
     allowed = scrape_mod._check_robots_allowed("https://x")
     assert "ALLOWED" in allowed
     assert "ALLOWED" in scrape_mod.check_robots_allowed("https://x")
 
-    class FakeResp:
-        # Context-manager shape mirrors urllib response objects used by the scraper.
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def read(self):
-            return b"<html></html>"
+    class FakeSession:
+        # Session stand-in mirrors the keep-alive fetch API used by the scraper.
+        def fetch_text(self, url):
+            return "<html></html>"
 
-    monkeypatch.setattr(scrape_mod, "urlopen", lambda req: FakeResp())
+    monkeypatch.setattr(scrape_mod, "SESSION", FakeSession())
     assert scrape_mod._fetch_html("https://x") == "<html></html>"
     monkeypatch.setattr(scrape_mod, "_fetch_html", lambda url: "wrapped")
     assert scrape_mod.fetch_html("https://x") == "wrapped"
@@ -283,7 +391,7 @@ def test_scrape_support_helpers_without_network(monkeypatch, tmp_path):
 
     # Empty markup should parse to an empty result set.
     assert scrape_mod._parse_page("<html></html>") == []
-    monkeypatch.setattr(scrape_mod, "_parse_page", lambda text: [{"wrapped": text}])
+    monkeypatch.setattr(scrape_mod, "_parse_page", lambda text, backend=None: [{"wrapped": text}])
     assert scrape_mod.parse_page("wrapped-html") == [{"wrapped": "wrapped-html"}]
 
     # Stub network/parser pieces to test scrape_data pagination behavior only.
@@ -329,6 +437,9 @@ def test_scrape_support_disallowed_and_rejected_branches(monkeypatch):
         def can_fetch(self, ua, base):
             return False
 
+        def crawl_delay(self, ua):
+            return None
+
     monkeypatch.setattr(scrape_mod.urllib.robotparser, "RobotFileParser", FakeRP)
     disallowed = scrape_mod._check_robots_allowed("https://x")
     assert "DISALLOWED" in disallowed
@@ -361,10 +472,11 @@ def test_pipeline_run_main(monkeypatch):
 
     monkeypatch.setattr(run_mod.scrape_support, "check_robots_allowed", lambda base: "ok")
     # Patch I/O-heavy routines so main() runs as a pure unit test.
-    monkeypatch.setattr(run_mod.scrape_support, "scrape_data", lambda pages: [{"a": 1}])
-    monkeypatch.setattr(run_mod.scrape_support, "save_data", lambda data, filename: None)
-    monkeypatch.setattr(run_mod.data_cleaning, "load_data", lambda filename: [{"a": 1}])
-    monkeypatch.setattr(run_mod.data_cleaning, "clean_data", lambda data: data)
+    monkeypatch.setattr(
+        run_mod.scrape_support, "backfill_data", lambda pages, filename, workers=1, stats=None: 1
+    )
+    monkeypatch.setattr(run_mod.data_cleaning, "load_ndjson", lambda filename: [{"a": 1}])
+    monkeypatch.setattr(run_mod.data_cleaning, "iter_clean_parallel", lambda data, **_kw: iter(data))
     monkeypatch.setattr(run_mod.data_cleaning, "save_data", lambda data, filename: None)
 
     run_mod.main()
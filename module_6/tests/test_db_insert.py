@@ -7,6 +7,7 @@ import pytest
 
 import app.blueprints.dashboard as dashboard
 from app.flask_app import create_app
+import applicant_insert
 import load_data
 from load_data import create_applicants_table
 
@@ -29,6 +30,14 @@ REQUIRED_FIELDS = [
 ]
 
 
+class _LoadCursor:
+    def __init__(self, row):
+        self.row = row
+
+    def fetchone(self):
+        return self.row
+
+
 class _LoadConn:
     # Lightweight connection double for load_data unit tests.
     def __init__(self, fail_execute=False):
@@ -41,6 +50,8 @@ class _LoadConn:
         if self.fail_execute:
             raise RuntimeError("execute failed")
         self.executed.append((sql, params))
+        # The unique URL index already exists, so no migration runs.
+        return _LoadCursor((True,) if "to_regclass(" in sql else None)
 
     def commit(self):
         self.commit_count += 1
@@ -174,6 +185,138 @@ def test_idempotency_duplicate_pull_does_not_duplicate_rows(
     assert total_rows == 1
 
 
+@pytest.mark.db
+def test_repeat_pull_skips_pages_with_unchanged_fingerprints(
+    mock_create_connection,
+    mock_db_url,
+    mock_reset_applicants_table,
+    tmp_path,
+):
+    # A second pull over an identical table body skips parse, clean, and insert work.
+    from app import scrape_support
+
+    mock_reset_applicants_table()
+    page_one = """
+    <div class="ad">rotating ad {ad}</div>
+    <table><tbody>
+      <tr>
+        <td>MIT</td><td><span>Physics</span><span>PhD</span></td>
+        <td>February 10, 2026</td><td>Accepted on February 1</td>
+        <td><a href="/result/4242">r</a></td>
+      </tr>
+    </tbody></table>
+    """
+    ads = iter(range(100))
+    parsed_pages = []
+
+    def parse_page(html):
+        parsed_pages.append(html)
+        return scrape_support.parse_page(html)
+
+    fake_scraper = SimpleNamespace(
+        BASE_URL="https://fake.local/survey",
+        fetch_html=lambda url: page_one.format(ad=next(ads)) if url.endswith("=1") else "",
+        parse_page=parse_page,
+        load_fingerprints=lambda db_state: scrape_support.PageFingerprints(
+            str(tmp_path / "prints.json"), db_state
+        ),
+    )
+    fake_clean = SimpleNamespace(clean_data=lambda rows: rows)
+    connection_factory = lambda: dashboard.create_connection(database_url=mock_db_url)
+
+    summaries = [
+        dashboard.pull_gradcafe_data(
+            scraper_module=fake_scraper,
+            clean_module=fake_clean,
+            connection_factory=connection_factory,
+        )
+        for _ in range(2)
+    ]
+
+    assert [summary["pages_unchanged"] for summary in summaries] == [0, 1]
+    assert [summary["inserted"] for summary in summaries] == [1, 0]
+    assert summaries[1]["processed"] == 0
+    # The unchanged page reads as empty on the second pull, so its rows are parsed once.
+    assert sum("/result/4242" in html for html in parsed_pages) == 1
+
+    # Once the table is emptied the saved hashes no longer describe it.
+    mock_reset_applicants_table()
+    summary = dashboard.pull_gradcafe_data(
+        scraper_module=fake_scraper,
+        clean_module=fake_clean,
+        connection_factory=connection_factory,
+    )
+    assert (summary["pages_unchanged"], summary["inserted"]) == (0, 1)
+
+
+@pytest.mark.db
+def test_pull_keeps_old_fingerprints_when_an_insert_fails(monkeypatch, tmp_path):
+    # Rows that failed to insert must be re-scraped, not skipped as unchanged.
+    from app import scrape_support
+    from applicant_insert import BatchInsertResult
+
+    class _Conn:
+        def execute(self, sql, params=None):
+            return SimpleNamespace(fetchone=lambda: (0, None))
+
+        def close(self):
+            return None
+
+    page = "<table><tbody><tr><td>MIT</td><td>P</td><td>D</td><td>S</td></tr></tbody></table>"
+    path = tmp_path / "prints.json"
+    fake_scraper = SimpleNamespace(
+        BASE_URL="https://fake.local/survey",
+        fetch_html=lambda url: page if url.endswith("=1") else "",
+        parse_page=lambda html: [{"url": "https://example.test/1"}] if html else [],
+        load_fingerprints=lambda db_state: scrape_support.PageFingerprints(str(path), db_state),
+    )
+    monkeypatch.setattr(dashboard, "create_applicants_table", lambda conn: None)
+    monkeypatch.setattr(
+        dashboard,
+        "insert_entries_batched",
+        lambda *args, **kwargs: BatchInsertResult(errors=1),
+    )
+
+    summary = dashboard.pull_gradcafe_data(
+        scraper_module=fake_scraper,
+        clean_module=SimpleNamespace(clean_data=lambda rows: rows),
+        connection_factory=_Conn,
+    )
+
+    assert summary["errors"] == 1
+    assert not path.exists()
+
+
+@pytest.mark.db
+def test_applicant_batch_matches_row_values_and_converts_each_distinct_value_once():
+    # Column-wise payloads equal per-row build_insert_values, nulling invalid values.
+    from applicant_batch import ApplicantBatch, convert_column
+    from applicant_insert import build_insert_values
+    from applicant_record import ApplicantRecord
+
+    rows = [
+        {"url": "u1", "date_added": "January 15, 2026", "GPA": "3.8", "GRE_SCORE": "320"},
+        ApplicantRecord(url="u2", date_added="Jan 15 2026", gpa="n/a", gre="320", gre_aw=""),
+        {"url": "u3", "date_added": "January 15, 2026", "GPA": "3.8", "llm-generated-program": "CS"},
+    ]
+    batch = ApplicantBatch.from_rows(rows)
+
+    payload = batch.insert_rows(load_data.parse_date, load_data.parse_float)
+    assert len(batch) == 3
+    assert payload == [
+        build_insert_values(row, load_data.parse_date, load_data.parse_float) for row in rows
+    ]
+    assert [row[2] for row in payload] == ["2026-01-15", None, "2026-01-15"]
+    assert (payload[1][7], payload[1][8], payload[2][12]) == (None, 320.0, "CS")
+    assert ApplicantBatch.from_rows([]).insert_rows(load_data.parse_date, float) == []
+
+    calls = []
+    assert convert_column(["3.8", "3.8", None, "3.8"], lambda v: calls.append(v) or v) == [
+        "3.8", "3.8", None, "3.8",
+    ]
+    assert sorted(calls, key=str) == ["3.8", None]
+
+
 @pytest.mark.db
 def test_simple_query_function_returns_expected_schema_keys(
     mock_create_connection,
@@ -239,6 +382,8 @@ def test_create_applicants_table_success_and_error():
     good = _LoadConn()
     load_data.create_applicants_table(good)
     assert good.commit_count == 1
+    # With the unique URL index in place only the catalog lookup runs.
+    assert good.executed[-1][0] == applicant_insert.URL_INDEX_EXISTS_QUERY
 
     bad = _LoadConn(fail_execute=True)
     with pytest.raises(RuntimeError):
@@ -246,6 +391,24 @@ def test_create_applicants_table_success_and_error():
     assert bad.rollback_count == 1
 
 
+@pytest.mark.db
+def test_url_index_migration_reports_cleared_and_deleted_rows(mock_db_connection, capsys):
+    # Pre-index tables are deduplicated once and the destructive counts are reported.
+    mock_db_connection.tables["applicants"] = [
+        {"url": url} for url in ["u1", "u2", "u1", "", "u2", "u1", "u3"]
+    ]
+
+    load_data.create_applicants_table(mock_db_connection)
+
+    output = capsys.readouterr().out
+    assert "cleared 1 empty URL(s), deleted 3 duplicate-URL row(s)" in output
+    assert [row["url"] for row in mock_db_connection.tables["applicants"]] == [
+        "u1", "u2", None, "u3"
+    ]
+    assert mock_db_connection.url_index
+    assert applicant_insert.migrate_url_unique_index(mock_db_connection) is None
+
+
 @pytest.mark.db
 def test_create_ingestion_watermarks_table_success_and_error():
     # Ensure watermark table creation commits on success and rolls back on failure.
@@ -283,6 +446,34 @@ def test_parse_helpers_and_detect_encoding(tmp_path):
     assert load_data.detect_file_encoding(str(utf8_file)) == "utf-8"
 
 
+@pytest.mark.db
+def test_parse_date_matches_strptime_and_warns_once_per_bad_value(capsys):
+    # The lookup-table parser agrees with strptime and repeats stay quiet.
+    from datetime import datetime
+
+    import date_parsing
+
+    samples = [
+        "January 15, 2026", "february 29, 2024", "SEPTEMBER  1,  2025", "May 9, 2025",
+        "February 29, 2025", "Sept 1, 2025", "June 31, 2025", "June 0, 2025",
+        "July 4 2025", " July 4, 2025", "July 4, 0000", "Janu 1, 2025",
+    ]
+    for text in samples:
+        try:
+            expected = datetime.strptime(text, "%B %d, %Y").strftime("%Y-%m-%d")
+        except ValueError:
+            expected = None
+        assert date_parsing.parse_month_day_year(text) == expected, text
+    assert date_parsing.parse_month_day_year(None) is None
+
+    capsys.readouterr()
+    suppressed = date_parsing.date_parse_stats()["suppressed_warnings"]
+    assert [load_data.parse_date("Smarch 3, 2026") for _ in range(3)] == [None] * 3
+    assert capsys.readouterr().out.count("Could not parse date 'Smarch 3, 2026'") == 1
+    assert date_parsing.date_parse_stats()["suppressed_warnings"] == suppressed + 2
+    assert date_parsing.date_parse_stats()["hits"] >= 2
+
+
 @pytest.mark.db
 def test_load_data_from_jsonl_success_and_error_paths(tmp_path):
     # Cover JSONL happy path plus malformed JSON, insert failure, and missing-file branches.
@@ -466,6 +657,8 @@ def test_pull_gradcafe_data_stop_url_branch_and_default_module_import(monkeypatc
     assert summary["pages_scraped"] == 1
     # stop_url should truncate one page payload to only unseen leading rows.
     assert summary["processed"] == 1
+    # Scrapers without a fetch cache report zero cache traffic.
+    assert (summary["cache_hits"], summary["cache_misses"]) == (0, 0)
     assert callbacks
 @pytest.mark.db
 def test_pull_gradcafe_data_insert_branches_progress_and_rollbacks(monkeypatch):
@@ -485,7 +678,7 @@ def test_pull_gradcafe_data_insert_branches_progress_and_rollbacks(monkeypatch):
         def execute(self, sql, params=None):
             if "ORDER BY date_added" in sql:
                 return _Cursor(row=None)
-            return _Cursor(rows=[("https://example.test/dup",)])
+            return _Cursor(rows=[])
 
         def close(self):
             return None
@@ -495,14 +688,19 @@ def test_pull_gradcafe_data_insert_branches_progress_and_rollbacks(monkeypatch):
             self.commit_count = 0
             self.rollback_count = 0
             self.inserted = []
+            self.insert_statements = 0
 
         def execute(self, sql, params=None):
-            # Raise once for a sentinel URL to drive rollback/error accounting branch.
+            # A sentinel URL fails its batch (and its own retry) to drive the rollback
+            # and error branches; the stored URL is dropped by ON CONFLICT.
             if "INSERT INTO applicants" in sql:
-                url = params[3]
-                if url == "https://example.test/error":
+                self.insert_statements += 1
+                urls = params[3::14]
+                if "https://example.test/error" in urls:
                     raise RuntimeError("insert fail")
-                self.inserted.append(url)
+                new_urls = [url for url in urls if url != "https://example.test/dup"]
+                self.inserted.extend(new_urls)
+                return _Cursor(rows=[(url,) for url in new_urls])
             return _Cursor()
 
         def commit(self):
@@ -582,6 +780,9 @@ def test_pull_gradcafe_data_insert_branches_progress_and_rollbacks(monkeypatch):
     assert summary["missing_urls"] >= 1
     assert summary["duplicates"] >= 1
     assert summary["errors"] >= 1
+    assert (summary["inserted"], summary["duplicates"], summary["errors"]) == (101, 1, 1)
+    # One statement per 100-row batch, plus row-by-row retries of the failed batch.
+    assert write_conn.insert_statements == 2 + 3
     assert write_conn.rollback_count >= 1
     # At least one batch commit and one final commit are expected.
     assert write_conn.commit_count >= 2
@@ -589,6 +790,44 @@ def test_pull_gradcafe_data_insert_branches_progress_and_rollbacks(monkeypatch):
 
 
 
+@pytest.mark.db
+def test_insert_entries_batched_counts_rows_only_after_commit_succeeds():
+    # A failed batch commit is retried row by row without counting the batch twice.
+    from applicant_insert import insert_entries_batched
+
+    class _Cursor:
+        def __init__(self, rows):
+            self._rows = rows
+
+        def fetchall(self):
+            return self._rows
+
+    class _Conn:
+        def __init__(self):
+            self.commit_attempts = 0
+            self.rollback_count = 0
+
+        def execute(self, sql, params=None):
+            return _Cursor([(url,) for url in params[3::14]])
+
+        def commit(self):
+            self.commit_attempts += 1
+            if self.commit_attempts == 1:
+                raise RuntimeError("commit failed")
+
+        def rollback(self):
+            self.rollback_count += 1
+
+    entries = [{"url": f"https://example.test/{i}"} for i in range(3)]
+    def build_values(entry):
+        return (None,) * 3 + (entry["url"],) + (None,) * 10
+
+    result = insert_entries_batched(_Conn(), entries, build_values)
+
+    assert result.inserted == entries
+    assert (result.duplicates, result.errors) == (0, 0)
+
+
 @pytest.mark.db
 def test_load_data_skips_blank_line_explicitly(tmp_path):
     # Ensure blank lines in JSONL input are skipped without affecting valid inserts.
@@ -0,0 +1,1006 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import http.client
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.error import HTTPError
+
+import pytest
+
+import app.blueprints.dashboard as dashboard
+from app import scrape_support as scrape_mod
+from app import http_session, rate_limit
+from app.http_session import FetchSession, HttpCache
+
+
+def _page_html(page: int, rows: int = 2) -> str:
+    # Build a minimal GradCafe-shaped page whose rows encode their page number.
+    body = []
+    for index in range(rows):
+        body.append(
+            f"""
+      <tr>
+        <td>University {page}</td>
+        <td><span>Program {index}</span><span>Masters</span></td>
+        <td>February 10, 2026</td>
+        <td>Accepted on February 1</td>
+        <td><a href="/result/{page * 100 + index}">r</a></td>
+      </tr>
+      <tr class="tw-border-none"><td>Fall 2026 American GPA: 3.{index}</td></tr>
+            """
+        )
+    return f"<table><tbody>{''.join(body)}</tbody></table>"
+
+
+@pytest.mark.scrape
+def test_concurrent_scrape_matches_serial_order(monkeypatch):
+    # Later pages finish first; the concurrent path must still return page order.
+    def slow_early_pages(url):
+        page = int(url.rsplit("=", 1)[1])
+        time.sleep(0.02 / page)
+        return _page_html(page)
+
+    monkeypatch.setattr(scrape_mod, "_fetch_html", slow_early_pages)
+
+    serial = scrape_mod.scrape_data(pages=6)
+    concurrent = scrape_mod.scrape_data(pages=6, workers=3)
+
+    assert concurrent == serial
+    assert [row["url"][-3:] for row in concurrent][:4] == ["100", "101", "200", "201"]
+
+
+@pytest.mark.scrape
+def test_pipeline_run_reports_pages_per_second(monkeypatch, capsys):
+    # The run summary should include throughput so worker counts can be sized.
+    from app import pipeline_run as run_mod
+
+    calls = {}
+
+    def fake_backfill(pages, filename, workers=1, stats=None):
+        calls["pages"] = pages
+        calls["workers"] = workers
+        stats.fetch_seconds = 3.0
+        stats.max_html_queue_depth = 7
+        return 1
+
+    monkeypatch.setattr(run_mod.scrape_support, "check_robots_allowed", lambda base: "ok")
+    monkeypatch.setattr(run_mod.scrape_support, "SCRAPE_WORKERS", 5)
+    monkeypatch.setattr(run_mod.scrape_support, "backfill_data", fake_backfill)
+    monkeypatch.setattr(run_mod.data_cleaning, "load_ndjson", lambda filename: [{"a": 1}])
+    monkeypatch.setattr(run_mod.data_cleaning, "iter_clean_parallel", lambda data, **_kw: iter(data))
+    monkeypatch.setattr(run_mod.data_cleaning, "save_data", lambda data, filename: None)
+
+    run_mod.main()
+
+    out = capsys.readouterr().out
+    assert calls == {"pages": run_mod.BACKFILL_PAGES, "workers": 5}
+    assert "pages/s, 5 workers" in out
+    assert "Stage seconds: fetch 3.0" in out and "max HTML queue depth 7" in out
+
+
+@pytest.mark.scrape
+def test_backfill_streams_ndjson_and_resumes_after_crash(monkeypatch, tmp_path):
+    # A crash leaves a torn page on disk; the rerun truncates it and continues
+    # after the last checkpointed page without duplicating entries.
+    from app import data_cleaning
+
+    output = tmp_path / "raw.ndjson"
+    fetched = []
+
+    def fetch(url):
+        page = int(url.rsplit("=", 1)[1])
+        fetched.append(page)
+        if page == 3 and crash["armed"]:
+            raise ConnectionError("worker killed")
+        return _page_html(page)
+
+    crash = {"armed": True}
+    monkeypatch.setattr(scrape_mod, "_fetch_html", fetch)
+    monkeypatch.setattr(scrape_mod, "PARSE_WORKERS", 1)
+    with pytest.raises(ConnectionError):
+        scrape_mod.backfill_data(pages=4, filename=str(output))
+    checkpoint = json.loads((tmp_path / "raw.ndjson.checkpoint").read_text(encoding="utf-8"))
+    assert checkpoint == {"last_page": 2, "offset": output.stat().st_size, "entries": 4}
+    with output.open("ab") as torn:
+        torn.write(b'{"program": "half a pa')
+
+    crash["armed"] = False
+    fetched.clear()
+    assert scrape_mod.backfill_data(pages=4, filename=str(output), workers=2) == 8
+    assert fetched == [3, 4]
+
+    rows = data_cleaning.load_ndjson(str(output))
+    assert [row["url"][-3:] for row in rows] == [
+        "100", "101", "200", "201", "300", "301", "400", "401",
+    ]
+    assert rows == scrape_mod.scrape_data(pages=4)
+
+    # A finished backfill is a no-op on rerun.
+    fetched.clear()
+    assert scrape_mod.backfill_data(pages=4, filename=str(output)) == 8
+    assert fetched == []
+
+
+@pytest.mark.scrape
+def test_backfill_restarts_when_checkpoint_is_unusable(monkeypatch, tmp_path):
+    # Corrupt checkpoints, or ones pointing past the end of the file, start over.
+    output = tmp_path / "raw.ndjson"
+    checkpoint = tmp_path / "state.json"
+    monkeypatch.setattr(scrape_mod, "_fetch_html", lambda url: _page_html(1, rows=1))
+    monkeypatch.setattr(scrape_mod, "PARSE_WORKERS", 1)
+
+    checkpoint.write_text("{broken", encoding="utf-8")
+    assert scrape_mod.backfill_data(1, str(output), checkpoint_path=str(checkpoint)) == 1
+
+    output.unlink()
+    assert scrape_mod.backfill_data(1, str(output), checkpoint_path=str(checkpoint)) == 1
+    assert len(output.read_text(encoding="utf-8").splitlines()) == 1
+
+
+@pytest.mark.scrape
+def test_scrape_pages_parses_in_process_pool_in_page_order(monkeypatch):
+    # Parser processes finish out of order, but pages reach the consumer in order
+    # with stage timings and queue depth recorded along the way.
+    monkeypatch.setattr(scrape_mod, "_fetch_html", lambda url: _page_html(int(url[-1]), rows=3))
+    stats = scrape_mod.PipelineStats()
+
+    pages = list(scrape_mod.scrape_pages(range(1, 7), fetch_workers=3, parse_workers=2, stats=stats))
+
+    assert [page for page, _entries in pages] == [1, 2, 3, 4, 5, 6]
+    assert [entries for _page, entries in pages] == [
+        scrape_mod._parse_page(_page_html(page, rows=3)) for page in range(1, 7)
+    ]
+    report = stats.as_dict()
+    assert report["pages"] == 6
+    assert report["fetch_seconds"] >= 0 and report["parse_seconds"] > 0
+    assert 1 <= report["max_html_queue_depth"] <= scrape_mod.HTML_QUEUE_SIZE
+
+
+@pytest.mark.scrape
+def test_scrape_pages_stops_fetchers_when_consumer_stops(monkeypatch):
+    # Abandoning the pipeline early must release fetchers blocked on a full queue.
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        return _page_html(1)
+
+    monkeypatch.setattr(scrape_mod, "_fetch_html", fetch)
+    monkeypatch.setattr(scrape_mod, "HTML_QUEUE_SIZE", 1)
+    pipeline = scrape_mod.scrape_pages(range(1, 1000))
+    assert next(pipeline)[0] == 1
+    time.sleep(0.3)
+    pipeline.close()
+    assert len(fetched) < 10
+    assert threading.active_count() < 20
+
+
+class _SurveyHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 handler so keep-alive connection reuse can be observed.
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        return None
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        page = "<html>café</html>".encode("utf-8")
+        routes = {
+            "/gzip": (200, gzip.compress(page), {"Content-Encoding": "gzip"}),
+            "/deflate": (200, zlib.compress(page), {"Content-Encoding": "deflate"}),
+            "/raw-deflate": (200, _raw_deflate(page), {"Content-Encoding": "deflate"}),
+            "/redirect": (302, b"", {"Location": "/plain?x=1"}),
+            "/loop": (302, b"", {"Location": "/loop"}),
+            "/missing": (404, b"nope", {}),
+            "/close": (200, page, {"Connection": "close"}),
+            "/etag": (200, page, {"ETag": '"v1"'}),
+            "/dated": (200, page, {"Last-Modified": "Tue, 10 Feb 2026 08:00:00 GMT"}),
+            "/busy": (429, b"slow down", {"Retry-After": "2"}),
+        }
+        if self.path == "/stall":
+            # Promise a longer body than is sent before the client's read timeout.
+            self.send_response(200)
+            self.send_header("Content-Length", str(2 * len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+            self.wfile.flush()
+            time.sleep(0.5)
+            self.wfile.write(page)
+            return
+        if self.path == "/busy" and self.server.busy_until <= len(self.server.requests):
+            self._send(200, page)
+            return
+        validators = (
+            self.headers.get("If-None-Match") == '"v1"',
+            self.headers.get("If-Modified-Since") == "Tue, 10 Feb 2026 08:00:00 GMT",
+        )
+        if any(validators):
+            self._send(304)
+            return
+        status, body, headers = routes.get(self.path.split("?")[0], (200, page, {}))
+        self._send(status, body, headers)
+        if headers.get("Connection") == "close":
+            self.close_connection = True
+
+
+def _raw_deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+@pytest.fixture
+def survey_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SurveyHandler)
+    server.connections = 0
+    server.requests = []
+    server.busy_until = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.scrape
+def test_fetch_session_reuses_connection_and_decompresses(survey_server):
+    # Repeated fetches should share one TCP connection and transparently gunzip.
+    server, base = survey_server
+    session = FetchSession(timeouts=(2, 2))
+    try:
+        assert session.fetch_text(f"{base}/gzip") == "<html>café</html>"
+        assert session.fetch_text(f"{base}/deflate") == "<html>café</html>"
+        assert session.fetch_text(f"{base}/raw-deflate") == "<html>café</html>"
+        assert session.fetch_text(f"{base}/redirect") == "<html>café</html>"
+        assert session.get(base).status == 200
+    finally:
+        session.close()
+
+    assert server.connections == 1
+    assert server.requests[0][1]["Accept-Encoding"] == "gzip, deflate"
+    assert server.requests[-2][0] == "/plain?x=1"
+    assert server.requests[-1][0] == "/"
+
+
+@pytest.mark.scrape
+def test_fetch_session_sends_requests_through_configured_proxies(monkeypatch, survey_server):
+    # http_proxy gets absolute-form requests with credentials; https is tunnelled.
+    server, base = survey_server
+    proxy_netloc = base.split("//", 1)[1]
+    monkeypatch.setenv("http_proxy", f"http://scraper:s%40cret@{proxy_netloc}")
+    monkeypatch.setenv("https_proxy", proxy_netloc)
+    monkeypatch.setenv("no_proxy", "direct.invalid")
+    session = FetchSession(timeouts=(2, 2))
+    try:
+        assert session.fetch_text("http://gradcafe.invalid/survey/?page=2") == "<html>café</html>"
+        proxies = http_session.getproxies()
+        tunnel = session._connection(
+            "https", "gradcafe.invalid", http_session._proxy_for(proxies, "https", "gradcafe.invalid")
+        )
+        direct = session._connection(
+            "http",
+            "direct.invalid:8080",
+            http_session._proxy_for(proxies, "http", "direct.invalid:8080"),
+        )
+    finally:
+        session.close()
+
+    path, headers = server.requests[-1]
+    assert path == "http://gradcafe.invalid/survey/?page=2"
+    assert headers["Proxy-Authorization"] == "Basic " + base64.b64encode(b"scraper:s@cret").decode()
+    assert (tunnel.host, tunnel.port) == ("127.0.0.1", server.server_address[1])
+    assert tunnel._tunnel_host == "gradcafe.invalid"
+    assert (direct.host, direct.port) == ("direct.invalid", 8080)
+
+
+@pytest.mark.scrape
+def test_fetch_session_errors_and_server_closed_connections(survey_server):
+    # Cover HTTP error statuses, redirect loops, and Connection: close handling.
+    server, base = survey_server
+    session = FetchSession()
+    with pytest.raises(HTTPError) as missing:
+        session.fetch_text(f"{base}/missing")
+    assert missing.value.code == 404
+    with pytest.raises(HTTPError, match="Too many redirects"):
+        session.fetch_text(f"{base}/loop")
+
+    session.fetch_text(f"{base}/close")
+    session.fetch_text(f"{base}/plain")
+    session.close()
+    assert server.connections == 2
+
+
+@pytest.mark.scrape
+def test_fetch_session_discards_connection_after_read_timeout(survey_server):
+    # A half-read response must not stay pooled, and a timeout is not retried.
+    server, base = survey_server
+    session = FetchSession(timeouts=(2, 0.1))
+    try:
+        assert session.fetch_text(f"{base}/plain") == "<html>café</html>"
+        with pytest.raises(TimeoutError):
+            session.get(f"{base}/stall")
+        assert session._pool() == {} and session._open == []
+        assert session.fetch_text(f"{base}/plain") == "<html>café</html>"
+    finally:
+        session.close()
+
+    assert [path for path, _ in server.requests] == ["/plain", "/stall", "/plain"]
+    assert server.connections == 2
+
+
+@pytest.mark.scrape
+def test_fetch_session_retries_stale_connection_once(monkeypatch):
+    # A dropped keep-alive connection is retried once, then the error surfaces.
+    class DeadConnection:
+        closed = 0
+
+        def request(self, *args, **kwargs):
+            raise http.client.RemoteDisconnected("idle timeout")
+
+        def close(self):
+            DeadConnection.closed += 1
+
+    class LiveResponse:
+        status = 200
+        will_close = False
+
+        def read(self):
+            return b"ok"
+
+        def getheaders(self):
+            return [("Content-Type", "text/html")]
+
+    class LiveConnection(DeadConnection):
+        sock = SimpleNamespace(settimeout=lambda value: None)
+
+        def request(self, *args, **kwargs):
+            return None
+
+        def getresponse(self):
+            return LiveResponse()
+
+    session = FetchSession()
+    connections = [DeadConnection(), LiveConnection()]
+
+    def next_connection(scheme, netloc, proxy=None):
+        connection = connections.pop(0)
+        session._pool()[(scheme, netloc)] = connection
+        return connection
+
+    monkeypatch.setattr(session, "_connection", next_connection)
+    assert session.fetch_text("http://example.test/survey/?page=1") == "ok"
+
+    connections[:] = [DeadConnection(), DeadConnection()]
+    with pytest.raises(http.client.RemoteDisconnected):
+        session.get("http://example.test/survey/")
+    assert DeadConnection.closed == 3
+
+
+@pytest.mark.scrape
+def test_fetch_session_serves_not_modified_pages_from_cache(survey_server, tmp_path):
+    # Validated pages are re-requested conditionally and a 304 reuses the stored body.
+    server, base = survey_server
+    cache = HttpCache(str(tmp_path / "cache"))
+    session = FetchSession(cache=cache)
+    try:
+        for _ in range(2):
+            assert session.fetch_text(f"{base}/etag") == "<html>café</html>"
+            assert session.fetch_text(f"{base}/dated") == "<html>café</html>"
+        # Pages without validators are downloaded every time and never stored.
+        session.fetch_text(f"{base}/plain")
+        session.fetch_text(f"{base}/plain")
+    finally:
+        session.close()
+
+    assert session.cache_stats() == {"cache_hits": 2, "cache_misses": 4}
+    assert server.requests[2][1]["If-None-Match"] == '"v1"'
+    assert server.requests[3][1]["If-Modified-Since"] == "Tue, 10 Feb 2026 08:00:00 GMT"
+    assert "If-None-Match" not in server.requests[5][1]
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    # A fresh session over the same directory revalidates from the files on disk.
+    warm = FetchSession(cache=HttpCache(str(tmp_path / "cache")))
+    assert warm.fetch_text(f"{base}/etag") == "<html>café</html>"
+    warm.close()
+    assert warm.cache_stats() == {"cache_hits": 1, "cache_misses": 0}
+
+
+@pytest.mark.scrape
+def test_http_cache_tolerates_corrupt_and_unwritable_storage(tmp_path, monkeypatch):
+    # Cache problems must degrade to plain downloads rather than failing a pull.
+    cache = HttpCache(str(tmp_path))
+    url = "https://example.test/survey/?page=1"
+    (tmp_path / Path(cache._path(url)).name).write_text("{not json", encoding="utf-8")
+    assert cache.lookup(url) is None
+    assert HttpCache.conditional_headers(None) == {}
+
+    blocked = tmp_path / "blocked"
+    blocked.write_text("file, not a directory", encoding="utf-8")
+    response = http_session.FetchResponse(url, 200, {"etag": '"v2"'}, b"")
+    assert HttpCache(str(blocked)).store(url, response, "body") is False
+
+    assert FetchSession().cache_stats() == {"cache_hits": 0, "cache_misses": 0}
+    monkeypatch.setattr(http_session, "CACHE_DIR", "")
+    assert http_session.cache_from_env() is None
+    monkeypatch.setattr(http_session, "CACHE_DIR", str(tmp_path))
+    assert http_session.cache_from_env().directory == str(tmp_path)
+
+
+@pytest.mark.scrape
+def test_dashboard_reads_cache_counters_from_scraper(monkeypatch, tmp_path):
+    # Pull summaries diff these counters, so scrapers without a cache report zeros.
+    cache = HttpCache(str(tmp_path))
+    cache.record(hit=True)
+    monkeypatch.setattr(scrape_mod, "SESSION", FetchSession(cache=cache))
+    assert dashboard._cache_stats(scrape_mod) == {"cache_hits": 1, "cache_misses": 0}
+    assert dashboard._cache_stats(SimpleNamespace()) == {"cache_hits": 0, "cache_misses": 0}
+
+
+class _FakeClock:
+    # Deterministic clock whose sleep advances time instead of blocking.
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+@pytest.mark.scrape
+def test_aimd_limiter_paces_grows_and_backs_off():
+    # Tokens space requests 1/rate apart; healthy responses grow rate and window
+    # additively, while 429s halve both and Retry-After pauses the host.
+    clock = _FakeClock()
+    limiter = rate_limit.AimdLimiter(
+        rate_limit.PacingPolicy(max_concurrency=3, max_rate=4, start_rate=2),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    for _ in range(2):
+        limiter.acquire("gradcafe")
+        assert limiter.release("gradcafe", 200) is False
+    assert clock.sleeps == [0.5]
+    assert limiter.snapshot() == {"rate": 3.0, "concurrency": 2}
+
+    for _ in range(6):
+        limiter.acquire("gradcafe")
+        limiter.release("gradcafe", 304)
+    assert limiter.snapshot() == {"rate": 4.0, "concurrency": 3}
+
+    limiter.acquire("gradcafe")
+    assert limiter.release("gradcafe", 429, "3") is True
+    assert limiter.snapshot() == {"rate": 2.0, "concurrency": 1}
+    clock.sleeps.clear()
+    limiter.acquire("gradcafe")
+    assert clock.sleeps == [3.0]
+    assert limiter.release("gradcafe", None) is True
+    assert limiter.snapshot() == {"rate": 1.0, "concurrency": 1}
+
+    # Crawl-delay caps a host below the global ceiling; a missing delay is ignored.
+    limiter.set_crawl_delay("gradcafe", None)
+    limiter.set_crawl_delay("gradcafe", 4)
+    assert limiter.snapshot()["rate"] == 0.25
+
+
+@pytest.mark.scrape
+def test_aimd_limiter_blocks_beyond_concurrency_window():
+    # With a window of one, a second fetcher waits until the first releases.
+    limiter = rate_limit.AimdLimiter(rate_limit.PacingPolicy(max_rate=1000, start_rate=1000))
+    limiter.acquire("gradcafe")
+    entered = threading.Event()
+
+    def second_fetcher():
+        limiter.acquire("gradcafe")
+        entered.set()
+
+    thread = threading.Thread(target=second_fetcher)
+    thread.start()
+    assert not entered.wait(0.05)
+    limiter.release("gradcafe", 200)
+    assert entered.wait(2)
+    thread.join()
+
+
+@pytest.mark.scrape
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    now = lambda: 1_770_710_400.0  # Tue, 10 Feb 2026 08:00:00 GMT
+    assert rate_limit.parse_retry_after(None) == 0.0
+    assert rate_limit.parse_retry_after(" 7 ") == 7.0
+    assert rate_limit.parse_retry_after("Tue, 10 Feb 2026 08:00:30 GMT", now) == 30.0
+    assert rate_limit.parse_retry_after("Tue, 10 Feb 2026 07:00:00 GMT", now) == 0.0
+    assert rate_limit.parse_retry_after("soon", now) == 0.0
+
+
+@pytest.mark.scrape
+def test_fetch_session_retries_through_limiter_on_429(survey_server):
+    # A 429 is retried after the Retry-After pause; persistent 429s surface as errors.
+    server, base = survey_server
+    clock = _FakeClock()
+    limiter = rate_limit.AimdLimiter(
+        rate_limit.PacingPolicy(start_rate=1000), clock=clock, sleep=clock.sleep
+    )
+    session = FetchSession(limiter=limiter)
+    server.busy_until = 2
+    try:
+        assert session.fetch_text(f"{base}/busy") == "<html>café</html>"
+        assert clock.sleeps == [2.0]
+        server.busy_until = 100
+        with pytest.raises(HTTPError) as busy:
+            session.fetch_text(f"{base}/busy")
+    finally:
+        session.close()
+    assert busy.value.code == 429
+    assert len(server.requests) == 2 + http_session.MAX_BACKOFF_RETRIES + 1
+    assert session.limiter_stats()["concurrency"] == 1
+    assert FetchSession().limiter_stats() == {}
+
+
+@pytest.mark.scrape
+def test_fetch_session_releases_limiter_on_transport_error(monkeypatch):
+    # Connection failures count as congestion and still free the limiter slot.
+    limiter = rate_limit.AimdLimiter(rate_limit.PacingPolicy(max_concurrency=2))
+    limiter.concurrency = 2.0
+    session = FetchSession(limiter=limiter)
+
+    def refuse(url, headers=None):
+        raise ConnectionRefusedError("down")
+
+    monkeypatch.setattr(session, "get", refuse)
+    with pytest.raises(ConnectionRefusedError):
+        session.fetch_text("http://example.test/survey/")
+    assert limiter.snapshot()["concurrency"] == 1
+    assert limiter._in_flight == 0
+
+
+@pytest.mark.scrape
+def test_fetch_session_releases_limiter_when_body_fails_to_decompress(survey_server, monkeypatch):
+    # A corrupt compressed body must not leave the single limiter slot taken.
+    _server, base = survey_server
+    limiter = rate_limit.AimdLimiter(rate_limit.PacingPolicy(start_rate=1000))
+    session = FetchSession(limiter=limiter)
+    real_decompress = http_session._decompress
+    calls = []
+
+    def corrupt_once(body, encoding):
+        calls.append(encoding)
+        if len(calls) == 1:
+            raise zlib.error("invalid stored block lengths")
+        return real_decompress(body, encoding)
+
+    monkeypatch.setattr(http_session, "_decompress", corrupt_once)
+    try:
+        with pytest.raises(zlib.error):
+            session.fetch_text(f"{base}/deflate")
+        assert limiter._in_flight == 0
+        assert session.fetch_text(f"{base}/gzip") == "<html>café</html>"
+    finally:
+        session.close()
+    assert limiter._in_flight == 0
+
+
+@pytest.mark.scrape
+def test_robots_crawl_delay_and_limiter_stats_reach_progress(monkeypatch):
+    # Crawl-delay from robots.txt caps the shared limiter; page progress reports it.
+    class DelayedRobots:
+        def set_url(self, url):
+            self.url = url
+
+        def read(self):
+            return None
+
+        def crawl_delay(self, ua):
+            return 2
+
+        def can_fetch(self, ua, base):
+            return True
+
+    limiter = rate_limit.AimdLimiter()
+    monkeypatch.setattr(scrape_mod, "LIMITER", limiter)
+    monkeypatch.setattr(scrape_mod, "SESSION", FetchSession(limiter=limiter))
+    monkeypatch.setattr(scrape_mod.urllib.robotparser, "RobotFileParser", DelayedRobots)
+    assert "ALLOWED" in scrape_mod.check_robots_allowed("https://www.thegradcafe.com/survey/")
+    assert scrape_mod.limiter_stats() == {"rate": 0.5, "concurrency": 1}
+
+    progress = []
+    scraper = SimpleNamespace(
+        BASE_URL="https://fake.local/survey/",
+        fetch_html=lambda url: _page_html(1) if url.endswith("=1") else "",
+        parse_page=scrape_mod.parse_page,
+        limiter_stats=scrape_mod.limiter_stats,
+    )
+    dashboard._scrape_new_rows(scraper, None, lambda **kwargs: progress.append(kwargs), 1)
+    assert progress == [
+        {"progress": {"pages_scraped": 1, "current_page": 1, "rate": 0.5, "concurrency": 1}}
+    ]
+
+
+@pytest.mark.scrape
+def test_fetch_html_uses_shared_session(monkeypatch):
+    # The module-level helper should delegate to the shared keep-alive session.
+    calls = []
+    monkeypatch.setattr(
+        scrape_mod, "SESSION", SimpleNamespace(fetch_text=lambda url: calls.append(url) or "x")
+    )
+    assert scrape_mod.fetch_html("https://example.test/survey/?page=2") == "x"
+    assert calls == ["https://example.test/survey/?page=2"]
+
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+RECORDED_PAGES = sorted(FIXTURE_DIR.glob("gradcafe_survey_page_*.html"))
+
+
+@pytest.mark.scrape
+@pytest.mark.parametrize("page_path", RECORDED_PAGES, ids=lambda path: path.stem)
+@pytest.mark.parametrize("backend", sorted(scrape_mod.PARSER_BACKENDS))
+def test_parser_backends_match_reference_on_recorded_pages(page_path, backend):
+    # Every backend must produce exactly the html.parser records, saved key order included.
+    html = page_path.read_text(encoding="utf-8")
+    reference = scrape_mod._parse_page(html, backend="html.parser")
+    parsed = scrape_mod._parse_page(html, backend=backend)
+
+    assert reference
+    assert parsed == reference
+    assert [list(entry.to_dict()) for entry in parsed] == [
+        list(entry.to_dict()) for entry in reference
+    ]
+
+
+@pytest.mark.scrape
+@pytest.mark.parametrize("backend", sorted(scrape_mod.PARSER_BACKENDS))
+def test_parser_backends_extract_recorded_fields(backend):
+    # Spot-check the recorded page fields that exercise each extraction rule.
+    html = (FIXTURE_DIR / "gradcafe_survey_page_1.html").read_text(encoding="utf-8")
+    entries = scrape_mod.parse_page(html, backend)
+
+    assert [entry["url"][-6:] for entry in entries] == [
+        "935454", "935453", "935448", "935440", "",
+    ]
+    first = entries[0]
+    assert first["program"] == "Computer Science, Stanford University"
+    assert first["comments"] == "Funded offer & visit weekend in April.Very happy!"
+    assert (first["status"], first["decision_date"], first["Degree"]) == ("Accepted", "29 Mar", "PhD")
+    assert (first["GPA"], first["GRE_SCORE"], first["GRE_V"], first["GRE_AW"]) == (
+        "3.89", "325", "160", "4.50",
+    )
+    assert entries[2]["term"] == "Spring 2025"
+    assert entries[2]["comments"] == "No funding  information\n            given."
+    assert entries[3]["comments"] == ""
+
+
+@pytest.mark.scrape
+@pytest.mark.parametrize("backend", sorted(scrape_mod.PARSER_BACKENDS))
+def test_parser_backends_handle_pages_without_rows(backend):
+    for html in ("", "   ", "<html></html>", "<table><tbody></tbody></table>"):
+        assert scrape_mod._parse_page(html, backend=backend) == []
+
+
+_SUMMARY_ROW = (
+    '<tr><td>MIT<script>track()</script><style>.u{}</style></td>'
+    "<td><span>Physics</span><span>PhD</span></td><td>March 1, 2026</td>"
+    '<td>Accepted on 2 Mar</td><td><a href="/result/7">Open</a></td></tr>'
+)
+
+
+@pytest.mark.scrape
+@pytest.mark.parametrize(
+    "html",
+    [
+        # CRLF and lone CR line breaks inside a comment paragraph.
+        "<table><tbody>" + _SUMMARY_ROW
+        + '<tr class="tw-border-none"><td>Fall 2026<p>one\r\ntwo\rthree</p></td></tr>'
+        "</tbody></table>",
+        # Script, style, and comment text never reaches extracted fields.
+        "<table><tbody>" + _SUMMARY_ROW
+        + '<tr class="tw-border-none"><td>GPA 3.9<p>ok<!-- hidden --><script>x=1</script>'
+        "<style>p{}</style></p></td></tr></tbody></table>",
+        # Cells without end tags nest under html.parser, so the row is dropped.
+        "<table><tbody><tr><td>MIT<td><span>Physics</span><td>March 1, 2026"
+        "<td>Accepted</tbody></table>",
+        # A row cut off mid-page, and a page whose <title> never closes.
+        "<table><tbody>" + _SUMMARY_ROW + "<tr><td>Yale</td><td><span>Math",
+        "<title>Results<table><tbody>" + _SUMMARY_ROW + "</tbody></table>",
+        # libxml2 ends the table at a stray <table> and moves an unclosed <b>
+        # out of the row; html.parser keeps both in place.
+        "<table><tbody>" + _SUMMARY_ROW.replace("<td>MIT", "<td><table>MIT")
+        + _SUMMARY_ROW.replace("/7", "/8") + "</tbody></table>",
+        "<table><tbody>" + _SUMMARY_ROW.replace("<tr><td>", "<tr><b><td>")
+        + _SUMMARY_ROW.replace("/7", "/8") + "</tbody></table>",
+        # html.parser closes a self-closed cell; libxml2 opens it.
+        "<table><tbody>" + _SUMMARY_ROW.replace("<td>March", "<td/><td>March")
+        + "</tbody></table>",
+        # A block inside a comment paragraph closes it early under libxml2.
+        "<table><tbody>" + _SUMMARY_ROW
+        + '<tr class="tw-border-none"><td>GPA 3.9<p>ok<div>more</div> text</p></td></tr>'
+        "</tbody></table>",
+    ],
+    ids=[
+        "crlf", "script-style", "unclosed-cells", "truncated", "unclosed-title",
+        "stray-table", "unclosed-b", "self-closed-cell", "block-in-paragraph",
+    ],
+)
+def test_lxml_backend_matches_html_parser_on_irregular_markup(html):
+    # The lxml backend must reproduce html.parser's rows, not libxml2's repairs.
+    reference = scrape_mod._parse_page(html, backend="html.parser")
+    assert scrape_mod._parse_page(html, backend="lxml") == reference
+
+
+@pytest.mark.scrape
+def test_lxml_backend_normalizes_newlines_and_skips_script_text():
+    html = (
+        "<table><tbody>" + _SUMMARY_ROW
+        + '<tr class="tw-border-none"><td>Fall 2026<p>one\r\ntwo<script>x=1</script></p>'
+        "</td></tr></tbody></table>"
+    )
+    (entry,) = scrape_mod._parse_page(html, backend="lxml")
+    assert (entry["program"], entry["comments"]) == ("Physics, MIT", "one\ntwo")
+    malformed = "<table><tbody><tr><td>MIT<td>Physics<td>March 1, 2026<td>Accepted</tbody></table>"
+    assert scrape_mod._parse_page(malformed, backend="lxml") == []
+
+
+@pytest.mark.scrape
+def test_parser_backend_selection_defaults_and_rejects_unknown(monkeypatch):
+    # The module default comes from SCRAPE_PARSER; explicit arguments win.
+    html = (FIXTURE_DIR / "gradcafe_survey_page_2.html").read_text(encoding="utf-8")
+    calls = []
+
+    def recording_backend(text):
+        calls.append(text)
+        return iter(())
+
+    monkeypatch.setitem(scrape_mod.PARSER_BACKENDS, "recording", recording_backend)
+    monkeypatch.setattr(scrape_mod, "PARSER_BACKEND", "recording")
+    assert scrape_mod._parse_page(html) == []
+    assert calls == [html]
+    assert len(scrape_mod._parse_page(html, backend="lxml")) == 3
+
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        scrape_mod._parse_page(html, backend="regex")
+
+
+@pytest.mark.scrape
+@pytest.mark.parametrize("chunk", [1, 7, 4096])
+def test_lxml_pull_parser_is_stable_across_feed_chunk_sizes(monkeypatch, chunk):
+    # Chunk boundaries must not change what the incremental lxml backend extracts.
+    monkeypatch.setattr(scrape_mod, "LXML_FEED_CHUNK", chunk)
+    for page_path in RECORDED_PAGES:
+        html = page_path.read_text(encoding="utf-8")
+        assert scrape_mod._parse_page(html, "lxml") == scrape_mod._parse_page(html, "html.parser")
+
+
+@pytest.mark.scrape
+def test_iter_page_entries_stops_parsing_when_consumer_stops(monkeypatch):
+    # Breaking out after the first entry should leave most table rows unparsed.
+    html = (FIXTURE_DIR / "gradcafe_survey_page_1.html").read_text(encoding="utf-8")
+    monkeypatch.setattr(scrape_mod, "LXML_FEED_CHUNK", 256)
+    seen_rows = []
+    original_row = scrape_mod._lxml_row
+    monkeypatch.setattr(
+        scrape_mod, "_lxml_row", lambda row: seen_rows.append(row) or original_row(row)
+    )
+
+    entries = scrape_mod.iter_page_entries(html, backend="lxml")
+    first = next(entries)
+    entries.close()
+
+    assert first["url"].endswith("/result/935454")
+    # The first entry is complete once the next summary row starts.
+    assert len(seen_rows) == 4
+
+
+@pytest.mark.scrape
+def test_scrape_new_rows_stops_at_watermark_with_lazy_entries(monkeypatch):
+    # The dashboard pull should stop mid-page at the stored newest URL.
+    pages = {
+        1: (FIXTURE_DIR / "gradcafe_survey_page_1.html").read_text(encoding="utf-8"),
+        2: (FIXTURE_DIR / "gradcafe_survey_page_2.html").read_text(encoding="utf-8"),
+    }
+    consumed = []
+    original_iter = scrape_mod.iter_page_entries
+
+    def counting_iter(html):
+        for entry in original_iter(html):
+            consumed.append(entry["url"])
+            yield entry
+
+    scraper = SimpleNamespace(
+        BASE_URL="https://fake.local/survey/",
+        fetch_html=lambda url: pages.get(int(url.rsplit("=", 1)[1]), ""),
+        parse_page=scrape_mod.parse_page,
+        iter_page_entries=counting_iter,
+    )
+    progress = []
+
+    rows, last_page, pages_scraped = dashboard._scrape_new_rows(
+        scraper,
+        "https://www.thegradcafe.com/result/935448",
+        lambda **kwargs: progress.append(kwargs),
+        1,
+    )
+
+    assert [row["url"][-6:] for row in rows] == ["935454", "935453"]
+    assert (last_page, pages_scraped) == (1, 1)
+    # The watermark probe and the collection pass each stop at the watermark row.
+    assert consumed == [
+        f"https://www.thegradcafe.com/result/{result}"
+        for result in (935454, 935453, 935448) * 2
+    ]
+    assert progress == [{"progress": {"pages_scraped": 1, "current_page": 1}}]
+
+
+def _newest_first_page(page: int, last_page: int) -> str:
+    # Three rows per page whose result ids fall as page numbers rise, like the live survey.
+    if page > last_page:
+        return "<table><tbody></tbody></table>"
+    rows = "".join(
+        f"""
+      <tr>
+        <td>University</td><td><span>Program</span></td><td>February 10, 2026</td>
+        <td>Accepted on February 1</td>
+        <td><a href="/result/{10_000 - page * 10 - index}">r</a></td>
+      </tr>"""
+        for index in range(3)
+    )
+    return f"<table><tbody>{rows}</tbody></table>"
+
+
+@pytest.mark.scrape
+def test_locate_watermark_page_gallops_then_bisects():
+    # Probes double until a page reaches the watermark id, then binary-search the gap.
+    probes = []
+
+    def fetch_page(page):
+        probes.append(page)
+        return _newest_first_page(page, last_page=40)
+
+    page, probed = scrape_mod.locate_watermark_page(
+        fetch_page, scrape_mod.iter_page_entries, "https://www.thegradcafe.com/result/9769"
+    )
+    assert page == 23
+    assert probes == [1, 2, 4, 8, 16, 32, 24, 20, 22, 23]
+    assert sorted(probed) == sorted(probes)
+
+    # A watermark older than every page lands on the first empty page past the end.
+    probes.clear()
+    assert scrape_mod.locate_watermark_page(
+        lambda page: _newest_first_page(page, last_page=5),
+        scrape_mod.iter_page_entries,
+        "https://www.thegradcafe.com/result/1",
+    )[0] == 6
+    assert scrape_mod.locate_watermark_page(fetch_page, scrape_mod.iter_page_entries, "x") == (
+        None, {},
+    )
+    assert probes == []
+    assert scrape_mod.result_id(None) is None
+
+
+@pytest.mark.scrape
+def test_scrape_new_rows_fetches_pages_before_distant_watermark_in_parallel():
+    # An old watermark deep in the survey is located by search, and every page
+    # before it is fetched concurrently but still returned in page order.
+    fetched = []
+    lock = threading.Lock()
+
+    def fetch_html(url):
+        page = int(url.rsplit("=", 1)[1])
+        with lock:
+            fetched.append(page)
+        return _newest_first_page(page, last_page=40)
+
+    scraper = SimpleNamespace(
+        BASE_URL="https://fake.local/survey/",
+        fetch_html=fetch_html,
+        parse_page=scrape_mod.parse_page,
+        iter_page_entries=scrape_mod.iter_page_entries,
+        SCRAPE_WORKERS=4,
+    )
+    progress = []
+    rows, last_page, pages_scraped = dashboard._scrape_new_rows(
+        scraper,
+        "https://www.thegradcafe.com/result/9769",
+        lambda **kwargs: progress.append(kwargs),
+        1,
+    )
+
+    expected = [10_000 - page * 10 - index for page in range(1, 23) for index in range(3)]
+    assert [scrape_mod.result_id(row["url"]) for row in rows] == expected + [9770]
+    assert (last_page, pages_scraped) == (23, 23)
+    assert [item["progress"]["current_page"] for item in progress] == list(range(1, 24))
+    # Probed pages are reused, so each page up to the watermark is fetched once.
+    assert sorted(set(fetched)) == sorted(set(range(1, 24)) | {24, 32})
+    assert len(fetched) == len(set(fetched))
+
+
+@pytest.mark.scrape
+def test_page_fingerprint_ignores_chrome_and_skips_rowless_pages(tmp_path):
+    # Only the table body is hashed, so rotating ads do not defeat the skip.
+    body = "<tbody><tr><td>row</td></tr></tbody>"
+    assert scrape_mod.page_fingerprint(f"<div>ad 1</div><table>{body}</table>") == (
+        scrape_mod.page_fingerprint(f"<div>ad 2</div><TABLE>{body.upper()}</TABLE>".lower())
+    )
+    assert scrape_mod.page_fingerprint("<table><tbody></tbody></table>") is None
+    assert scrape_mod.page_fingerprint("") is None
+
+    path = tmp_path / "prints.json"
+    store = scrape_mod.PageFingerprints(str(path))
+    assert store.unchanged("page-1", body) is False
+    assert store.unchanged("page-2", "") is False
+    # Nothing counts as seen until the pull commits its fingerprints.
+    assert scrape_mod.PageFingerprints(str(path)).unchanged("page-1", body) is False
+    store.save()
+
+    reloaded = scrape_mod.PageFingerprints(str(path))
+    assert reloaded.unchanged("page-1", body) is True
+    assert reloaded.unchanged("page-1", body.replace("row", "new row")) is False
+    assert reloaded.skipped == 1
+
+    # Hashes saved against one database state are ignored under another.
+    store.save("3:7")
+    assert scrape_mod.PageFingerprints(str(path), "3:7").known == store.known
+    assert scrape_mod.PageFingerprints(str(path), "0:None").known == {}
+    assert scrape_mod.PageFingerprints(str(path)).known == {}
+
+    path.write_text("{corrupt", encoding="utf-8")
+    assert scrape_mod.PageFingerprints(str(path)).known == {}
+    disabled = scrape_mod.PageFingerprints("")
+    assert disabled.unchanged("page-1", body) is False
+    disabled.save()
+    assert disabled.known == {"page-1": scrape_mod.page_fingerprint(body)}
+    assert scrape_mod.load_fingerprints().path == scrape_mod.FINGERPRINT_PATH
+
+
+@pytest.mark.scrape
+@pytest.mark.parametrize("recorded", [False, True], ids=["synthetic", "recorded"])
+def test_scrapers_against_offline_standin_with_injected_errors(monkeypatch, recorded):
+    # The stand-in serves parseable pages with 503s mixed in; the limiter retries them
+    # and both the backfill and the watermark pull return the expected rows.
+    from standin_server import StandInServer, StandInSurvey, SurveyOptions
+
+    survey = StandInSurvey(
+        SurveyOptions(pages=12, rows_per_page=4, recorded=recorded, error_rate=0.3)
+    )
+    limiter = rate_limit.AimdLimiter(
+        rate_limit.PacingPolicy(max_concurrency=3, max_rate=1000, start_rate=1000)
+    )
+    with StandInServer(survey) as server:
+        session = FetchSession(limiter=limiter)
+        monkeypatch.setattr(scrape_mod, "SESSION", session)
+        monkeypatch.setattr(scrape_mod, "BASE_URL", server.base_url)
+        try:
+            backfill = scrape_mod.scrape_data(pages=13, workers=3)
+            rows, last_page, _pages = dashboard._scrape_new_rows(
+                scrape_mod, survey.result_url(9, index=1), None, 1
+            )
+            assert session.fetch_text(server.base_url.replace("survey/", "robots.txt"))
+            with pytest.raises(HTTPError):
+                session.fetch_text(server.base_url.replace("survey/", "missing"))
+        finally:
+            session.close()
+
+    expected = [scrape_mod._parse_page(survey.render(page)) for page in range(1, 13)]
+    assert backfill == [entry for page in expected for entry in page]
+    assert survey.render(13) == survey.render(0)
+    assert survey.errors > 0
+    assert last_page == 9
+    assert rows[-1]["url"] == survey.result_url(9)